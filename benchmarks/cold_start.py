@@ -0,0 +1,121 @@
+# 💸 FinAura cold-start benchmark – import time and first full render against a fixed budget
+#
+#   python benchmarks/cold_start.py                 # 3 cold runs, fail if over budget
+#   python benchmarks/cold_start.py --repeat 5 --output cold_start.jsonl
+#
+# Every sample runs in a fresh interpreter (that is what an autoscaled replica pays) against
+# a throwaway copy of finsphere.db, so the real ledger is never touched.
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "streamlit_app.py")
+
+# Seconds; medians above these fail the run
+DEFAULT_BUDGET = {
+    "import_seconds": 2.0,
+    "first_render_seconds": 5.0,
+}
+
+# Modules that should only be loaded once a table or chart is rendered
+HEAVY_MODULES = ["pandas", "plotly", "plotly.express"]
+
+# Runs inside the fresh interpreter; prints one JSON line
+SAMPLE_SCRIPT = r"""
+import json, sys, time
+started = time.perf_counter()
+import streamlit
+preloaded = {name for name in HEAVY if name in sys.modules}  # pulled in by Streamlit itself
+import numpy
+from finaura import formatting, importer, ledger, memo, queries, rates, storage
+import_seconds = time.perf_counter() - started
+heavy_after_import = [name for name in HEAVY if name in sys.modules and name not in preloaded]
+
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file(APP, default_timeout=300)
+started = time.perf_counter()
+app.run()
+first_render_seconds = time.perf_counter() - started
+print(json.dumps({
+    "import_seconds": import_seconds,
+    "first_render_seconds": first_render_seconds,
+    "heavy_after_import": heavy_after_import,
+    "heavy_after_render": [name for name in HEAVY if name in sys.modules and name not in preloaded],
+    "exceptions": [str(e.value) for e in app.exception],
+}))
+"""
+
+
+def run_sample(db_path: str) -> dict:
+    """One cold start in a new interpreter"""
+    env = dict(os.environ, FINAURA_DB_PATH=db_path, PYTHONPATH=REPO_ROOT)
+    code = f"HEAVY = {HEAVY_MODULES!r}\nAPP = {APP_PATH!r}\n" + SAMPLE_SCRIPT
+    completed = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="FinAura cold-start benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="cold starts to sample (median is reported)")
+    parser.add_argument("--budget-import", type=float, default=DEFAULT_BUDGET["import_seconds"])
+    parser.add_argument("--budget-first-render", type=float, default=DEFAULT_BUDGET["first_render_seconds"])
+    parser.add_argument("--output", help="append the result as one JSON line to this file")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="finaura-cold-start-")
+    try:
+        samples = []
+        for _ in range(args.repeat):
+            db_path = os.path.join(workdir, f"ledger-{len(samples)}.db")
+            source_db = os.path.join(REPO_ROOT, "finsphere.db")
+            if os.path.exists(source_db):
+                shutil.copy(source_db, db_path)
+            samples.append(run_sample(db_path))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    result = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "repeat": args.repeat,
+        "import_seconds": statistics.median(s["import_seconds"] for s in samples),
+        "first_render_seconds": statistics.median(s["first_render_seconds"] for s in samples),
+        "heavy_after_import": samples[-1]["heavy_after_import"],
+        "heavy_after_render": samples[-1]["heavy_after_render"],
+        "budget": {"import_seconds": args.budget_import, "first_render_seconds": args.budget_first_render},
+    }
+    failures = []
+    if result["import_seconds"] > args.budget_import:
+        failures.append(f"import {result['import_seconds']:.2f}s > {args.budget_import:.2f}s")
+    if result["first_render_seconds"] > args.budget_first_render:
+        failures.append(f"first render {result['first_render_seconds']:.2f}s > {args.budget_first_render:.2f}s")
+    if result["heavy_after_import"]:
+        failures.append(f"heavy modules loaded at import: {', '.join(result['heavy_after_import'])}")
+    exceptions = [e for s in samples for e in s["exceptions"]]
+    if exceptions:
+        failures.append(f"app raised: {exceptions[0]}")
+    result["passed"] = not failures
+
+    print(f"import:       {result['import_seconds']:.3f}s (budget {args.budget_import:.2f}s)")
+    print(f"first render: {result['first_render_seconds']:.3f}s (budget {args.budget_first_render:.2f}s)")
+    print(f"loaded after render: {', '.join(result['heavy_after_render']) or 'none'}")
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(result) + "\n")
+    for failure in failures:
+        print(f"OVER BUDGET: {failure}")
+    return 0 if result["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
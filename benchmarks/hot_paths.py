@@ -0,0 +1,218 @@
+# 💸 FinAura hot-path benchmark – dashboard, transaction table, formatting, emotions and planner math
+#
+#   python benchmarks/hot_paths.py                               # 1k, 10k, 100k, 1M rows
+#   python benchmarks/hot_paths.py --sizes 1000 10000000 --repeat 3
+#   python benchmarks/hot_paths.py --output hot_paths.jsonl --baseline hot_paths.jsonl
+#
+# Runs headless: no Streamlit server or AppTest. Each benchmark is named after the app
+# helper it times and calls the same finaura function the app does (dashboard math and
+# the transaction table come from finaura.dashboard, with a RateProvider over a throwaway
+# database seeded from data/exchange_rates.csv) on a seeded synthetic ledger, so it needs
+# no session state. Time is the best of --repeat runs; peak memory comes from one
+# extra run under tracemalloc (NumPy reports its buffers there too). With --baseline the
+# run fails if any benchmark is more than --tolerance slower than the last recorded run.
+
+import argparse
+import dataclasses
+import json
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import synthetic_ledger  # noqa: E402
+
+from finaura.dashboard import dashboard_metrics, spend_windows, transaction_table  # noqa: E402
+from finaura.debts import Debt, simulate_payoffs  # noqa: E402
+from finaura.emotions import EmotionClassifier, emotion_summary  # noqa: E402
+from finaura.formatting import format_amounts, format_money  # noqa: E402
+from finaura.goals import GoalPortfolio, SavingsGoal  # noqa: E402
+from finaura.ledger import ColumnarLedger  # noqa: E402
+from finaura.projection import simulate_wealth  # noqa: E402
+from finaura.rates import RateProvider  # noqa: E402
+from finaura.storage import LedgerStore  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.25  # fail when slower than baseline * (1 + tolerance)
+
+# Rows on one page of the transaction log
+PAGE_SIZE = 50
+# Scalar format_currency calls per sample (one dashboard + planner render is a few hundred)
+SCALAR_FORMATS = 10_000
+# Above this, building a table of the whole ledger is skipped (the app only renders pages)
+FULL_TABLE_LIMIT = 1_000_000
+# Display currency: not USD, so the dashboard and table take the per-day historical-rate path
+DISPLAY_CURRENCY = 'EUR'
+
+
+def planner_math():
+    """One financial-planner render: Monte Carlo projection, debt strategies and goal allocation"""
+    simulate_wealth(600.0, 70, 20, 10, years=30)
+    debts = [
+        Debt("Credit card", 4_500, 24.0, 90), Debt("Store card", 900, 28.0, 35),
+        Debt("Car loan", 12_000, 7.5, 260), Debt("Student loan", 28_000, 5.5, 300),
+    ]
+    simulate_payoffs(debts, 1_200.0)
+    portfolio = GoalPortfolio(monthly_budget=900.0)
+    today = date.today()
+    for index in range(50):
+        portfolio.add(SavingsGoal(f"goal {index}", 500.0 + 100 * index, today + timedelta(days=30 * (index % 36 + 1)),
+                                  priority=index % 3))
+    portfolio.allocate(today)
+    portfolio.update(next(iter(portfolio.goals)), saved=250.0)
+
+
+def build_benchmarks(ledger: ColumnarLedger, rates: RateProvider) -> Dict[str, Callable[[], object]]:
+    """name -> zero-argument callable; state each one needs is prepared here, outside the timing"""
+    size = len(ledger)
+    today = datetime.now().date()
+    amounts = ledger.usd_amounts()
+    scalar_values = amounts[:SCALAR_FORMATS].tolist() or [0.0]
+    page = ColumnarLedger.from_transactions(ledger[-PAGE_SIZE:])
+    warm_classifier = EmotionClassifier()
+    warm_classifier.classify(ledger)
+
+    latest = ledger[size - 1]
+    edited = dataclasses.replace(latest, amount=latest.amount + 1.0)
+
+    def dashboard_after_edit():
+        # Changing a row invalidates the bucket columns, like the rerun after saving a transaction
+        ledger.replace(size - 1, edited)
+        metrics = dashboard_metrics(spend_windows(ledger, today, rates, DISPLAY_CURRENCY))
+        ledger.replace(size - 1, latest)
+        return metrics
+
+    benchmarks = {
+        'calculate_dashboard_metrics': dashboard_after_edit,
+        'create_transaction_dataframe (page)': lambda: transaction_table(page, rates, DISPLAY_CURRENCY),
+        'format_currency (scalar)': lambda: [format_money(value, 'EUR', 0.92) for value in scalar_values],
+        'format_currency_column': lambda: format_amounts(amounts, 'EUR', 0.92),
+        'emotion classification (cold)': lambda: emotion_summary(EmotionClassifier().classify(ledger), amounts),
+        'emotion classification (warm)': lambda: emotion_summary(warm_classifier.classify(ledger), amounts),
+    }
+    if size <= FULL_TABLE_LIMIT:
+        benchmarks['create_transaction_dataframe (full)'] = lambda: transaction_table(ledger, rates, DISPLAY_CURRENCY)
+    return benchmarks
+
+
+# Rows each benchmark processes per call, for throughput
+def rows_for(name: str, size: int) -> int:
+    if name.endswith('(page)'):
+        return min(PAGE_SIZE, size)
+    if name == 'format_currency (scalar)':
+        return min(SCALAR_FORMATS, size)
+    return size
+
+
+def measure(func: Callable[[], object], repeat: int) -> Dict[str, float]:
+    func()  # warm-up (lazy imports, lru caches)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': min(timings), 'median_seconds': float(np.median(timings)), 'peak_mb': peak / 1e6}
+
+
+def run(sizes: List[int], repeat: int, seed: int) -> List[Dict]:
+    workdir = tempfile.mkdtemp(prefix="finaura-hot-paths-")
+    store = LedgerStore(os.path.join(workdir, "rates.db"))
+    try:
+        return run_with_rates(sizes, repeat, seed, RateProvider(store))
+    finally:
+        store.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def run_with_rates(sizes: List[int], repeat: int, seed: int, rates: RateProvider) -> List[Dict]:
+    results = []
+    for size in sizes:
+        started = time.perf_counter()
+        ledger = synthetic_ledger(size, seed=seed)
+        print(f"\n{size:,} rows (generated in {time.perf_counter() - started:.1f}s, "
+              f"ledger ~{ledger.nbytes / 1e6:.1f} MB in memory)")
+        for name, func in build_benchmarks(ledger, rates).items():
+            result = dict(benchmark=name, rows=size, **measure(func, repeat))
+            result['rows_per_second'] = rows_for(name, size) / result['seconds'] if result['seconds'] else float('inf')
+            results.append(result)
+            print(f"  {name:<40} {result['seconds'] * 1000:>10.2f} ms  "
+                  f"{result['rows_per_second']:>14,.0f} rows/s  {result['peak_mb']:>9.1f} MB peak")
+        del ledger
+
+    result = dict(benchmark='planner math', rows=0, **measure(planner_math, repeat))
+    result['rows_per_second'] = 0.0
+    results.append(result)
+    print(f"\n  {'planner math':<40} {result['seconds'] * 1000:>10.2f} ms  {'':>14}        "
+          f"{result['peak_mb']:>9.1f} MB peak")
+    return results
+
+
+def load_baseline(path: str) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as handle:
+        lines = [line for line in handle if line.strip()]
+    return json.loads(lines[-1]) if lines else None
+
+
+def regressions(results: List[Dict], baseline: Dict, tolerance: float) -> List[str]:
+    previous = {(row['benchmark'], row['rows']): row['seconds'] for row in baseline.get('results', [])}
+    failures = []
+    for row in results:
+        before = previous.get((row['benchmark'], row['rows']))
+        if before and row['seconds'] > before * (1 + tolerance):
+            failures.append(f"{row['benchmark']} @ {row['rows']:,} rows: "
+                            f"{row['seconds'] * 1000:.2f} ms vs {before * 1000:.2f} ms baseline")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="FinAura hot-path benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="ledger sizes to benchmark")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per benchmark (best is kept)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="append the result as one JSON line to this file")
+    parser.add_argument("--baseline", help="JSONL file whose last line is the run to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    results = run(args.sizes, args.repeat, args.seed)
+    failures = regressions(results, baseline, args.tolerance) if baseline else []
+    record = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "results": results,
+        "passed": not failures,
+    }
+    print(f"\nprocess peak RSS: {record['max_rss_mb']:.0f} MB")
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 0 if record["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+# 💸 FinAura statement-import benchmark – a bank export into SQLite and back into the session ledger
+#
+#   python benchmarks/statement_import.py                        # 1M-row CSV, fail if over budget
+#   python benchmarks/statement_import.py --rows 100000 --existing 1000000
+#   python benchmarks/statement_import.py --repeat 3 --output statement_import.jsonl
+#
+# Each sample imports a seeded synthetic CSV (dates ascending, like a real export) into a
+# throwaway database that already holds --existing rows for the same account, then does
+# what the app does after an import: read the statement's hot-window rows back, sum the
+# older ones in SQLite, and merge both into the resident ledger. A second import of the
+# same file measures the replace path. Before timing, a small statement with UTC-offset
+# dates checks that every stored date comes back naive, like the rest of the ledger.
+
+import argparse
+import io
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import synthetic_columns  # noqa: E402
+
+from finaura.emotions import EmotionClassifier  # noqa: E402
+from finaura.importer import import_statement  # noqa: E402
+from finaura.ledger import CATEGORIES, ColumnarLedger  # noqa: E402
+from finaura.memory import SessionMemoryBudget  # noqa: E402
+from finaura.storage import LedgerStore  # noqa: E402
+
+ACCOUNT = "benchmark"
+DEFAULT_ROWS = 1_000_000
+DEFAULT_EXISTING = 100_000
+DEFAULT_BUDGET_SECONDS = 45.0  # median fresh import + read-back of DEFAULT_ROWS rows on one slow core
+
+
+def synthetic_csv(rows: int, seed: int) -> bytes:
+    """A bank-style export: spending as negative amounts, oldest first"""
+    columns = synthetic_columns(rows, seed=seed)
+    dates = columns['dates_us'].astype("datetime64[us]").astype("datetime64[D]").astype(str).tolist()
+    categories = [CATEGORIES[code].name for code in columns['category_codes'].tolist()]
+    lines = ["Date,Description,Merchant,Category,Amount,Currency"]
+    lines.extend(
+        f"{day},{description},{merchant},{category},-{amount:.2f},{currency}"
+        for day, description, merchant, category, amount, currency in zip(
+            dates, columns['descriptions'], columns['merchants'], categories,
+            columns['amounts'].tolist(), columns['currencies'],
+        )
+    )
+    return "\n".join(lines).encode("utf-8")
+
+
+def seed_store(store: LedgerStore, rows: int, seed: int):
+    """--existing rows of history, written the way the importer writes them"""
+    if not rows:
+        return
+    columns = synthetic_columns(rows, seed=seed)
+    dates = columns['dates_us'].astype("datetime64[us]").astype(str).tolist()
+    store.write_rows([
+        (txn_id, day, amount, description, CATEGORIES[code].name, ACCOUNT, merchant, vibe, currency, 0)
+        for txn_id, day, amount, description, code, merchant, vibe, currency in zip(
+            columns['ids'], dates, columns['amounts'].tolist(), columns['descriptions'],
+            columns['category_codes'].tolist(), columns['merchants'], columns['vibe_impacts'].tolist(),
+            columns['currencies'],
+        )
+    ])
+
+
+def offset_dates_stored_naive(workdir: str) -> bool:
+    """Regression check: '2024-02-01T10:00:00+05:00' must not be stored as an aware datetime"""
+    statement = (b"Date,Description,Amount\n2024-02-01T10:00:00+05:00,coffee,-4.50\n"
+                 b"2024-02-02T23:30:00-08:00,lunch,-12.00\n2024-02-03,bus,-2.75\n")
+    store = LedgerStore(os.path.join(workdir, "offset-dates.db"))
+    try:
+        import_statement(store, ACCOUNT, io.BytesIO(statement), "offsets.csv")
+        transactions = store.load(ACCOUNT)
+        try:
+            ColumnarLedger.from_transactions(transactions)
+        except TypeError:  # can't subtract offset-naive and offset-aware datetimes
+            return False
+        return len(transactions) == 3 and all(txn.date.tzinfo is None for txn in transactions)
+    finally:
+        store.close()
+
+
+def run_sample(workdir: str, statement: bytes, existing: int, seed: int) -> dict:
+    store = LedgerStore(os.path.join(workdir, f"ledger-{time.monotonic_ns()}.db"))
+    try:
+        seed_store(store, existing, seed + 1)
+        budget, classifier = SessionMemoryBudget(), EmotionClassifier()
+        ledger = budget.load(store, ACCOUNT, classifier)
+
+        result = import_statement(store, ACCOUNT, io.BytesIO(statement), "statement.csv")
+        started = time.perf_counter()
+        budget.merge_statement(store, ACCOUNT, result.id_prefix, ledger, classifier)
+        merge_seconds = time.perf_counter() - started
+
+        replaced = import_statement(store, ACCOUNT, io.BytesIO(statement), "statement.csv")
+        return {
+            "imported": result.imported,
+            "import_seconds": result.seconds,
+            "merge_seconds": merge_seconds,
+            "reimport_seconds": replaced.seconds,
+            "replaced": replaced.replaced,
+            "resident_rows": len(ledger),
+            "total_rows": len(ledger) + ledger.spilled_rows,
+            "sorted": bool(np.all(np.diff(ledger.dates) >= 0)),
+        }
+    finally:
+        store.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="FinAura statement-import benchmark")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="rows in the imported statement")
+    parser.add_argument("--existing", type=int, default=DEFAULT_EXISTING, help="rows already in the account")
+    parser.add_argument("--repeat", type=int, default=1, help="samples to take (median is reported)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS,
+                        help="seconds allowed for the median import plus read-back")
+    parser.add_argument("--output", help="append the result as one JSON line to this file")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    statement = synthetic_csv(args.rows, args.seed)
+    print(f"{args.rows:,}-row statement ({len(statement) / 1e6:.1f} MB) generated in "
+          f"{time.perf_counter() - started:.1f}s; {args.existing:,} rows already stored")
+
+    workdir = tempfile.mkdtemp(prefix="finaura-import-")
+    try:
+        offsets_ok = offset_dates_stored_naive(workdir)
+        samples = [run_sample(workdir, statement, args.existing, args.seed) for _ in range(args.repeat)]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    result = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "rows": args.rows,
+        "existing": args.existing,
+        "repeat": args.repeat,
+        "imported": samples[-1]["imported"],
+        **{key: statistics.median(sample[key] for sample in samples)
+           for key in ("import_seconds", "merge_seconds", "reimport_seconds")},
+        "budget_seconds": args.budget,
+    }
+    result["rows_per_second"] = result["imported"] / result["import_seconds"] if result["import_seconds"] else 0.0
+    failures = [] if offsets_ok else ["UTC-offset statement dates were not stored as naive local times"]
+    if result["import_seconds"] + result["merge_seconds"] > args.budget:
+        failures.append(f"import + read-back {result['import_seconds'] + result['merge_seconds']:.2f}s "
+                        f"> {args.budget:.2f}s")
+    if any(sample["replaced"] != sample["imported"] for sample in samples):
+        failures.append("re-import did not replace every row")
+    if any(sample["total_rows"] != sample["imported"] + args.existing for sample in samples):
+        failures.append("merged ledger does not account for every stored row")
+    if not all(sample["sorted"] for sample in samples):
+        failures.append("merged ledger is out of date order")
+    result["passed"] = not failures
+
+    print(f"import:     {result['import_seconds']:.2f}s ({result['rows_per_second']:,.0f} rows/s)")
+    print(f"read-back:  {result['merge_seconds']:.2f}s (hot-window load_statement + history sums + merge)")
+    print(f"re-import:  {result['reimport_seconds']:.2f}s (every row replaced)")
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(result) + "\n")
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    return 0 if result["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
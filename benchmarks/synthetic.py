@@ -0,0 +1,149 @@
+# 💸 FinAura synthetic ledgers – seeded, realistic-looking transaction histories for benchmarks
+#
+#   from synthetic import synthetic_ledger, synthetic_transactions
+#   ledger = synthetic_ledger(1_000_000, seed=42)        # ColumnarLedger, built column-wise
+#   rows = synthetic_transactions(1_000, seed=42)        # list of Transaction objects
+#
+# The same (n, seed) always gives the same rows. Merchants follow a skewed popularity
+# curve, each with a home category (10% of rows land elsewhere), per-category amount
+# scales, a few description templates (some with impulse keywords) and a vibe bias.
+
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from finaura.ledger import CATEGORIES, CATEGORY_CODES, ColumnarLedger, from_epoch_us, to_epoch_us  # noqa: E402
+from finaura.models import SpendingCategory, Transaction  # noqa: E402
+from finaura.rates import DEFAULT_RATES  # noqa: E402
+
+US_PER_DAY = 86_400_000_000
+DEFAULT_DAYS = 730
+DEFAULT_SEED = 42
+
+# (merchant, home category, description templates)
+MERCHANTS = [
+    ("starbucks", SpendingCategory.JOY, ["iced coffee emergency", "quick latte", "oat milk treat"]),
+    ("sephora", SpendingCategory.JOY, ["skincare haul (self care!!)", "saw it on tiktok", "lip gloss restock"]),
+    ("spotify", SpendingCategory.JOY, ["spotify premium"]),
+    ("netflix", SpendingCategory.JOY, ["netflix subscription"]),
+    ("concert tickets", SpendingCategory.JOY, ["concert with the girls", "wanted front row"]),
+    ("landlord", SpendingCategory.ESSENTIAL, ["rent (ugh)"]),
+    ("whole foods", SpendingCategory.ESSENTIAL, ["groceries (adult moment)", "weekly groceries"]),
+    ("trader joes", SpendingCategory.ESSENTIAL, ["groceries", "snacks for the week"]),
+    ("therapist", SpendingCategory.ESSENTIAL, ["therapy session"]),
+    ("metro transit", SpendingCategory.ESSENTIAL, ["monthly transit pass", "bus fare"]),
+    ("electric co", SpendingCategory.ESSENTIAL, ["electric bill"]),
+    ("verizon", SpendingCategory.ESSENTIAL, ["phone bill"]),
+    ("cvs pharmacy", SpendingCategory.ESSENTIAL, ["prescription", "cold meds"]),
+    ("amazon", SpendingCategory.OOPS, ["tiktok made me buy it", "impulse gadget", "saw a deal"]),
+    ("uber eats", SpendingCategory.OOPS, ["late night uber eats", "quick dinner delivery"]),
+    ("shein", SpendingCategory.OOPS, ["wanted a new fit", "impulse haul"]),
+    ("doordash", SpendingCategory.OOPS, ["too tired to cook"]),
+    ("vanguard", SpendingCategory.INVESTMENT, ["index fund contribution"]),
+    ("fidelity", SpendingCategory.INVESTMENT, ["roth ira deposit"]),
+    ("robinhood", SpendingCategory.INVESTMENT, ["fractional shares"]),
+]
+
+# Median amount (USD) per category; amounts are lognormal around it
+AMOUNT_MEDIANS = {
+    SpendingCategory.ESSENTIAL: 60.0,
+    SpendingCategory.JOY: 25.0,
+    SpendingCategory.OOPS: 30.0,
+    SpendingCategory.INVESTMENT: 200.0,
+}
+
+# Mean vibe impact per category
+VIBE_BIAS = {
+    SpendingCategory.ESSENTIAL: 0.0,
+    SpendingCategory.JOY: 0.35,
+    SpendingCategory.OOPS: -0.35,
+    SpendingCategory.INVESTMENT: 0.2,
+}
+
+CURRENCY_MIX = {'USD': 0.85, 'EUR': 0.10, 'PKR': 0.05}
+
+
+def synthetic_columns(n: int, seed: int = DEFAULT_SEED, days: int = DEFAULT_DAYS,
+                      end: Optional[datetime] = None) -> Dict:
+    """Column data for n transactions spread over the `days` before `end`, oldest first"""
+    rng = np.random.default_rng(seed)
+    end = end or datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+
+    popularity = 1.0 / np.arange(1, len(MERCHANTS) + 1)
+    merchant_index = rng.choice(len(MERCHANTS), size=n, p=popularity / popularity.sum())
+    home_codes = np.array([CATEGORY_CODES[category] for _, category, _ in MERCHANTS], dtype=np.int8)
+    category_codes = home_codes[merchant_index]
+    strays = rng.random(n) < 0.10
+    category_codes[strays] = rng.integers(0, len(CATEGORIES), size=int(strays.sum()), dtype=np.int8)
+
+    medians = np.array([AMOUNT_MEDIANS.get(category, 40.0) for category in CATEGORIES])
+    amounts = np.round(medians[category_codes] * rng.lognormal(0.0, 0.6, size=n), 2)
+    biases = np.array([VIBE_BIAS.get(category, 0.0) for category in CATEGORIES])
+    vibes = np.clip(biases[category_codes] + rng.normal(0.0, 0.25, size=n), -1.0, 1.0).astype(np.float32)
+
+    end_us = to_epoch_us(end)
+    dates_us = np.sort(end_us - rng.integers(0, days * US_PER_DAY, size=n, dtype=np.int64))
+
+    # Descriptions are picked from a shared pool, so n rows hold n references, not n strings
+    pool: List[str] = []
+    offsets = []
+    for _, _, templates in MERCHANTS:
+        offsets.append(len(pool))
+        pool.extend(templates)
+    template_counts = np.array([len(templates) for _, _, templates in MERCHANTS])
+    picks = np.array(offsets)[merchant_index] + (rng.random(n) * template_counts[merchant_index]).astype(np.intp)
+    pool_array = np.array(pool, dtype=object)
+
+    currencies = np.array(list(CURRENCY_MIX), dtype=object)
+    currency_picks = rng.choice(len(currencies), size=n, p=list(CURRENCY_MIX.values()))
+    amounts = np.where(
+        currency_picks == 0, amounts,
+        np.round(amounts * np.array([DEFAULT_RATES[c] for c in currencies])[currency_picks], 2)
+    )
+
+    return {
+        'ids': [f"syn-{seed}-{index}" for index in range(n)],
+        'dates_us': dates_us,
+        'amounts': amounts,
+        'descriptions': pool_array[picks].tolist(),
+        'category_codes': category_codes,
+        'merchants': np.array([name for name, _, _ in MERCHANTS], dtype=object)[merchant_index].tolist(),
+        'vibe_impacts': vibes,
+        'currencies': currencies[currency_picks].tolist(),
+    }
+
+
+def synthetic_ledger(n: int, seed: int = DEFAULT_SEED, days: int = DEFAULT_DAYS,
+                     end: Optional[datetime] = None) -> ColumnarLedger:
+    """A ColumnarLedger of n synthetic rows (the shape the app loads from SQLite)"""
+    ledger = ColumnarLedger.from_columns(**synthetic_columns(n, seed, days, end))
+    ledger.usd_rates.update(DEFAULT_RATES)
+    return ledger
+
+
+def synthetic_transactions(n: int, seed: int = DEFAULT_SEED, days: int = DEFAULT_DAYS,
+                           end: Optional[datetime] = None) -> List[Transaction]:
+    """The same rows as synthetic_ledger(n, seed) as Transaction objects"""
+    columns = synthetic_columns(n, seed, days, end)
+    return [
+        Transaction(
+            date=from_epoch_us(date_us),
+            amount=float(amount),
+            description=description,
+            category=CATEGORIES[code],
+            merchant=merchant,
+            vibe_impact=float(vibe),
+            id=txn_id,
+            currency=currency,
+        )
+        for txn_id, date_us, amount, description, code, merchant, vibe, currency in zip(
+            columns['ids'], columns['dates_us'].tolist(), columns['amounts'].tolist(), columns['descriptions'],
+            columns['category_codes'].tolist(), columns['merchants'], columns['vibe_impacts'].tolist(),
+            columns['currencies'],
+        )
+    ]
@@ -0,0 +1 @@
+# 💸 FinAura core package – data models, storage and analytics that power streamlit_app.py
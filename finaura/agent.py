@@ -0,0 +1,149 @@
+# 💸 FinAura agent – the Gen Z money coach and the reference data it draws from
+
+import random
+from types import MappingProxyType
+from typing import Dict, List
+
+from finaura.models import VibeType
+
+
+def freeze(value):
+    """Read-only copy of nested dicts/lists, safe to share between sessions and threads"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+# Reference tables are built once per process and frozen; sessions only read them
+VIBE_RESPONSES = freeze({
+    VibeType.STRESSED: [
+        "Hey bestie, I see you're feeling the money stress 😔 Let's break this down together",
+        "Okay, deep breath! Your finances aren't as scary as they seem rn",
+        "You're doing better than you think! Let me show you the receipts 📊"
+    ],
+    VibeType.CONFIDENT: [
+        "YES QUEEN! 👑 Your money game is strong today",
+        "Love this energy! You're absolutely crushing your financial goals",
+        "Confidence looks good on you! Your budget is thriving ✨"
+    ],
+    VibeType.CONFUSED: [
+        "No judgment here! Money stuff is confusing AF sometimes 🤷‍♀️",
+        "Let's untangle this together! I'll make it make sense",
+        "Confusion is valid! Your finances don't have to be perfect"
+    ],
+    VibeType.GUILTY: [
+        "Stop! 🛑 Guilt spending happens to literally everyone",
+        "That purchase doesn't define you, babe. Let's just adjust and move on",
+        "Self-compassion > self-judgment. Your worth isn't your spending"
+    ]
+})
+
+DEFAULT_VIBE_RESPONSES = ("You're doing great! 💜",)
+
+INVESTMENT_SUGGESTIONS = freeze({
+    "low_risk": [
+        {"name": "High-Yield Savings", "desc": "Safe & steady growth 📈", "risk": "Low", "return": "2-4%"},
+        {"name": "Government Bonds", "desc": "Boring but reliable 🏛️", "risk": "Low", "return": "3-5%"},
+        {"name": "CDs (Certificates of Deposit)", "desc": "Lock it up, stack it up 🔒", "risk": "Low", "return": "3-5%"}
+    ],
+    "medium_risk": [
+        {"name": "Index Funds (S&P 500)", "desc": "Diversified market vibes 📊", "risk": "Medium", "return": "7-10%"},
+        {"name": "Target-Date Funds", "desc": "Set it and forget it ⏰", "risk": "Medium", "return": "6-9%"},
+        {"name": "REITs", "desc": "Real estate without the drama 🏠", "risk": "Medium", "return": "5-8%"}
+    ],
+    "high_risk": [
+        {"name": "Individual Stocks", "desc": "Pick your favorites 🎯", "risk": "High", "return": "Variable"},
+        {"name": "Cryptocurrency", "desc": "Digital gold or digital chaos? 🪙", "risk": "High", "return": "Highly Variable"},
+        {"name": "Growth Stocks", "desc": "Betting on the future 🚀", "risk": "High", "return": "Variable"}
+    ]
+})
+
+GEN_Z_FINANCIAL_TIPS = freeze([
+    "💡 Automate your savings - treat it like a subscription you can't cancel",
+    "🎯 Use the 24-hour rule for purchases over $50",
+    "📱 Try investment apps like Robinhood, Acorns, or Stash for micro-investing",
+    "🏠 Aim for 6-month emergency fund (adulting is expensive!)",
+    "✨ Invest in yourself - courses, certifications, side hustles",
+    "🌱 Start investing early - compound interest is your bestie",
+    "💳 Build credit responsibly - your future self will thank you",
+    "🎉 Celebrate small wins - every dollar saved matters!"
+])
+
+
+class EnhancedFinAuraAgent:
+    """The Gen Z AI Agent that gets your vibes AND your financial goals
+
+    Holds no per-user state: every method reads the frozen module tables above and its
+    arguments, so one instance can serve every session at once.
+    """
+
+    vibe_responses = VIBE_RESPONSES
+    investment_suggestions = INVESTMENT_SUGGESTIONS
+    gen_z_financial_tips = GEN_Z_FINANCIAL_TIPS
+
+    def get_vibe_response(self, vibe: VibeType) -> str:
+        return random.choice(VIBE_RESPONSES.get(vibe, DEFAULT_VIBE_RESPONSES))
+
+    def get_budget_suggestions(self, income: float, age: int = 25) -> Dict:
+        """Generate Gen Z-specific budget suggestions"""
+        if income < 2000:
+            return {
+                "needs": 60,  # Higher for survival mode
+                "wants": 25,
+                "savings": 15,
+                "advice": "Survival mode activated! Focus on essentials and small savings wins 💪"
+            }
+        elif income < 4000:
+            return {
+                "needs": 55,
+                "wants": 30,
+                "savings": 15,
+                "advice": "Building phase! You're doing great - balance is key 🌟"
+            }
+        elif income < 6000:
+            return {
+                "needs": 50,
+                "wants": 30,
+                "savings": 20,
+                "advice": "Thriving mode! Classic 50/30/20 rule works perfectly 🔥"
+            }
+        else:
+            return {
+                "needs": 45,
+                "wants": 35,
+                "savings": 20,
+                "advice": "High earner energy! More room for joy spending AND aggressive saving ✨"
+            }
+
+    def get_investment_roadmap(self, age: int, income: float, risk_tolerance: str) -> List[Dict]:
+        """Create age-appropriate investment suggestions"""
+        roadmap = []
+
+        # Emergency fund first (always!)
+        roadmap.append({
+            "priority": 1,
+            "goal": "Emergency Fund",
+            "target": min(income * 6, 10000),  # 6 months expenses
+            "description": "Your financial safety net - aim for 3-6 months expenses 🚨"
+        })
+
+        # Age-based suggestions
+        if age < 30:
+            roadmap.extend([
+                {
+                    "priority": 2,
+                    "goal": "Retirement Start",
+                    "target": income * 0.15,  # 15% of income
+                    "description": "Start early = retire like royalty 👑"
+                },
+                {
+                    "priority": 3,
+                    "goal": "Skill Investment",
+                    "target": income * 0.05,  # 5% for education
+                    "description": "Invest in yourself - best ROI ever 📚"
+                }
+            ])
+
+        return roadmap
@@ -0,0 +1,163 @@
+# 💸 FinAura incremental aggregates – O(1) dashboard stats maintained on every ledger change
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class LedgerAggregates:
+    """Running per-category totals, counts, vibe sums and min/max amounts
+
+    Every add/remove is O(1). Removing the current min or max of a category only marks
+    that category stale; the extreme is recomputed from the ledger columns (one NumPy
+    reduction) the next time it is read.
+
+    Amounts are summed in their own currency: `totals` holds the plain sum of amounts and
+    `currency_totals` splits it per currency code, so a converted total is one multiply per
+    currency instead of one per row.
+    """
+
+    def __init__(self, n_categories: int):
+        self.n_categories = n_categories
+        self.totals: List[float] = [0.0] * n_categories
+        self.counts: List[int] = [0] * n_categories
+        self.vibe_sums: List[float] = [0.0] * n_categories
+        self.positive_vibe_counts: List[int] = [0] * n_categories
+        self.min_amounts: List[float] = [float("inf")] * n_categories
+        self.max_amounts: List[float] = [float("-inf")] * n_categories
+        self.currency_totals: Dict[int, List[float]] = {}
+        self.currency_counts: Dict[int, int] = {}
+        self._stale_extremes = set()
+
+    @classmethod
+    def from_columns(cls, n_categories: int, category_codes: np.ndarray, amounts: np.ndarray,
+                     vibe_impacts: np.ndarray, currency_codes: Optional[np.ndarray] = None) -> "LedgerAggregates":
+        """Seed the aggregates from full columns in one vectorized pass"""
+        aggregates = cls(n_categories)
+        codes = category_codes.astype(np.intp)
+        if currency_codes is None:
+            currency_codes = np.zeros(len(codes), dtype=np.intp)
+        currency_codes = currency_codes.astype(np.intp)
+        for currency in np.unique(currency_codes).tolist():
+            in_currency = currency_codes == currency
+            aggregates.currency_totals[currency] = np.bincount(
+                codes[in_currency], weights=amounts[in_currency], minlength=n_categories
+            ).tolist()
+            aggregates.currency_counts[currency] = int(np.count_nonzero(in_currency))
+        aggregates.totals = np.bincount(codes, weights=amounts, minlength=n_categories).tolist()
+        aggregates.counts = np.bincount(codes, minlength=n_categories).tolist()
+        aggregates.vibe_sums = np.bincount(codes, weights=vibe_impacts, minlength=n_categories).tolist()
+        aggregates.positive_vibe_counts = np.bincount(codes[vibe_impacts > 0], minlength=n_categories).tolist()
+        aggregates._stale_extremes = set(range(n_categories))
+        return aggregates
+
+    def add(self, code: int, amount: float, vibe_impact: float, currency: int = 0):
+        if currency not in self.currency_totals:
+            self.currency_totals[currency] = [0.0] * self.n_categories
+            self.currency_counts[currency] = 0
+        self.currency_totals[currency][code] += amount
+        self.currency_counts[currency] += 1
+        self.totals[code] += amount
+        self.counts[code] += 1
+        self.vibe_sums[code] += vibe_impact
+        if vibe_impact > 0:
+            self.positive_vibe_counts[code] += 1
+        if code not in self._stale_extremes:
+            self.min_amounts[code] = min(self.min_amounts[code], amount)
+            self.max_amounts[code] = max(self.max_amounts[code], amount)
+
+    def remove(self, code: int, amount: float, vibe_impact: float, currency: int = 0):
+        self.currency_totals[currency][code] -= amount
+        self.currency_counts[currency] -= 1
+        if self.currency_counts[currency] == 0:
+            del self.currency_totals[currency]
+            del self.currency_counts[currency]
+        self.totals[code] -= amount
+        self.counts[code] -= 1
+        self.vibe_sums[code] -= vibe_impact
+        if vibe_impact > 0:
+            self.positive_vibe_counts[code] -= 1
+        if self.counts[code] == 0:
+            self.totals[code] = 0.0  # drop accumulated float drift
+            self.vibe_sums[code] = 0.0
+            self.min_amounts[code] = float("inf")
+            self.max_amounts[code] = float("-inf")
+            self._stale_extremes.discard(code)
+        elif amount <= self.min_amounts[code] or amount >= self.max_amounts[code]:
+            self._stale_extremes.add(code)
+
+    def add_group(self, code: int, currency: int, count: int, total: float, vibe_sum: float, positive_vibes: int):
+        """Fold in `count` rows at once (e.g. a GROUP BY over rows that stay on disk)"""
+        if currency not in self.currency_totals:
+            self.currency_totals[currency] = [0.0] * self.n_categories
+            self.currency_counts[currency] = 0
+        self.currency_totals[currency][code] += total
+        self.currency_counts[currency] += count
+        self.totals[code] += total
+        self.counts[code] += count
+        self.vibe_sums[code] += vibe_sum
+        self.positive_vibe_counts[code] += positive_vibes
+        self._stale_extremes.add(code)
+
+    def merge(self, other: "LedgerAggregates", currency_map: Sequence[int]):
+        """Fold in another ledger's aggregates; its currency code c is currency_map[c] here"""
+        for code in range(self.n_categories):
+            if not other.counts[code]:
+                continue
+            self.totals[code] += other.totals[code]
+            self.counts[code] += other.counts[code]
+            self.vibe_sums[code] += other.vibe_sums[code]
+            self.positive_vibe_counts[code] += other.positive_vibe_counts[code]
+            self._stale_extremes.add(code)  # refreshed from the merged columns on the next read
+        for currency, totals in other.currency_totals.items():
+            mapped = int(currency_map[currency])
+            if mapped not in self.currency_totals:
+                self.currency_totals[mapped] = [0.0] * self.n_categories
+                self.currency_counts[mapped] = 0
+            self.currency_totals[mapped] = [mine + theirs for mine, theirs in zip(self.currency_totals[mapped], totals)]
+            self.currency_counts[mapped] += other.currency_counts[currency]
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def total(self, code: Optional[int] = None) -> float:
+        return sum(self.totals) if code is None else self.totals[code]
+
+    def count(self, code: Optional[int] = None) -> int:
+        return sum(self.counts) if code is None else self.counts[code]
+
+    def converted_total(self, factors: Dict[int, float], code: Optional[int] = None) -> float:
+        """Total with each currency's sum multiplied by factors[currency code] (default 1.0)"""
+        total = 0.0
+        for currency, totals in self.currency_totals.items():
+            subtotal = sum(totals) if code is None else totals[code]
+            total += subtotal * factors.get(currency, 1.0)
+        return total
+
+    def mean_amount(self) -> float:
+        count = self.count()
+        return self.total() / count if count else 0.0
+
+    def mean_vibe(self, code: Optional[int] = None) -> float:
+        count = self.count(code)
+        vibe_sum = sum(self.vibe_sums) if code is None else self.vibe_sums[code]
+        return vibe_sum / count if count else 0.0
+
+    def positive_vibe_count(self) -> int:
+        return sum(self.positive_vibe_counts)
+
+    def top_category_code(self) -> int:
+        return max(range(self.n_categories), key=lambda code: self.counts[code])
+
+    def extremes(self, code: int, columns: Callable[[], Tuple[np.ndarray, np.ndarray]]) -> Tuple[float, float]:
+        """(min, max) amount for a category; `columns` supplies (codes, amounts) if a refresh is needed"""
+        if self.counts[code] == 0:
+            return 0.0, 0.0
+        if code in self._stale_extremes:
+            codes, amounts = columns()
+            in_category = amounts[codes == code]
+            self.min_amounts[code] = float(in_category.min())
+            self.max_amounts[code] = float(in_category.max())
+            self._stale_extremes.discard(code)
+        return self.min_amounts[code], self.max_amounts[code]
@@ -0,0 +1,140 @@
+# 💸 FinAura agent audit trail – queued, batched writes of agent interventions to agent_actions
+
+import atexit
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from finaura.storage import LedgerStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE = 10_000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 1.0  # seconds a partial batch may wait before it is written
+DEFAULT_PUT_TIMEOUT = 0.05  # longest a full queue may stall the caller before the event is dropped
+
+AGENT_ACTIONS_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS agent_actions (
+    id TEXT PRIMARY KEY,
+    agent_name TEXT,
+    action_type TEXT,
+    data TEXT,
+    timestamp TEXT,
+    status TEXT,
+    confidence REAL
+)
+"""
+
+AGENT_ACTIONS_INDEX_SQL = "CREATE INDEX IF NOT EXISTS idx_agent_actions_timestamp ON agent_actions (timestamp)"
+
+INSERT_ACTION_SQL = """
+INSERT OR IGNORE INTO agent_actions (id, agent_name, action_type, data, timestamp, status, confidence)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class AuditWriter:
+    """Agent actions go onto a bounded queue; a daemon thread writes them in batches
+
+    record() never touches SQLite. When the queue is full it waits at most put_timeout
+    for the writer to catch up, then drops the event and counts it, so a stalled disk
+    slows the UI by a bounded amount instead of growing memory without limit. The writer
+    takes up to batch_size events per SQLite transaction and writes a partial batch
+    after flush_interval seconds.
+    """
+
+    def __init__(self, store: LedgerStore, max_queue: int = DEFAULT_MAX_QUEUE,
+                 batch_size: int = DEFAULT_BATCH_SIZE, flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 put_timeout: float = DEFAULT_PUT_TIMEOUT):
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._closed = threading.Event()
+        with store.transaction() as conn:
+            conn.execute(AGENT_ACTIONS_SCHEMA_SQL)
+            conn.execute(AGENT_ACTIONS_INDEX_SQL)
+        self._thread = threading.Thread(target=self._run, name="finaura-audit-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, agent_name: str, action_type: str, data: Dict, status: str = "shown",
+               confidence: float = 1.0) -> bool:
+        """Queue one action; False if it was dropped because the writer is behind"""
+        row = (
+            uuid.uuid4().hex, agent_name, action_type, json.dumps(data, default=str),
+            datetime.now().isoformat(), status, float(confidence),
+        )
+        try:
+            self._queue.put(row, timeout=self.put_timeout)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything queued so far is written (tests, shutdown)"""
+        if not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        if self._closed.is_set():
+            return
+        self.flush(timeout)
+        self._closed.set()
+        self._thread.join(timeout)
+
+    # -------------------------------------------------------------------------
+    # Writer thread
+    # -------------------------------------------------------------------------
+
+    def _next_batch(self) -> Tuple[List[Tuple], List[threading.Event]]:
+        rows: List[Tuple] = []
+        waiters: List[threading.Event] = []
+        try:
+            item: Optional[object] = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return rows, waiters
+        while item is not None:
+            (waiters if isinstance(item, threading.Event) else rows).append(item)
+            if len(rows) >= self.batch_size:
+                break
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                item = None
+        return rows, waiters
+
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            rows, waiters = self._next_batch()
+            if rows:
+                try:
+                    with self.store.transaction() as conn:
+                        conn.executemany(INSERT_ACTION_SQL, rows)
+                    self.written += len(rows)
+                except sqlite3.Error as e:
+                    self.failed += len(rows)
+                    logger.error(f"Could not write {len(rows)} agent actions: {str(e)}")
+            for waiter in waiters:
+                waiter.set()
@@ -0,0 +1,76 @@
+# 💸 FinAura dashboard math – spend windows, headline metrics and the transaction table
+
+from datetime import date
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from finaura.formatting import category_labels, format_amounts, format_dates, mood_emojis
+from finaura.ledger import CATEGORY_CODES, ColumnarLedger
+from finaura.models import SpendingCategory
+from finaura.rates import RateProvider
+from finaura.timeseries import US_PER_DAY, to_day
+
+# Days the "average daily spend" card looks back over
+AVERAGE_DAYS = 30
+
+
+def bucket_weights(ledger: ColumnarLedger, rates: RateProvider, currency: str) -> Optional[np.ndarray]:
+    """Per-day-bucket multiplier to "USD at today's rate", so formatting shows each day at its own rate
+
+    None when the display is USD and every row is USD (no conversion needed).
+    """
+    if currency == 'USD' and ledger.is_single_currency:
+        return None
+    days, currency_codes, _ = ledger.timeline.columns()
+    return rates.today_equivalent(np.ones(len(days)), days * US_PER_DAY, currency, currency_codes, ledger.currencies)
+
+
+def spend_windows(ledger: ColumnarLedger, today: date, rates: RateProvider, currency: str,
+                  average_days: int = AVERAGE_DAYS) -> Dict:
+    """Per-category spend over the dashboard's date windows, read from the day buckets"""
+    timeline = ledger.timeline
+    weights = bucket_weights(ledger, rates, currency)
+    today_day = to_day(today)
+    first_day = timeline.first_day()
+    history_days = min(average_days, today_day - first_day + 1) if first_day is not None else 1
+    return {
+        'week': timeline.window(today_day - 6, today_day, weights),
+        'month': timeline.window(to_day(today.replace(day=1)), today_day, weights),
+        'average': timeline.window(today_day - average_days + 1, today_day, weights),
+        'average_days': max(history_days, 1),
+    }
+
+
+def dashboard_metrics(windows: Dict) -> Dict[str, float]:
+    """The dashboard cards from spend_windows(): week, average day, joy, essentials and month to date"""
+    week, month = windows['week'], windows['month']
+    return {
+        'total_spent': float(week.sum()),
+        'avg_daily': float(windows['average'].sum()) / windows['average_days'],
+        'joy_spending': float(week[CATEGORY_CODES[SpendingCategory.JOY]]),
+        'essential_spending': float(week[CATEGORY_CODES[SpendingCategory.ESSENTIAL]]),
+        'month_spent': float(month.sum()),
+    }
+
+
+def ledger_amount_labels(ledger: ColumnarLedger, rates: RateProvider, currency: str,
+                         decimals: int = 2) -> List[str]:
+    """A ledger's amounts formatted in `currency`, each at the rates of its own date, one group per source currency"""
+    if ledger.is_single_currency:
+        return format_amounts(ledger.amounts, currency, rates.rates_for(currency, ledger.dates), decimals)
+    converted = rates.convert(ledger.amounts, ledger.dates, currency, ledger.currency_codes, ledger.currencies)
+    return format_amounts(converted, currency, 1.0, decimals)
+
+
+def transaction_table(ledger: ColumnarLedger, rates: RateProvider, currency: str):
+    """The transaction log's display table for a ledger's rows, one column at a time"""
+    import pandas as pd
+    return pd.DataFrame({
+        'Date': format_dates(ledger.dates),
+        'Vibe': category_labels(ledger.category_codes),
+        'Amount': ledger_amount_labels(ledger, rates, currency),
+        'Description': ledger.descriptions,
+        'Merchant': [ledger.merchants[merchant_id] for merchant_id in ledger.merchant_ids.tolist()],
+        'Mood Impact': mood_emojis(ledger.vibe_impacts),
+    })
@@ -0,0 +1,128 @@
+# 💸 FinAura debt payoff – month-by-month amortization for many debts under several orderings
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Balances below this are treated as paid off (float dust from the monthly interest math)
+PAID_OFF = 0.005
+
+DEFAULT_MAX_MONTHS = 600
+
+STRATEGY_LABELS = {
+    'avalanche': "🔥 Avalanche (highest APR first)",
+    'snowball': "⛄ Snowball (smallest balance first)",
+    'custom': "🎯 Your order",
+    'minimums': "🐢 Minimums only",
+}
+
+
+@dataclass
+class Debt:
+    name: str
+    balance: float
+    apr: float  # percent, e.g. 18.0
+    minimum_payment: float
+
+
+@dataclass
+class PayoffSchedule:
+    strategy: str
+    order: List[int]  # debt indexes, first paid down first
+    balances: np.ndarray  # (months + 1, n_debts), row 0 is the starting balance
+    payments: np.ndarray  # (months, n_debts)
+    interest: np.ndarray  # (months, n_debts)
+    paid_off: bool  # False if the debts outlive max_months
+
+    @property
+    def months(self) -> int:
+        return len(self.payments)
+
+    @property
+    def total_interest(self) -> float:
+        return float(self.interest.sum())
+
+    @property
+    def total_paid(self) -> float:
+        return float(self.payments.sum())
+
+    def payoff_months(self) -> np.ndarray:
+        """Month each debt reaches zero (1-based), or -1 if it never does"""
+        cleared = self.balances[1:] <= PAID_OFF
+        return np.where(cleared.any(axis=0), cleared.argmax(axis=0) + 1, -1)
+
+
+def strategy_order(debts: Sequence[Debt], strategy: str, custom_order: Optional[Sequence[int]] = None) -> List[int]:
+    """Debt indexes in the order extra money goes to them"""
+    indexes = range(len(debts))
+    if strategy == 'avalanche':
+        return sorted(indexes, key=lambda i: (-debts[i].apr, debts[i].balance))
+    if strategy == 'snowball':
+        return sorted(indexes, key=lambda i: (debts[i].balance, -debts[i].apr))
+    if strategy == 'custom' and custom_order is not None:
+        return list(custom_order) + [i for i in indexes if i not in custom_order]
+    return list(indexes)
+
+
+def simulate_payoffs(debts: Sequence[Debt], monthly_budget: float,
+                     strategies: Sequence[str] = ('avalanche', 'snowball', 'custom', 'minimums'),
+                     custom_order: Optional[Sequence[int]] = None,
+                     max_months: int = DEFAULT_MAX_MONTHS) -> Dict[str, PayoffSchedule]:
+    """Amortize every debt under every strategy at once
+
+    State is a (strategies, debts) balance array, stepped one month at a time: interest
+    accrues, each debt gets its minimum, then the rest of the budget (including minimums
+    freed by paid-off debts) cascades down the strategy's order via a cumulative sum.
+    'minimums' never pays extra. The budget is raised to the sum of minimums if it is lower.
+    """
+    n_strategies, n_debts = len(strategies), len(debts)
+    balance = np.tile([max(0.0, debt.balance) for debt in debts], (n_strategies, 1)).astype(np.float64)
+    rates = np.array([debt.apr / 100 / 12 for debt in debts])
+    minimums = np.array([max(0.0, debt.minimum_payment) for debt in debts])
+    budget = max(monthly_budget, float(minimums.sum()))
+    orders = np.array([strategy_order(debts, strategy, custom_order) for strategy in strategies], dtype=np.intp)
+    rolls_over = np.array([strategy != 'minimums' for strategy in strategies])
+
+    balances, payments, interests = [balance.copy()], [], []
+    done = balance.sum(axis=1) <= PAID_OFF
+    for _ in range(max_months):
+        if done.all():
+            break
+        interest = balance * rates
+        balance = balance + interest
+        payment = np.minimum(minimums, balance)
+        extra = np.where(rolls_over, budget - payment.sum(axis=1), 0.0).clip(min=0.0)
+        remaining = balance - payment
+        # Extra money fills the debts in priority order until it runs out
+        ordered = np.take_along_axis(remaining, orders, axis=1)
+        before = np.cumsum(ordered, axis=1) - ordered
+        allocation = np.empty_like(remaining)
+        np.put_along_axis(allocation, orders, np.clip(extra[:, None] - before, 0.0, ordered), axis=1)
+        payment += allocation
+        balance = remaining - allocation
+        balance[balance <= PAID_OFF] = 0.0
+
+        balances.append(balance.copy())
+        payments.append(payment)
+        interests.append(interest)
+        done = balance.sum(axis=1) <= PAID_OFF
+
+    balances = np.stack(balances)
+    empty = np.zeros((0, n_strategies, n_debts))
+    payments = np.array(payments) if payments else empty
+    interests = np.array(interests) if interests else empty
+    schedules = {}
+    for s, strategy in enumerate(strategies):
+        totals = balances[:, s].sum(axis=1)
+        cleared = np.flatnonzero(totals <= PAID_OFF)
+        months = int(cleared[0]) if len(cleared) else len(payments)
+        schedules[strategy] = PayoffSchedule(
+            strategy=strategy,
+            order=orders[s].tolist(),
+            balances=balances[:months + 1, s].reshape(months + 1, n_debts),
+            payments=payments[:months, s].reshape(months, n_debts),
+            interest=interests[:months, s].reshape(months, n_debts),
+            paid_off=bool(len(cleared)),
+        )
+    return schedules
@@ -0,0 +1,244 @@
+# 💸 FinAura emotional spending – Joy/Regret/Impulse/Survival labels for the whole ledger
+
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from finaura.ledger import ColumnarLedger
+
+EMOTIONS = ['Joy', 'Regret', 'Impulse', 'Survival']
+JOY, REGRET, IMPULSE, SURVIVAL = range(len(EMOTIONS))
+
+# vibe_impact above JOY_VIBE is Joy, below REGRET_VIBE is Regret; keywords only decide the rest
+JOY_VIBE = 0.3
+REGRET_VIBE = -0.3
+_JOY_VIBE32, _REGRET_VIBE32 = float(np.float32(JOY_VIBE)), float(np.float32(REGRET_VIBE))
+
+IMPULSE_KEYWORDS = ['impulse', 'quick', 'saw', 'wanted']
+
+# Window label -> (last N purchases, last N days); (None, None) is the whole history
+EMOTION_WINDOWS = {
+    "Last 10 purchases": (10, None),
+    "Last 30 days": (None, 30),
+    "Last 90 days": (None, 90),
+    "All time": (None, None),
+}
+
+
+def compile_keywords(keywords: Sequence[str]) -> "re.Pattern":
+    """One case-insensitive alternation matching any keyword anywhere in the text"""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+class EmotionClassifier:
+    """Labels every ledger row with an index into EMOTIONS in one vectorized pass
+
+    The only per-row Python work is the keyword search, and its result is kept per row:
+    a later call only searches rows appended since (or all rows if earlier descriptions
+    changed), and repeated descriptions are looked up in a memo instead of re-matched.
+    The vibe thresholds are applied to the whole vibe column with NumPy on every call.
+    Rows the ledger spills are dropped from that per-row state; `history` keeps their
+    labels summed per month and currency.
+    """
+
+    def __init__(self, keywords: Sequence[str] = IMPULSE_KEYWORDS, max_memo: int = 100_000):
+        self.pattern = compile_keywords(keywords)
+        self.max_memo = max_memo
+        self._memo: Dict[str, bool] = {}
+        self._descriptions: List[str] = []
+        self._keyword_hits = np.zeros(0, dtype=bool)
+        self._version: Optional[int] = None
+        self._labels = np.zeros(0, dtype=np.int8)
+        self._spilled_rows = 0
+        self.history = EmotionHistory()
+
+    def _matches(self, description: str) -> bool:
+        hit = self._memo.get(description)
+        if hit is None:
+            if len(self._memo) >= self.max_memo:
+                self._memo.clear()
+            hit = self._memo[description] = self.pattern.search(description) is not None
+        return hit
+
+    def keyword_hits(self, descriptions: List[str]) -> np.ndarray:
+        """Bool per description, searching only descriptions not seen at the same position before"""
+        known = len(self._descriptions)
+        if len(descriptions) < known or descriptions[:known] != self._descriptions:
+            known = 0
+            self._keyword_hits = np.zeros(0, dtype=bool)
+        new = descriptions[known:]
+        if new:
+            fresh = np.fromiter(map(self._matches, new), dtype=bool, count=len(new))
+            self._keyword_hits = np.concatenate([self._keyword_hits[:known], fresh])
+        self._descriptions = list(descriptions)
+        return self._keyword_hits
+
+    def classify(self, ledger: ColumnarLedger) -> np.ndarray:
+        """int8 emotion code per row of the ledger"""
+        if ledger.version == self._version:
+            return self._labels
+        self._follow_spill(ledger.spilled_rows)
+        hits = self.keyword_hits(ledger.descriptions)
+        vibes = ledger.vibe_impacts
+        labels = np.where(hits, IMPULSE, SURVIVAL).astype(np.int8)
+        labels[vibes < REGRET_VIBE] = REGRET
+        labels[vibes > JOY_VIBE] = JOY
+        self._labels, self._version = labels, ledger.version
+        return labels
+
+    def label(self, vibe_impact: Optional[float], description: Optional[str]) -> int:
+        """One row's emotion code, exactly as classify() would give it (the ledger holds vibes as float32)"""
+        vibe = float(np.float32(vibe_impact or 0.0))
+        if vibe > _JOY_VIBE32:
+            return JOY
+        if vibe < _REGRET_VIBE32:
+            return REGRET
+        return IMPULSE if self._matches(description or "") else SURVIVAL
+
+    def reset(self, ledger: ColumnarLedger):
+        """Start over for a freshly loaded ledger; its spilled rows come back through add_history"""
+        self._descriptions = []
+        self._keyword_hits = np.zeros(0, dtype=bool)
+        self._labels = np.zeros(0, dtype=np.int8)
+        self._version = None
+        self._spilled_rows = ledger.spilled_rows
+        self.history = EmotionHistory()
+
+    def add_history(self, groups: Iterable[Tuple[str, str, int, int, float]], ledger: ColumnarLedger):
+        """Fold (month 'YYYY-MM', currency, emotion, rows, amount) sums of rows the ledger never loaded into history"""
+        self.history.add_groups(
+            ((int(month[:4]) - 1970) * 12 + int(month[5:7]) - 1, ledger._intern_currency(currency),
+             emotion, count, total)
+            for month, currency, emotion, count, total in groups
+        )
+        self._spilled_rows = ledger.spilled_rows
+
+    def _follow_spill(self, spilled_rows: int):
+        """Forget per-row state for rows the ledger spilled; fewer spilled rows means a new ledger"""
+        if spilled_rows < self._spilled_rows:
+            self._descriptions = []
+            self._keyword_hits = np.zeros(0, dtype=bool)
+            self.history = EmotionHistory()
+        else:
+            dropped = spilled_rows - self._spilled_rows
+            del self._descriptions[:dropped]
+            self._keyword_hits = self._keyword_hits[dropped:].copy()
+        self._spilled_rows = spilled_rows
+
+    def spill(self, ledger: ColumnarLedger, count: int) -> int:
+        """Spill the ledger's oldest `count` rows, keeping their labels in `history`"""
+        labels = self.classify(ledger)
+        spilled = ledger.spill(count)
+        if not spilled:
+            return 0
+        positions = spilled['positions']
+        self.history.add(labels[positions], spilled['amounts'], spilled['dates_us'], spilled['currency_codes'])
+        # classify() just ran, so the per-row state lines up with the ledger as it was before the spill
+        keep = np.ones(len(self._keyword_hits), dtype=bool)
+        keep[positions] = False
+        self._keyword_hits = self._keyword_hits[keep]
+        self._descriptions = [description for description, held in zip(self._descriptions, keep.tolist()) if held]
+        self._spilled_rows = ledger.spilled_rows
+        return len(positions)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held for the resident rows and the description memo"""
+        return (sys.getsizeof(self._descriptions) + self._keyword_hits.nbytes + self._labels.nbytes
+                + sys.getsizeof(self._memo))
+
+
+class EmotionHistory:
+    """Emotion counts and amounts per (month, currency) for rows no longer held in memory
+
+    Amounts stay in their own currency, so reads convert them at the current rates with
+    one factor per currency, like the ledger aggregates.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self._counts: Dict[Tuple[int, int], np.ndarray] = {}
+        self._totals: Dict[Tuple[int, int], np.ndarray] = {}
+
+    def add(self, labels: np.ndarray, amounts: np.ndarray, dates_us: np.ndarray, currency_codes: np.ndarray):
+        if not len(labels):
+            return
+        months = np.asarray(dates_us, dtype=np.int64).astype("datetime64[us]").astype("datetime64[M]").astype(np.int64)
+        keys, key_index = np.unique(np.stack([months, currency_codes.astype(np.int64)]), axis=1, return_inverse=True)
+        cells = key_index.reshape(-1).astype(np.intp) * len(EMOTIONS) + labels
+        size = keys.shape[1] * len(EMOTIONS)
+        counts = np.bincount(cells, minlength=size).reshape(-1, len(EMOTIONS))
+        totals = np.bincount(cells, weights=amounts, minlength=size).reshape(-1, len(EMOTIONS))
+        for key, key_counts, key_totals in zip(zip(*keys.tolist()), counts, totals):
+            if key in self._counts:
+                self._counts[key] += key_counts
+                self._totals[key] += key_totals
+            else:
+                self._counts[key], self._totals[key] = key_counts.copy(), key_totals.copy()
+        self.rows += len(labels)
+
+    def add_groups(self, groups: Iterable[Tuple[int, int, int, int, float]]):
+        """Fold in (month index, currency code, emotion, rows, amount) sums, e.g. from a GROUP BY"""
+        for month, currency, emotion, count, total in groups:
+            key = (month, currency)
+            if key not in self._counts:
+                self._counts[key] = np.zeros(len(EMOTIONS), dtype=np.int64)
+                self._totals[key] = np.zeros(len(EMOTIONS))
+            self._counts[key][emotion] += count
+            self._totals[key][emotion] += total
+            self.rows += count
+
+    def monthly(self, factors: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(months, counts, totals) like monthly_emotion_totals, totals times factors[currency code]"""
+        month_values = sorted({month for month, _ in self._counts})
+        positions = {month: position for position, month in enumerate(month_values)}
+        counts = np.zeros((len(month_values), len(EMOTIONS)), dtype=np.int64)
+        totals = np.zeros((len(month_values), len(EMOTIONS)))
+        for (month, currency), key_counts in self._counts.items():
+            counts[positions[month]] += key_counts
+            totals[positions[month]] += self._totals[(month, currency)] * factors[currency]
+        return np.array(month_values, dtype="datetime64[M]"), counts, totals
+
+    def summary(self, factors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(count, total amount) per emotion over all spilled rows, like emotion_summary"""
+        _, counts, totals = self.monthly(factors)
+        return counts.sum(axis=0), totals.sum(axis=0)
+
+
+def emotion_summary(labels: np.ndarray, amounts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(count, total amount) per emotion, indexed like EMOTIONS"""
+    counts = np.bincount(labels, minlength=len(EMOTIONS))
+    totals = np.bincount(labels, weights=amounts, minlength=len(EMOTIONS))
+    return counts, totals
+
+
+def monthly_emotion_totals(labels: np.ndarray, amounts: np.ndarray,
+                           dates_us: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(months, counts, totals) with one row per calendar month that has spending
+
+    months is datetime64[M]; counts and totals are (n_months, len(EMOTIONS)) arrays.
+    """
+    if not len(labels):
+        empty = np.zeros((0, len(EMOTIONS)))
+        return np.array([], dtype="datetime64[M]"), empty.astype(np.int64), empty
+    months = np.asarray(dates_us, dtype=np.int64).astype("datetime64[us]").astype("datetime64[M]")
+    unique_months, month_index = np.unique(months, return_inverse=True)
+    cells = month_index.astype(np.intp) * len(EMOTIONS) + labels
+    size = len(unique_months) * len(EMOTIONS)
+    counts = np.bincount(cells, minlength=size).reshape(-1, len(EMOTIONS))
+    totals = np.bincount(cells, weights=amounts, minlength=size).reshape(-1, len(EMOTIONS))
+    return unique_months, counts, totals
+
+
+def merge_monthly_totals(*results: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sum several (months, counts, totals) results month by month"""
+    months = np.unique(np.concatenate([result[0] for result in results]).astype("datetime64[M]"))
+    counts = np.zeros((len(months), len(EMOTIONS)), dtype=np.int64)
+    totals = np.zeros((len(months), len(EMOTIONS)))
+    for result_months, result_counts, result_totals in results:
+        positions = np.searchsorted(months, result_months)
+        np.add.at(counts, positions, result_counts)
+        np.add.at(totals, positions, result_totals)
+    return months, counts, totals
@@ -0,0 +1,68 @@
+# 💸 FinAura display formatting – whole-column currency, date and mood formatting
+
+from functools import lru_cache
+from typing import Callable, List
+
+import numpy as np
+
+from finaura.ledger import CATEGORIES
+
+CURRENCY_SYMBOLS = {'USD': '$', 'PKR': 'Rs', 'EUR': '€'}
+
+# What goes in front of the number when a value is displayed
+CURRENCY_PREFIXES = {'USD': '$', 'PKR': 'PKR ', 'EUR': '€'}
+
+CATEGORY_LABELS = np.array([category.value for category in CATEGORIES], dtype=object)
+
+MOOD_POSITIVE = '😊'
+MOOD_NEUTRAL = '😐'
+MOOD_NEGATIVE = '😔'
+
+
+@lru_cache(maxsize=32)
+def money_template(currency: str, decimals: int) -> Callable[[float], str]:
+    """Bound str.format for one (currency, decimals) pair, e.g. '€{:,.2f}'.format"""
+    return (CURRENCY_PREFIXES.get(currency, '$') + '{:,.%df}' % decimals).format
+
+
+def clean_amounts(amounts) -> np.ndarray:
+    """float64 copy with NaN/inf replaced by 0, like format_currency always did"""
+    return np.nan_to_num(np.asarray(amounts, dtype=np.float64), nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def format_money(amount: float, currency: str, rate: float, decimals: int = 2) -> str:
+    """Scalar version of format_amounts()"""
+    value = float(amount or 0.0)
+    if value != value or value in (float('inf'), float('-inf')):
+        value = 0.0
+    return money_template(currency, decimals)(value * rate)
+
+
+def format_amounts(amounts, currency: str, rate, decimals: int = 2) -> List[str]:
+    """Convert a whole amount column in one NumPy step, then format it
+
+    `rate` may be a scalar or a per-row array (historical rates).
+    """
+    values = clean_amounts(amounts) * rate
+    return list(map(money_template(currency, decimals), values.tolist()))
+
+
+def format_dates(dates_us: np.ndarray, date_format: str = '%m/%d') -> List[str]:
+    """Format int64 epoch-microsecond dates; '%m/%d' is computed with integer math"""
+    stamps = np.asarray(dates_us, dtype=np.int64).astype('datetime64[us]')
+    if date_format == '%m/%d':
+        days = stamps.astype('datetime64[D]')
+        months = days.astype('datetime64[M]')
+        month_numbers = months.astype(np.int64) % 12 + 1
+        day_numbers = (days - months).astype(np.int64) + 1
+        return [f"{month:02d}/{day:02d}" for month, day in zip(month_numbers.tolist(), day_numbers.tolist())]
+    return [value.strftime(date_format) for value in stamps.tolist()]
+
+
+def mood_emojis(vibe_impacts) -> np.ndarray:
+    vibes = np.asarray(vibe_impacts, dtype=np.float64)
+    return np.where(vibes > 0, MOOD_POSITIVE, np.where(vibes == 0, MOOD_NEUTRAL, MOOD_NEGATIVE))
+
+
+def category_labels(category_codes) -> np.ndarray:
+    return CATEGORY_LABELS[np.asarray(category_codes, dtype=np.intp)]
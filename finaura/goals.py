@@ -0,0 +1,219 @@
+# 💸 FinAura goal portfolio – splits monthly savings across many goals by priority and deadline
+
+import bisect
+import heapq
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+AVERAGE_MONTH_DAYS = 365.25 / 12
+WEEKS_PER_MONTH = 52 / 12
+
+# Lower is funded first
+PRIORITIES = {"🔥 High Priority": 0, "⚡ Medium Priority": 1, "💫 Low Priority": 2}
+
+# Pre-defined common goals (target amount; 0 means the user types their own), shared read-only
+COMMON_GOALS = MappingProxyType({
+    "🏖️ Dream Vacation": 3000,
+    "🚗 Car Down Payment": 5000,
+    "🏠 House Down Payment": 40000,
+    "💻 New Laptop/Setup": 2000,
+    "📚 Education/Certification": 5000,
+    "💍 Wedding Fund": 20000,
+    "🎂 Custom Goal": 0,
+})
+
+
+@dataclass
+class SavingsGoal:
+    name: str
+    target: float
+    deadline: date
+    priority: int = 1
+    saved: float = 0.0
+    created: datetime = field(default_factory=datetime.now)
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.target - self.saved)
+
+    @property
+    def progress(self) -> float:
+        return min(1.0, self.saved / self.target) if self.target > 0 else 1.0
+
+    def months_left(self, today: date) -> float:
+        """Months until the deadline, at least one so an overdue goal asks for the rest now"""
+        return max(1.0, (self.deadline - today).days / AVERAGE_MONTH_DAYS)
+
+    def required_monthly(self, today: date) -> float:
+        return self.remaining / self.months_left(today)
+
+
+@dataclass
+class GoalAllocation:
+    goal_id: str
+    required: float  # monthly amount that meets the deadline
+    allocated: float  # monthly amount the budget actually covers
+
+    @property
+    def feasible(self) -> bool:
+        return self.allocated + 0.005 >= self.required
+
+    @property
+    def shortfall(self) -> float:
+        return max(0.0, self.required - self.allocated)
+
+    def months_to_finish(self, remaining: float) -> float:
+        if remaining <= 0:
+            return 0.0
+        return remaining / self.allocated if self.allocated > 0 else float("inf")
+
+
+class GoalPortfolio:
+    """Many savings goals sharing one monthly budget
+
+    Goals are funded tier by tier (high, medium, low priority). Within a tier a heap
+    ordered by deadline hands out each goal's required monthly amount, earliest deadline
+    first, until the budget runs out; whatever is left after every goal is `unallocated`.
+    The resulting funding order and the budget left before each goal are kept, so a
+    change to one goal only recomputes from its (old or new) position onward, and stops
+    as soon as the budget left matches the previous run again.
+    """
+
+    def __init__(self, monthly_budget: float = 0.0):
+        self.goals: Dict[str, SavingsGoal] = {}
+        self.monthly_budget = monthly_budget
+        self.version = 0
+        self._today: Optional[date] = None
+        self._order: List[Tuple[int, date, datetime, str]] = []  # (priority, deadline, created, id) in funding order
+        self._budget_before: List[float] = []
+        self._allocations: Dict[str, GoalAllocation] = {}
+        self.recomputed = 0  # goals recomputed by the last change (for the debug panel)
+
+    # -------------------------------------------------------------------------
+    # Mutation
+    # -------------------------------------------------------------------------
+
+    def add(self, goal: SavingsGoal) -> SavingsGoal:
+        self.goals[goal.id] = goal
+        self._reposition(goal.id, None)
+        return goal
+
+    def update(self, goal_id: str, **changes) -> SavingsGoal:
+        goal = self.goals[goal_id]
+        old_key = self._sort_key(goal)
+        for name, value in changes.items():
+            setattr(goal, name, value)
+        self._reposition(goal_id, old_key)
+        return goal
+
+    def remove(self, goal_id: str):
+        goal = self.goals.pop(goal_id)
+        key = self._sort_key(goal)
+        position = bisect.bisect_left(self._order, key)
+        if self._today is not None:
+            del self._order[position]
+            del self._budget_before[position]
+            self._allocations.pop(goal_id, None)
+            self._recompute_from(position)
+        self.version += 1
+
+    def set_budget(self, monthly_budget: float):
+        if monthly_budget != self.monthly_budget:
+            self.monthly_budget = monthly_budget
+            if self._today is not None:
+                self._recompute_from(0)
+            self.version += 1
+
+    # -------------------------------------------------------------------------
+    # Allocation
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _sort_key(goal: SavingsGoal) -> Tuple[int, date, datetime, str]:
+        return goal.priority, goal.deadline, goal.created, goal.id
+
+    def allocate(self, today: Optional[date] = None) -> Dict[str, GoalAllocation]:
+        """Allocation for every goal, recomputed in full only when the date changes"""
+        today = today or date.today()
+        if today != self._today:
+            self._full_allocation(today)
+        return self._allocations
+
+    def _full_allocation(self, today: date):
+        self._today = today
+        tiers: Dict[int, List[Tuple[date, datetime, str]]] = {}
+        for goal in self.goals.values():
+            tiers.setdefault(goal.priority, []).append((goal.deadline, goal.created, goal.id))
+        self._order, self._budget_before, self._allocations = [], [], {}
+        budget = self.monthly_budget
+        for priority in sorted(tiers):
+            heap = tiers[priority]
+            heapq.heapify(heap)
+            while heap:
+                deadline, created, goal_id = heapq.heappop(heap)
+                self._order.append((priority, deadline, created, goal_id))
+                self._budget_before.append(budget)
+                budget = self._fund(goal_id, budget)
+        self.recomputed = len(self._order)
+
+    def _fund(self, goal_id: str, budget: float) -> float:
+        """Give one goal what it needs (or what is left) and return the remaining budget"""
+        required = self.goals[goal_id].required_monthly(self._today)
+        allocated = min(required, max(0.0, budget))
+        self._allocations[goal_id] = GoalAllocation(goal_id, required, allocated)
+        return budget - allocated
+
+    def _reposition(self, goal_id: str, old_key: Optional[Tuple[int, date, datetime, str]]):
+        self.version += 1
+        if self._today is None:
+            return
+        start = len(self._order)
+        if old_key is not None:
+            start = bisect.bisect_left(self._order, old_key)
+            del self._order[start]
+            del self._budget_before[start]
+        key = self._sort_key(self.goals[goal_id])
+        position = bisect.bisect_left(self._order, key)
+        self._order.insert(position, key)
+        self._budget_before.insert(position, 0.0)
+        self._recompute_from(min(start, position), force=position)
+
+    def _recompute_from(self, start: int, force: Optional[int] = None):
+        """Re-fund goals from `start` on, stopping once the budget left matches the last run"""
+        budget = self._budget_before[start - 1] - self._allocations[self._order[start - 1][-1]].allocated \
+            if start > 0 else self.monthly_budget
+        settled_after = start if force is None else max(start, force)
+        recomputed = 0
+        for position in range(start, len(self._order)):
+            if position > settled_after and abs(self._budget_before[position] - budget) < 1e-9:
+                break
+            self._budget_before[position] = budget
+            budget = self._fund(self._order[position][-1], budget)
+            recomputed += 1
+        self.recomputed = recomputed
+
+    def funding_order(self) -> List[SavingsGoal]:
+        """Goals in the order the budget reaches them"""
+        self.allocate(self._today)
+        return [self.goals[key[-1]] for key in self._order]
+
+    @property
+    def unallocated(self) -> float:
+        self.allocate(self._today)
+        spent = sum(allocation.allocated for allocation in self._allocations.values())
+        return max(0.0, self.monthly_budget - spent)
+
+    def preview(self, goal: SavingsGoal, today: Optional[date] = None) -> GoalAllocation:
+        """What a not-yet-added goal would get, without changing the portfolio"""
+        trial = GoalPortfolio(self.monthly_budget)
+        trial.goals = dict(self.goals)
+        trial.goals[goal.id] = goal
+        return trial.allocate(today or self._today or date.today())[goal.id]
+
+
+def deadline_in(months: float, today: Optional[date] = None) -> date:
+    return (today or date.today()) + timedelta(days=round(months * AVERAGE_MONTH_DAYS))
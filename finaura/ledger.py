@@ -0,0 +1,483 @@
+# 💸 FinAura columnar ledger – array-backed transaction store with NumPy aggregates
+
+import itertools
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from finaura.aggregates import LedgerAggregates
+from finaura.models import SpendingCategory, Transaction
+from finaura.timeseries import SpendTimeline
+
+# Dates are stored as int64 microseconds since this (naive, local) epoch
+EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Process-wide so a freshly loaded ledger never reuses a version an older one had
+_versions = itertools.count(1)
+
+CATEGORIES: List[SpendingCategory] = list(SpendingCategory)
+CATEGORY_CODES: Dict[SpendingCategory, int] = {category: code for code, category in enumerate(CATEGORIES)}
+
+# Currency code 0; amounts in any other currency are converted through usd_rates
+BASE_CURRENCY = 'USD'
+
+COLUMNS = ("_amounts", "_dates", "_categories", "_vibes", "_merchant_ids", "_currencies")
+
+
+def to_epoch_us(value: datetime) -> int:
+    return (value - EPOCH) // ONE_MICROSECOND
+
+
+def from_epoch_us(value: int) -> datetime:
+    return EPOCH + timedelta(microseconds=int(value))
+
+
+class ColumnarLedger:
+    """Transactions stored column by column in growable NumPy arrays
+
+    amounts are float64, dates int64 epoch microseconds, categories int8 codes into
+    CATEGORIES, vibe impacts float32, merchants int32 ids into an interned table and
+    currencies int8 codes into `currencies` (amounts stay in the currency they were spent in).
+    Indexing returns a Transaction view so row-at-a-time code keeps working. Whole-ledger
+    stats come from `aggregates`, which every append/replace/remove updates in O(1), and are
+    reported in USD using `usd_rates` (units of currency per USD, one factor per currency).
+    `timeline` keeps the same amounts bucketed per day for windowed queries.
+    `version` changes on every mutation, so it can key caches of derived data.
+
+    spill() drops the oldest rows from memory once they are safely on disk; aggregates
+    and the timeline keep counting them, row-level reads only see the resident rows.
+    """
+
+    def __init__(self, capacity: int = 64):
+        capacity = max(capacity, 1)
+        self._size = 0
+        self._amounts = np.zeros(capacity, dtype=np.float64)
+        self._dates = np.zeros(capacity, dtype=np.int64)
+        self._categories = np.zeros(capacity, dtype=np.int8)
+        self._vibes = np.zeros(capacity, dtype=np.float32)
+        self._merchant_ids = np.zeros(capacity, dtype=np.int32)
+        self._currencies = np.zeros(capacity, dtype=np.int8)
+        self.ids: List[str] = []
+        self.descriptions: List[str] = []
+        self.merchants: List[str] = []
+        self._merchant_lookup: Dict[str, int] = {}
+        self._id_lookup: Dict[str, int] = {}
+        self.currencies: List[str] = [BASE_CURRENCY]
+        self._currency_lookup: Dict[str, int] = {BASE_CURRENCY: 0}
+        self.usd_rates: Dict[str, float] = {BASE_CURRENCY: 1.0}
+        self.aggregates = LedgerAggregates(len(CATEGORIES))
+        self.timeline = SpendTimeline(len(CATEGORIES))
+        self.spilled_rows = 0
+        self._spilled_min = np.full(len(CATEGORIES), np.inf)
+        self._spilled_max = np.full(len(CATEGORIES), -np.inf)
+        self._string_bytes = 0  # sys.getsizeof of every id and description, kept as rows change
+        self.version = next(_versions)
+
+    # -------------------------------------------------------------------------
+    # Construction
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[Transaction]) -> "ColumnarLedger":
+        transactions = list(transactions)
+        ledger = cls(capacity=len(transactions))
+        ledger.extend(transactions)
+        return ledger
+
+    @classmethod
+    def from_columns(cls, ids: Sequence[str], dates_us: np.ndarray, amounts: np.ndarray,
+                     descriptions: Sequence[str], category_codes: np.ndarray,
+                     merchants: Sequence[str], vibe_impacts: np.ndarray,
+                     currencies: Optional[Sequence[str]] = None) -> "ColumnarLedger":
+        """Build a ledger straight from column data (e.g. a SQLite fetch) without per-row objects"""
+        size = len(ids)
+        ledger = cls(capacity=size)
+        ledger._amounts[:size] = amounts
+        ledger._dates[:size] = dates_us
+        ledger._categories[:size] = category_codes
+        ledger._vibes[:size] = vibe_impacts
+        merchant_lookup = {raw: ledger._intern_merchant(raw or "") for raw in set(merchants)}
+        ledger._merchant_ids[:size] = [merchant_lookup[raw] for raw in merchants]
+        if currencies is not None:
+            currency_lookup = {raw: ledger._intern_currency(raw) for raw in set(currencies)}
+            ledger._currencies[:size] = [currency_lookup[raw] for raw in currencies]
+        ledger.ids = list(ids)
+        ledger.descriptions = list(descriptions)
+        ledger._id_lookup = {txn_id: index for index, txn_id in enumerate(ledger.ids)}
+        ledger._string_bytes = sum(map(sys.getsizeof, ledger.ids)) + sum(map(sys.getsizeof, ledger.descriptions))
+        ledger._size = size
+        ledger.aggregates = LedgerAggregates.from_columns(
+            len(CATEGORIES), ledger.category_codes, ledger.amounts, ledger.vibe_impacts, ledger.currency_codes
+        )
+        ledger.timeline = SpendTimeline.from_columns(
+            len(CATEGORIES), ledger.dates, ledger.category_codes, ledger.amounts, ledger.currency_codes
+        )
+        return ledger
+
+    def _intern_merchant(self, merchant: str) -> int:
+        merchant_id = self._merchant_lookup.get(merchant)
+        if merchant_id is None:
+            merchant_id = len(self.merchants)
+            self.merchants.append(merchant)
+            self._merchant_lookup[merchant] = merchant_id
+        return merchant_id
+
+    def _intern_currency(self, currency: Optional[str]) -> int:
+        currency = (currency or BASE_CURRENCY).upper()
+        code = self._currency_lookup.get(currency)
+        if code is None:
+            code = len(self.currencies)
+            self.currencies.append(currency)
+            self._currency_lookup[currency] = code
+        return code
+
+    def _grow(self, needed: int):
+        capacity = len(self._amounts)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for name in COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def _write(self, index: int, transaction: Transaction):
+        self._amounts[index] = transaction.amount or 0.0
+        self._dates[index] = to_epoch_us(transaction.date)
+        self._categories[index] = CATEGORY_CODES.get(transaction.category, 0)
+        self._vibes[index] = transaction.vibe_impact or 0.0
+        self._merchant_ids[index] = self._intern_merchant(transaction.merchant or "")
+        self._currencies[index] = self._intern_currency(transaction.currency)
+        self.aggregates.add(int(self._categories[index]), float(self._amounts[index]),
+                            float(self._vibes[index]), int(self._currencies[index]))
+        self.timeline.add(int(self._dates[index]), int(self._categories[index]),
+                          float(self._amounts[index]), int(self._currencies[index]))
+
+    def _forget(self, index: int):
+        self.aggregates.remove(int(self._categories[index]), float(self._amounts[index]),
+                               float(self._vibes[index]), int(self._currencies[index]))
+        self.timeline.remove(int(self._dates[index]), int(self._categories[index]),
+                             float(self._amounts[index]), int(self._currencies[index]))
+
+    # -------------------------------------------------------------------------
+    # Mutation
+    # -------------------------------------------------------------------------
+
+    def append(self, transaction: Transaction) -> int:
+        self._grow(self._size + 1)
+        index = self._size
+        self._write(index, transaction)
+        self.ids.append(transaction.id)
+        self.descriptions.append(transaction.description)
+        self._id_lookup[transaction.id] = index
+        self._string_bytes += sys.getsizeof(transaction.id) + sys.getsizeof(transaction.description)
+        self._size += 1
+        self.version = next(_versions)
+        return index
+
+    def extend(self, transactions: Iterable[Transaction]):
+        for transaction in transactions:
+            self.append(transaction)
+
+    def merge(self, other: "ColumnarLedger"):
+        """Add every row of another ledger (e.g. a freshly imported statement), keeping date order
+
+        Its spilled rows (see add_history) stay spilled here too.
+
+        The rows must not be in this ledger yet; they may come in any order. Columns are
+        concatenated once and the other ledger's aggregates and day buckets are folded in
+        per currency, so nothing is done per row in Python. Unless every new row is newer
+        than this ledger's rows and already in order, one stable sort by date puts them in place.
+        """
+        if not len(other):
+            return
+        currency_map = np.array([self._intern_currency(currency) for currency in other.currencies], dtype=np.int8)
+        merchant_map = np.array([self._intern_merchant(merchant) for merchant in other.merchants], dtype=np.int32)
+        incoming = {
+            "_amounts": other.amounts, "_dates": other.dates, "_categories": other.category_codes,
+            "_vibes": other.vibe_impacts, "_merchant_ids": merchant_map[other.merchant_ids],
+            "_currencies": currency_map[other.currency_codes],
+        }
+        size = self._size + len(other)
+        interleaved = bool(np.any(np.diff(other.dates) < 0)) or \
+            (self._size and int(other.dates[0]) < int(self.dates.max()))
+        order = np.argsort(np.concatenate([self.dates, other.dates]), kind="stable") if interleaved else None
+        for name in COLUMNS:
+            column = np.concatenate([getattr(self, name)[:self._size], incoming[name]])
+            setattr(self, name, column if order is None else column[order])
+        if order is None:
+            self._id_lookup.update((txn_id, self._size + index) for index, txn_id in enumerate(other.ids))
+            self.ids.extend(other.ids)
+            self.descriptions.extend(other.descriptions)
+        else:
+            ids, descriptions = self.ids + other.ids, self.descriptions + other.descriptions
+            self.ids = [ids[position] for position in order.tolist()]
+            self.descriptions = [descriptions[position] for position in order.tolist()]
+            self._id_lookup = {txn_id: index for index, txn_id in enumerate(self.ids)}
+        self._string_bytes += other._string_bytes
+        self._size = size
+        self.aggregates.merge(other.aggregates, currency_map)
+        self.timeline.merge(other.timeline, currency_map)
+        self.spilled_rows += other.spilled_rows
+        np.minimum(self._spilled_min, other._spilled_min, out=self._spilled_min)
+        np.maximum(self._spilled_max, other._spilled_max, out=self._spilled_max)
+        self.version = next(_versions)
+
+    def replace(self, index: int, transaction: Transaction) -> Transaction:
+        """Overwrite one row in place and return the previous version"""
+        previous = self.get(index)
+        index = self._normalize(index)
+        self._forget(index)
+        self._write(index, transaction)
+        del self._id_lookup[self.ids[index]]
+        self._string_bytes += sys.getsizeof(transaction.id) + sys.getsizeof(transaction.description) \
+            - sys.getsizeof(self.ids[index]) - sys.getsizeof(self.descriptions[index])
+        self.ids[index] = transaction.id
+        self.descriptions[index] = transaction.description
+        self._id_lookup[transaction.id] = index
+        self.version = next(_versions)
+        return previous
+
+    def remove(self, index: int) -> Transaction:
+        """Delete one row (O(n) shift) and return it"""
+        removed = self.get(index)
+        index = self._normalize(index)
+        self._forget(index)
+        for name in COLUMNS:
+            column = getattr(self, name)
+            column[index:self._size - 1] = column[index + 1:self._size]
+        self._string_bytes -= sys.getsizeof(self.ids[index]) + sys.getsizeof(self.descriptions[index])
+        del self.ids[index]
+        del self.descriptions[index]
+        self._size -= 1
+        self._id_lookup = {txn_id: position for position, txn_id in enumerate(self.ids)}
+        self.version = next(_versions)
+        return removed
+
+    def spill(self, count: int) -> Dict[str, np.ndarray]:
+        """Drop the `count` oldest rows (by date) from memory and return their numeric columns
+
+        Only for rows that are already persisted (the LedgerStore holds every row the app
+        loads or adds). totals, counts and day buckets keep including them and each
+        category's min/max is folded in, so aggregates stay whole-history; indexing,
+        columns and index_of() cover the resident rows only. Rows added out of date order
+        (a back-dated purchase) are found through a stable sort by date; the result's
+        'positions' are the dropped rows' indexes before the spill, ascending. The columns
+        are reallocated at the new size so the memory is actually released.
+        """
+        count = min(max(count, 0), self._size)
+        if not count:
+            return {}
+        dates = self.dates
+        if count == self._size or not np.any(np.diff(dates) < 0):
+            positions = np.arange(count)
+        else:
+            positions = np.sort(np.argsort(dates, kind="stable")[:count])
+        spilled = {
+            'positions': positions,
+            'dates_us': dates[positions],
+            'amounts': self.amounts[positions],
+            'category_codes': self.category_codes[positions],
+            'vibe_impacts': self.vibe_impacts[positions],
+            'currency_codes': self.currency_codes[positions],
+        }
+        codes = spilled['category_codes'].astype(np.intp)
+        np.minimum.at(self._spilled_min, codes, spilled['amounts'])
+        np.maximum.at(self._spilled_max, codes, spilled['amounts'])
+
+        keep = np.ones(self._size, dtype=bool)
+        keep[positions] = False
+        remaining = self._size - count
+        for name in COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(max(remaining, 1), dtype=old.dtype)
+            new[:remaining] = old[:self._size][keep]
+            setattr(self, name, new)
+        kept = keep.tolist()
+        self._string_bytes -= sum(sys.getsizeof(self.ids[index]) + sys.getsizeof(self.descriptions[index])
+                                  for index in positions.tolist())
+        self.ids = [txn_id for txn_id, held in zip(self.ids, kept) if held]
+        self.descriptions = [description for description, held in zip(self.descriptions, kept) if held]
+        self._id_lookup = {txn_id: position for position, txn_id in enumerate(self.ids)}
+        self._size = remaining
+        self.spilled_rows += count
+        self.version = next(_versions)
+        return spilled
+
+    def add_history(self, category_groups: Iterable[tuple], day_groups: Iterable[tuple]):
+        """Count rows that were never loaded (older than a hot-window load) as spilled rows
+
+        category_groups are (category code, currency, rows, amount sum, vibe sum, positive
+        vibes, min amount, max amount) and day_groups (epoch day, currency, category code,
+        rows, amount sum), as summed by SQL over those rows.
+        """
+        for code, currency, count, total, vibe_sum, positive_vibes, low, high in category_groups:
+            self.aggregates.add_group(code, self._intern_currency(currency), count, total, vibe_sum, positive_vibes)
+            self._spilled_min[code] = min(self._spilled_min[code], low)
+            self._spilled_max[code] = max(self._spilled_max[code], high)
+            self.spilled_rows += count
+        for day, currency, code, count, total in day_groups:
+            self.timeline.add_group(day, code, count, total, self._intern_currency(currency))
+        self.version = next(_versions)
+
+    def spillable(self, before_us: int) -> int:
+        """How many resident rows are dated before `before_us` (the most spill() may drop for that bound)"""
+        return int(np.count_nonzero(self.dates < before_us))
+
+    def index_of(self, transaction_id: str) -> Optional[int]:
+        return self._id_lookup.get(transaction_id)
+
+    # -------------------------------------------------------------------------
+    # Column views (length == len(self), no copies)
+    # -------------------------------------------------------------------------
+
+    @property
+    def amounts(self) -> np.ndarray:
+        return self._amounts[:self._size]
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self._dates[:self._size]
+
+    @property
+    def category_codes(self) -> np.ndarray:
+        return self._categories[:self._size]
+
+    @property
+    def vibe_impacts(self) -> np.ndarray:
+        return self._vibes[:self._size]
+
+    @property
+    def merchant_ids(self) -> np.ndarray:
+        return self._merchant_ids[:self._size]
+
+    @property
+    def currency_codes(self) -> np.ndarray:
+        return self._currencies[:self._size]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the ledger: arrays, string objects and their lists/lookups"""
+        arrays = sum(getattr(self, name).nbytes for name in COLUMNS)
+        strings = self._string_bytes + sum(map(sys.getsizeof, self.merchants))
+        tables = sys.getsizeof(self.ids) + sys.getsizeof(self.descriptions) + sys.getsizeof(self._id_lookup)
+        return arrays + strings + tables
+
+    # -------------------------------------------------------------------------
+    # Transaction views
+    # -------------------------------------------------------------------------
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ledger index out of range")
+        return index
+
+    def get(self, index: int) -> Transaction:
+        index = self._normalize(index)
+        return Transaction(
+            date=from_epoch_us(self._dates[index]),
+            amount=float(self._amounts[index]),
+            description=self.descriptions[index],
+            category=CATEGORIES[self._categories[index]],
+            merchant=self.merchants[self._merchant_ids[index]],
+            vibe_impact=round(float(self._vibes[index]), 6),
+            id=self.ids[index],
+            currency=self.currencies[self._currencies[index]],
+        )
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Transaction, List[Transaction]]:
+        if isinstance(key, slice):
+            return [self.get(index) for index in range(*key.indices(self._size))]
+        return self.get(key)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for index in range(self._size):
+            yield self.get(index)
+
+    # -------------------------------------------------------------------------
+    # Currency conversion (one factor per currency, never per row)
+    # -------------------------------------------------------------------------
+
+    @property
+    def is_single_currency(self) -> bool:
+        """True when every row is in USD, so the plain sums need no conversion"""
+        return all(code == 0 for code in self.aggregates.currency_counts)
+
+    def usd_factors(self) -> np.ndarray:
+        """USD per unit of each interned currency, indexed by currency code"""
+        return np.array([1.0 / (self.usd_rates.get(currency) or 1.0) for currency in self.currencies])
+
+    def usd_amounts(self) -> np.ndarray:
+        """The amount column in USD at the current rates"""
+        if self.is_single_currency:
+            return self.amounts
+        return self.amounts * self.usd_factors()[self.currency_codes]
+
+    # -------------------------------------------------------------------------
+    # Aggregates (O(1) reads from the incremental cache, in USD)
+    # -------------------------------------------------------------------------
+
+    def total(self, category: Optional[SpendingCategory] = None) -> float:
+        code = None if category is None else CATEGORY_CODES[category]
+        if self.is_single_currency:
+            return self.aggregates.total(code)
+        return self.aggregates.converted_total(dict(enumerate(self.usd_factors().tolist())), code)
+
+    def totals_by_category(self) -> np.ndarray:
+        """Spend per category in USD, indexed like CATEGORIES"""
+        if self.is_single_currency:
+            return np.array(self.aggregates.totals)
+        factors = self.usd_factors()
+        return sum((np.array(totals) * factors[currency]
+                    for currency, totals in self.aggregates.currency_totals.items()),
+                   np.zeros(len(CATEGORIES)))
+
+    def counts_by_category(self) -> np.ndarray:
+        return np.array(self.aggregates.counts)
+
+    def mean_amount(self) -> float:
+        count = self.aggregates.count()
+        return self.total() / count if count else 0.0
+
+    def positive_vibe_count(self) -> int:
+        return self.aggregates.positive_vibe_count()
+
+    def top_category(self) -> SpendingCategory:
+        return CATEGORIES[self.aggregates.top_category_code()]
+
+    def amount_range(self, category: SpendingCategory):
+        """(min, max) amount spent in one category, in each row's own currency"""
+        return self.aggregates.extremes(CATEGORY_CODES[category], self._extreme_columns)
+
+    def _extreme_columns(self):
+        """(codes, amounts) of the resident rows plus each category's spilled min and max"""
+        if not self.spilled_rows:
+            return self.category_codes, self.amounts
+        held = np.flatnonzero(np.isfinite(self._spilled_min))
+        codes = held.astype(np.int8)
+        return (np.concatenate([self.category_codes, codes, codes]),
+                np.concatenate([self.amounts, self._spilled_min[held], self._spilled_max[held]]))
+
+    # -------------------------------------------------------------------------
+    # Recent-window helpers (cost depends on the window, not the ledger)
+    # -------------------------------------------------------------------------
+
+    def count_vibe_above(self, threshold: float, last: int) -> int:
+        return int(np.count_nonzero(self.vibe_impacts[-last:] > threshold)) if self._size else 0
+
+    def recent_total(self, last: int) -> float:
+        """USD spent in the last `last` transactions"""
+        if not self._size:
+            return 0.0
+        if self.is_single_currency:
+            return float(self.amounts[-last:].sum())
+        return float((self.amounts[-last:] * self.usd_factors()[self.currency_codes[-last:]]).sum())
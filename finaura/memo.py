@@ -0,0 +1,37 @@
+# 💸 FinAura memoization – size-bounded LRU for derived artifacts (tables, figures, markup)
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class ArtifactCache:
+    """LRU of derived artifacts keyed on (name, ledger/profile version, inputs...)
+
+    Versions only ever increase, so a stale entry is never looked up again; it just ages
+    out once max_entries newer artifacts have been built. hits/misses are kept so the
+    debug panel can show whether a rerun actually skipped the expensive sections.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], Any]) -> Any:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        value = builder()
+        self._entries[key] = value
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
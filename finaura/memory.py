@@ -0,0 +1,97 @@
+# 💸 FinAura session memory budget – spills old ledger rows once a session holds too much
+
+import math
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from finaura.emotions import EMOTION_WINDOWS, EmotionClassifier
+from finaura.ledger import ColumnarLedger, to_epoch_us
+from finaura.storage import LedgerStore
+
+# FINAURA_SESSION_MEMORY_MB caps what one session's ledger and per-row caches may hold
+DEFAULT_BUDGET_MB = float(os.environ.get("FINAURA_SESSION_MEMORY_MB", "256"))
+# Rows from the last HOT_DAYS days always stay resident, so every day window reads plain columns
+DEFAULT_HOT_DAYS = max(days for _, days in EMOTION_WINDOWS.values() if days is not None)
+DEFAULT_MIN_RESIDENT = 1_000  # and so do at least this many of the newest rows
+DEFAULT_LOW_WATERMARK = 0.8  # a spill goes down to this share of the budget, not just under it
+
+
+@dataclass
+class MemoryUsage:
+    ledger_bytes: int
+    classifier_bytes: int
+    budget_bytes: int
+    resident_rows: int
+    spilled_rows: int
+
+    @property
+    def total_bytes(self) -> int:
+        return self.ledger_bytes + self.classifier_bytes
+
+    @property
+    def over_budget(self) -> bool:
+        return self.total_bytes > self.budget_bytes
+
+
+class SessionMemoryBudget:
+    """Keeps one session's ledger (plus its emotion labels) under budget_bytes
+
+    Over budget, the oldest rows are spilled: they stay in the LedgerStore on disk, leave
+    the in-memory columns, and live on only in the aggregates, day buckets and emotion
+    history. load() and merge_statement() never read older rows into memory in the first
+    place: SQLite sums them straight into those structures. Rows inside the hot window
+    (the last hot_days days, and the newest min_resident rows) are never spilled, so
+    recent windows, the last-N-purchase stats and the transaction form keep reading
+    plain columns. When the hot window alone is over budget it stays resident anyway
+    and usage reports over_budget.
+    """
+
+    def __init__(self, budget_mb: float = DEFAULT_BUDGET_MB, hot_days: int = DEFAULT_HOT_DAYS,
+                 min_resident: int = DEFAULT_MIN_RESIDENT, low_watermark: float = DEFAULT_LOW_WATERMARK):
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.hot_days = hot_days
+        self.min_resident = min_resident
+        self.low_watermark = low_watermark
+
+    def cutoff(self, store: LedgerStore, account: str, now: Optional[datetime] = None) -> str:
+        """First ISO date of the account's hot window (see LedgerStore.hot_cutoff)"""
+        return store.hot_cutoff(account, (now or datetime.now()) - timedelta(days=self.hot_days), self.min_resident)
+
+    def load(self, store: LedgerStore, account: str, classifier: EmotionClassifier,
+             now: Optional[datetime] = None) -> ColumnarLedger:
+        """Load only the hot window of an account; older rows arrive already spilled"""
+        cutoff = self.cutoff(store, account, now)
+        ledger = store.load_ledger(account, cutoff)
+        classifier.reset(ledger)
+        if cutoff and ledger.spilled_rows:
+            classifier.add_history(store.emotion_history(account, cutoff, classifier.label), ledger)
+        return ledger
+
+    def merge_statement(self, store: LedgerStore, account: str, id_prefix: str, ledger: ColumnarLedger,
+                        classifier: EmotionClassifier, now: Optional[datetime] = None) -> ColumnarLedger:
+        """Merge a freshly imported statement into a resident ledger, spilling its rows older than the hot window"""
+        cutoff = self.cutoff(store, account, now)
+        imported = store.load_statement(account, id_prefix, cutoff)
+        ledger.merge(imported)
+        if imported.spilled_rows:
+            classifier.add_history(store.emotion_history(account, cutoff, classifier.label, id_prefix), ledger)
+        return imported
+
+    def usage(self, ledger: ColumnarLedger, classifier: EmotionClassifier) -> MemoryUsage:
+        return MemoryUsage(ledger.nbytes, classifier.nbytes, self.budget_bytes, len(ledger), ledger.spilled_rows)
+
+    def enforce(self, ledger: ColumnarLedger, classifier: EmotionClassifier,
+                now: Optional[datetime] = None) -> MemoryUsage:
+        """Spill the oldest rows if the session is over budget; returns the usage afterwards"""
+        usage = self.usage(ledger, classifier)
+        if not usage.over_budget or not len(ledger):
+            return usage
+        bytes_per_row = usage.total_bytes / len(ledger)
+        wanted = math.ceil((usage.total_bytes - self.budget_bytes * self.low_watermark) / bytes_per_row)
+        hot_start = to_epoch_us((now or datetime.now()) - timedelta(days=self.hot_days))
+        count = min(wanted, ledger.spillable(hot_start), len(ledger) - self.min_resident)
+        if count > 0:
+            classifier.spill(ledger, count)
+        return self.usage(ledger, classifier)
@@ -0,0 +1,138 @@
+# 💸 FinAura merchant classifier – learned merchant → category / vibe priors for new rows
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from finaura.ledger import CATEGORIES
+from finaura.models import SpendingCategory
+
+# Card processor prefixes banks put in front of the real merchant ("SQ *BLUE BOTTLE")
+PROCESSOR_PREFIX = re.compile(r"^(?:sq|tst|sp|pp|paypal|pos|dd|ach|chk|purchase)\s*\*+\s*|^pos\s+", re.IGNORECASE)
+STORE_NUMBERS = re.compile(r"#\s*\d+|\b\d+\b|[^\w\s]|_")
+CORPORATE_SUFFIXES = {"inc", "llc", "ltd", "co", "corp", "com", "store", "stores"}
+
+
+def normalize_merchant(name: str) -> str:
+    """'SQ *Blue Bottle Coffee #123, Inc.' -> 'blue bottle coffee'"""
+    name = PROCESSOR_PREFIX.sub("", (name or "").strip())
+    tokens = STORE_NUMBERS.sub(" ", name.lower()).split()
+    while tokens and tokens[-1] in CORPORATE_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+@dataclass
+class MerchantPrior:
+    """How often one merchant was seen in each category, and the average vibe there"""
+    counts: List[int] = field(default_factory=lambda: [0] * len(CATEGORIES))
+    vibe_sum: float = 0.0
+    category_code: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def category(self) -> SpendingCategory:
+        return CATEGORIES[self.category_code]
+
+    @property
+    def vibe_impact(self) -> float:
+        return self.vibe_sum / self.total if self.total else 0.0
+
+    @property
+    def confidence(self) -> float:
+        """Share of this merchant's transactions that were in its predicted category"""
+        return self.counts[self.category_code] / self.total if self.total else 0.0
+
+    def add(self, category_code: int, vibe_impact: float, count: int = 1):
+        self.counts[category_code] += count
+        self.vibe_sum += vibe_impact
+        if self.counts[category_code] > self.counts[self.category_code]:
+            self.category_code = category_code
+
+
+class MerchantIndex:
+    """Normalized merchant name → MerchantPrior, with a token trie for longest-prefix matches
+
+    An exact normalized name is one dict lookup. Names that were never seen fall back to
+    the longest known token prefix ("starbucks reserve seattle" → "starbucks"), one dict
+    step per token. Raw strings are memoized, so a statement that repeats the same few
+    hundred merchants costs one normalization per distinct merchant.
+    """
+
+    def __init__(self, max_memo: int = 50_000):
+        self.priors: Dict[str, MerchantPrior] = {}
+        self._trie: Dict[str, dict] = {}
+        self._memo: Dict[str, Optional[MerchantPrior]] = {}
+        self._max_memo = max_memo
+
+    @classmethod
+    def from_counts(cls, rows: Iterable[Tuple[str, int, int, float]]) -> "MerchantIndex":
+        """Priors from (merchant, category code, rows, vibe sum) groups, e.g. LedgerStore.merchant_counts"""
+        index = cls()
+        index.learn_counts(rows)
+        return index
+
+    def learn_counts(self, rows: Iterable[Tuple[str, int, int, float]]):
+        """Fold (merchant, category code, rows, vibe sum) groups (e.g. an imported statement) into the priors"""
+        for merchant, code, count, vibe_sum in rows:
+            key = normalize_merchant(merchant)
+            if key:
+                prior = self._prior(key)
+                prior.add(code, 0.0, count)
+                prior.vibe_sum += vibe_sum
+
+    def _prior(self, key: str) -> MerchantPrior:
+        prior = self.priors.get(key)
+        if prior is None:
+            prior = self.priors[key] = MerchantPrior()
+            node = self._trie
+            for token in key.split():
+                node = node.setdefault(token, {})
+            node[""] = key
+            self._memo.clear()
+        return prior
+
+    def learn(self, merchant: str, category: SpendingCategory, vibe_impact: float = 0.0):
+        """Fold one new transaction into the priors"""
+        key = normalize_merchant(merchant)
+        if key:
+            self._prior(key).add(CATEGORIES.index(category), vibe_impact)
+
+    def lookup(self, merchant: str) -> Optional[MerchantPrior]:
+        """Prior for a raw merchant string, or None if nothing similar was ever seen"""
+        if merchant in self._memo:
+            return self._memo[merchant]
+        key = normalize_merchant(merchant)
+        prior = self.priors.get(key)
+        if prior is None and key:
+            node, best = self._trie, None
+            for token in key.split():
+                node = node.get(token)
+                if node is None:
+                    break
+                best = node.get("", best)
+            prior = self.priors.get(best) if best else None
+        if len(self._memo) >= self._max_memo:
+            self._memo.clear()
+        self._memo[merchant] = prior
+        return prior
+
+    def classify(self, merchants: Sequence[str], default: SpendingCategory = SpendingCategory.ESSENTIAL
+                 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(category codes, vibe priors, known mask) for a batch of raw merchant strings"""
+        priors = [self.lookup(merchant) for merchant in merchants]
+        known = np.fromiter((prior is not None for prior in priors), dtype=bool, count=len(priors))
+        default_code = CATEGORIES.index(default)
+        codes = np.fromiter((prior.category_code if prior else default_code for prior in priors),
+                            dtype=np.int8, count=len(priors))
+        vibes = np.fromiter((prior.vibe_impact if prior else 0.0 for prior in priors),
+                            dtype=np.float32, count=len(priors))
+        return codes, vibes, known
+
+    def __len__(self) -> int:
+        return len(self.priors)
@@ -0,0 +1,66 @@
+# 💸 FinAura data models shared by the Streamlit app and the storage/analytics layers
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+
+
+class VibeType(Enum):
+    STRESSED = "😩"
+    CONFIDENT = "😎"
+    CONFUSED = "🤔"
+    EXCITED = "🚀"
+    CHILL = "😌"
+    GUILTY = "😬"
+
+class SpendingCategory(Enum):
+    ESSENTIAL = "🏠 Essential"
+    JOY = "✨ Joy"
+    OOPS = "😅 Oops"
+    INVESTMENT = "📈 Investment"
+
+class FinancialGoal(Enum):
+    EMERGENCY_FUND = "🚨 Emergency Fund"
+    TRAVEL = "✈️ Travel Fund"
+    HOUSE_DEPOSIT = "🏡 House Deposit"
+    RETIREMENT = "👴 Future Me Fund"
+    SIDE_HUSTLE = "💼 Side Hustle Capital"
+    EDUCATION = "📚 Skill Up Fund"
+
+@dataclass
+class Transaction:
+    date: datetime
+    amount: float
+    description: str
+    category: SpendingCategory
+    merchant: str = ""
+    vibe_impact: float = 0.0
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    currency: str = 'USD'  # currency the amount was spent in
+
+@dataclass
+class VibeData:
+    current_vibe: VibeType
+    money_stress_level: int
+    spending_guilt: int
+    financial_confidence: int
+
+@dataclass
+class BudgetPlan:
+    monthly_income: float
+    needs_percentage: float = 50.0  # 50/30/20 rule adjusted for Gen Z
+    wants_percentage: float = 30.0
+    savings_percentage: float = 20.0
+    
+    @property
+    def needs_amount(self) -> float:
+        return self.monthly_income * (self.needs_percentage / 100)
+    
+    @property
+    def wants_amount(self) -> float:
+        return self.monthly_income * (self.wants_percentage / 100)
+    
+    @property
+    def savings_amount(self) -> float:
+        return self.monthly_income * (self.savings_percentage / 100)
@@ -0,0 +1,95 @@
+# 💸 FinAura wealth projection – Monte Carlo percentile bands for monthly investing
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Long-run annual (mean return, volatility) assumptions per asset class
+ASSET_ASSUMPTIONS: Dict[str, Tuple[float, float]] = {
+    'stocks': (0.08, 0.16),
+    'bonds': (0.04, 0.06),
+    'cash': (0.02, 0.01),
+}
+
+# Annual return correlations, ordered like ASSET_ASSUMPTIONS
+ASSET_CORRELATIONS = np.array([
+    [1.0, 0.1, 0.0],
+    [0.1, 1.0, 0.2],
+    [0.0, 0.2, 1.0],
+])
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+DEFAULT_PATHS = 10_000
+DEFAULT_SEED = 42
+
+
+@dataclass
+class WealthProjection:
+    months: np.ndarray  # checkpoint months, e.g. 12, 24, ...
+    percentiles: Tuple[int, ...]
+    bands: np.ndarray  # (len(percentiles), len(months)) portfolio value at each checkpoint
+    contributions: np.ndarray  # total paid in by each checkpoint
+    annual_mean: float
+    annual_volatility: float
+
+    def at(self, percentile: int, month: int) -> float:
+        """Portfolio value at one percentile and checkpoint month"""
+        return float(self.bands[self.percentiles.index(percentile), list(self.months).index(month)])
+
+
+def portfolio_assumptions(stock_percent: float, bond_percent: float, cash_percent: float) -> Tuple[float, float]:
+    """(annual mean return, annual volatility) of a portfolio rebalanced to the given split"""
+    weights = np.array([stock_percent, bond_percent, cash_percent], dtype=np.float64)
+    weights = weights / weights.sum() if weights.sum() > 0 else np.array([0.0, 0.0, 1.0])
+    means, vols = np.array(list(ASSET_ASSUMPTIONS.values())).T
+    covariance = ASSET_CORRELATIONS * np.outer(vols, vols)
+    return float(weights @ means), float(np.sqrt(weights @ covariance @ weights))
+
+
+def simulate_wealth(monthly_contribution: float, stock_percent: float, bond_percent: float,
+                    cash_percent: float, years: int = 30, initial: float = 0.0,
+                    paths: int = DEFAULT_PATHS, seed: Optional[int] = DEFAULT_SEED,
+                    percentiles: Sequence[int] = DEFAULT_PERCENTILES,
+                    checkpoint_every: int = 12, chunk_paths: int = 2_500) -> WealthProjection:
+    """Simulate `paths` monthly return paths at once and summarize them as percentile bands
+
+    Monthly portfolio returns are lognormal with the portfolio's mean and volatility.
+    Contributions go in at the start of each month, so with growth G_t (cumulative product
+    of 1 + r) the value after month t is G_t * (initial + c * sum_{k<=t} 1 / G_{k-1}):
+    two cumulative sums over a (paths, months) block instead of a Python loop over months.
+    Paths run in chunks of chunk_paths to bound memory; the same seed gives the same bands.
+    """
+    months = years * 12
+    annual_mean, annual_volatility = portfolio_assumptions(stock_percent, bond_percent, cash_percent)
+    monthly_mean = (1 + annual_mean) ** (1 / 12) - 1
+    monthly_variance = annual_volatility ** 2 / 12
+    sigma = np.sqrt(np.log1p(monthly_variance / (1 + monthly_mean) ** 2))
+    mu = np.log1p(monthly_mean) - sigma ** 2 / 2
+
+    checkpoints = np.arange(checkpoint_every, months + 1, checkpoint_every)
+    rng = np.random.default_rng(seed)
+    values = np.empty((paths, len(checkpoints)))
+    for start in range(0, paths, chunk_paths):
+        stop = min(start + chunk_paths, paths)
+        growth = rng.standard_normal((stop - start, months))
+        growth *= sigma
+        growth += mu
+        np.cumsum(growth, axis=1, out=growth)
+        np.exp(growth, out=growth)
+        # Sum of 1 / G_{k-1} for k = 1..t, where G_0 = 1
+        paid_in = np.empty_like(growth)
+        paid_in[:, 0] = 1.0
+        np.cumsum(1.0 / growth[:, :-1], axis=1, out=paid_in[:, 1:])
+        paid_in[:, 1:] += 1.0
+        at_checkpoints = checkpoints - 1
+        values[start:stop] = growth[:, at_checkpoints] * (initial + monthly_contribution * paid_in[:, at_checkpoints])
+
+    return WealthProjection(
+        months=checkpoints,
+        percentiles=tuple(percentiles),
+        bands=np.percentile(values, percentiles, axis=0),
+        contributions=initial + monthly_contribution * checkpoints,
+        annual_mean=annual_mean,
+        annual_volatility=annual_volatility,
+    )
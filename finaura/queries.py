@@ -0,0 +1,168 @@
+# 💸 FinAura ledger queries – indexed date-range lookups for the dashboard, budgets and coach
+
+import heapq
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from finaura.models import SpendingCategory, Transaction
+from finaura.storage import LedgerStore, category_from_db, category_to_db, row_to_transaction
+
+# All ranges are half-open [start, end) on the ISO date strings, which sort chronologically,
+# so every query below is answered from idx_transactions_account_spend or
+# idx_transactions_category_date instead of a full table scan.
+#
+# Sums are grouped by currency inside SQLite and converted afterwards, one multiply per
+# currency, so mixed-currency ledgers cost the same as single-currency ones.
+
+SPEND_BETWEEN_SQL = """
+SELECT currency, SUM(amount) FROM transactions
+WHERE account = ? AND type = 'expense' AND date >= ? AND date < ?
+GROUP BY currency
+"""
+
+SPEND_BETWEEN_CATEGORY_SQL = """
+SELECT currency, SUM(amount) FROM transactions
+WHERE category = ? AND date >= ? AND date < ? AND account = ? AND type = 'expense'
+GROUP BY currency
+"""
+
+SPEND_BY_CATEGORY_SQL = """
+SELECT category, currency, SUM(amount), COUNT(*) FROM transactions
+WHERE account = ? AND type = 'expense' AND date >= ? AND date < ?
+GROUP BY category, currency
+"""
+
+SPEND_BY_MERCHANT_SQL = """
+SELECT merchant, currency, SUM(amount) FROM transactions
+WHERE account = ? AND type = 'expense' AND date >= ? AND date < ?
+GROUP BY merchant, currency
+"""
+
+TRANSACTIONS_BETWEEN_SQL = """
+SELECT id, date, amount, description, category, merchant, vibe_impact, currency FROM transactions
+WHERE account = ? AND type = 'expense' AND date >= ? AND date < ?
+ORDER BY date
+"""
+
+# ORDER BY clauses for the paginated log; each one walks an (account, ...) index in order,
+# so a page costs page_size rows plus an index skip for the OFFSET, never a sort
+PAGE_ORDERINGS = {
+    "newest": "date DESC",
+    "oldest": "date ASC",
+    "biggest": "amount DESC",
+    "smallest": "amount ASC",
+}
+
+PAGE_SELECT_SQL = """
+SELECT id, date, amount, description, category, merchant, vibe_impact, currency FROM transactions
+WHERE {where}
+ORDER BY {order}
+LIMIT ? OFFSET ?
+"""
+
+PAGE_COUNT_SQL = "SELECT COUNT(*) FROM transactions WHERE {where}"
+
+MERCHANT_SPEND_SQL = """
+SELECT currency, SUM(amount) FROM transactions
+WHERE merchant = ? AND account = ? AND type = 'expense'
+GROUP BY currency
+"""
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat()
+
+
+def _to_usd(currency: Optional[str], amount: Optional[float], usd_rates: Optional[Dict[str, float]]) -> float:
+    """Convert one per-currency sum; usd_rates maps currency -> units per USD"""
+    rate = (usd_rates or {}).get(currency or "USD") or 1.0
+    return float(amount or 0.0) / rate
+
+
+def spend_between(store: LedgerStore, account: str, start: datetime, end: datetime,
+                  category: Optional[SpendingCategory] = None,
+                  usd_rates: Optional[Dict[str, float]] = None) -> float:
+    """Total USD spend in [start, end), optionally for a single category"""
+    if category is None:
+        rows = store.fetchall(SPEND_BETWEEN_SQL, (account, _iso(start), _iso(end)))
+    else:
+        rows = store.fetchall(SPEND_BETWEEN_CATEGORY_SQL, (category_to_db(category), _iso(start), _iso(end), account))
+    return sum(_to_usd(currency, total, usd_rates) for currency, total in rows)
+
+
+def spend_by_category(store: LedgerStore, account: str, start: datetime, end: datetime,
+                      usd_rates: Optional[Dict[str, float]] = None) -> Dict[SpendingCategory, Tuple[float, int]]:
+    """(USD total, count) per category in [start, end); every category is present"""
+    result = {category: (0.0, 0) for category in SpendingCategory}
+    rows = store.fetchall(SPEND_BY_CATEGORY_SQL, (account, _iso(start), _iso(end)))
+    for raw_category, currency, total, count in rows:
+        category = category_from_db(raw_category)
+        prev_total, prev_count = result[category]
+        result[category] = (prev_total + _to_usd(currency, total, usd_rates), prev_count + count)
+    return result
+
+
+def top_merchants(store: LedgerStore, account: str, start: datetime, end: datetime,
+                  limit: int = 5, usd_rates: Optional[Dict[str, float]] = None) -> List[Tuple[str, float]]:
+    """Biggest merchants by USD spend in [start, end)"""
+    totals: Dict[str, float] = {}
+    for merchant, currency, total in store.fetchall(SPEND_BY_MERCHANT_SQL, (account, _iso(start), _iso(end))):
+        merchant = merchant or ""
+        totals[merchant] = totals.get(merchant, 0.0) + _to_usd(currency, total, usd_rates)
+    return heapq.nlargest(limit, totals.items(), key=lambda item: item[1])
+
+
+def merchant_spend(store: LedgerStore, account: str, merchant: str,
+                   usd_rates: Optional[Dict[str, float]] = None) -> float:
+    """Lifetime USD spend at one merchant"""
+    rows = store.fetchall(MERCHANT_SPEND_SQL, (merchant, account))
+    return sum(_to_usd(currency, total, usd_rates) for currency, total in rows)
+
+
+def transactions_between(store: LedgerStore, account: str, start: datetime,
+                         end: datetime) -> List[Transaction]:
+    """Transactions in [start, end), oldest first"""
+    rows = store.fetchall(TRANSACTIONS_BETWEEN_SQL, (account, _iso(start), _iso(end)))
+    return [row_to_transaction(row) for row in rows]
+
+
+def _page_filter(account: str, category: Optional[SpendingCategory],
+                 search: str) -> Tuple[str, Tuple]:
+    clauses = ["account = ?", "type = 'expense'"]
+    params: List = [account]
+    if category is not None:
+        clauses.append("category = ?")
+        params.append(category_to_db(category))
+    if search:
+        clauses.append("(description LIKE ? ESCAPE '\\' OR merchant LIKE ? ESCAPE '\\')")
+        pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        params.extend([pattern, pattern])
+    return " AND ".join(clauses), tuple(params)
+
+
+def transaction_page(store: LedgerStore, account: str, page: int = 0, page_size: int = 25,
+                     order: str = "newest", category: Optional[SpendingCategory] = None,
+                     search: str = "") -> List[Transaction]:
+    """One page of the transaction log, sorted and filtered inside SQLite"""
+    where, params = _page_filter(account, category, search.strip())
+    sql = PAGE_SELECT_SQL.format(where=where, order=PAGE_ORDERINGS[order])
+    rows = store.fetchall(sql, params + (page_size, max(page, 0) * page_size))
+    return [row_to_transaction(row) for row in rows]
+
+
+def count_transactions(store: LedgerStore, account: str, category: Optional[SpendingCategory] = None,
+                       search: str = "") -> int:
+    """Number of rows matching the same filters as transaction_page()"""
+    where, params = _page_filter(account, category, search.strip())
+    return store.fetchone(PAGE_COUNT_SQL.format(where=where), params)[0]
+
+
+def month_bounds(when: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """[first day of the month, first day of next month) for `when` (default: now)"""
+    when = when or datetime.now()
+    start = when.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return start, end
@@ -0,0 +1,173 @@
+# 💸 FinAura exchange rates – local daily rate table with binary-search historical lookups
+
+import csv
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from finaura.ledger import to_epoch_us
+from finaura.storage import LedgerStore
+
+logger = logging.getLogger(__name__)
+
+# Rates are units of currency per 1 USD
+BASE_CURRENCY = 'USD'
+
+# Used when the rate table has nothing for a currency (the app's original example rates)
+DEFAULT_RATES = {'USD': 1.0, 'PKR': 280.0, 'EUR': 0.92}
+
+DEFAULT_RATES_CSV = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "exchange_rates.csv"
+)
+
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+
+US_PER_DAY = 86_400_000_000
+
+RATES_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS exchange_rates (
+    currency TEXT,
+    date TEXT,
+    rate REAL,
+    PRIMARY KEY (currency, date)
+)
+"""
+
+RATES_UPSERT_SQL = "INSERT OR REPLACE INTO exchange_rates (currency, date, rate) VALUES (?, ?, ?)"
+
+RATES_SELECT_SQL = "SELECT currency, date, rate FROM exchange_rates ORDER BY currency, date"
+
+RATES_COUNT_SQL = "SELECT COUNT(*) FROM exchange_rates"
+
+
+def read_rates_csv(path: str) -> Iterable[Tuple[str, str, float]]:
+    """(currency, ISO date, rate) rows from a date,currency,rate CSV; '#' lines are comments"""
+    with open(path, newline="", encoding="utf-8") as handle:
+        lines = (line for line in handle if line.strip() and not line.startswith("#"))
+        for row in csv.DictReader(lines):
+            yield row["currency"].strip().upper(), date.fromisoformat(row["date"].strip()).isoformat(), float(row["rate"])
+
+
+class RateProvider:
+    """Historical exchange rates kept as one sorted (epoch day, rate) array pair per currency
+
+    The arrays are rebuilt from the exchange_rates table once they are older than
+    ttl_seconds and published as one {currency: (days, rates)} dict in a single
+    assignment; each lookup reads that reference once, so a concurrent refresh never
+    pairs one table's days with another's rates. A lookup is a np.searchsorted binary search returning the latest rate
+    on or before the transaction date (the earliest known rate for older dates).
+    """
+
+    def __init__(self, store: LedgerStore, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 seed_csv: Optional[str] = DEFAULT_RATES_CSV):
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._lock = threading.Lock()
+        self._table: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}  # currency -> (epoch days, rates)
+        self._loaded_at = float("-inf")
+        with store.transaction() as conn:
+            conn.execute(RATES_SCHEMA_SQL)
+        if seed_csv and os.path.exists(seed_csv) and store.fetchone(RATES_COUNT_SQL)[0] == 0:
+            self.import_csv(seed_csv)
+
+    def import_csv(self, path: str) -> int:
+        rows = list(read_rates_csv(path))
+        with self.store.transaction() as conn:
+            conn.executemany(RATES_UPSERT_SQL, rows)
+        self.invalidate()
+        return len(rows)
+
+    def set_rate(self, currency: str, on: date, rate: float):
+        with self.store.transaction() as conn:
+            conn.execute(RATES_UPSERT_SQL, (currency.upper(), on.isoformat(), float(rate)))
+        self.invalidate()
+
+    def invalidate(self):
+        self._loaded_at = float("-inf")
+
+    def _refresh(self):
+        if time.monotonic() - self._loaded_at < self.ttl_seconds:
+            return
+        with self._lock:
+            if time.monotonic() - self._loaded_at < self.ttl_seconds:
+                return
+            grouped: Dict[str, Tuple[list, list]] = {}
+            for currency, day, rate in self.store.fetchall(RATES_SELECT_SQL):
+                days, rates = grouped.setdefault(currency, ([], []))
+                days.append(day)
+                rates.append(rate)
+            self._table = {
+                currency: (np.array(days, dtype="datetime64[D]").astype(np.int64), np.array(rates, dtype=np.float64))
+                for currency, (days, rates) in grouped.items()
+            }
+            self._loaded_at = time.monotonic()
+            self.version += 1
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def latest_rate(self, currency: str) -> float:
+        if currency == BASE_CURRENCY:
+            return 1.0
+        self._refresh()
+        _, rates = self._table.get(currency, (None, None))
+        return float(rates[-1]) if rates is not None and len(rates) else DEFAULT_RATES.get(currency, 1.0)
+
+    def latest_rates(self) -> Dict[str, float]:
+        return {currency: self.latest_rate(currency) for currency in DEFAULT_RATES}
+
+    def rates_for(self, currency: str, dates_us: np.ndarray) -> np.ndarray:
+        """Rate in effect on each date (int64 epoch microseconds), as a float64 array"""
+        dates_us = np.asarray(dates_us, dtype=np.int64)
+        if currency == BASE_CURRENCY:
+            return np.ones(len(dates_us))
+        self._refresh()
+        days, rates = self._table.get(currency, (None, None))
+        if days is None or not len(days):
+            return np.full(len(dates_us), DEFAULT_RATES.get(currency, 1.0))
+        positions = np.searchsorted(days, dates_us // US_PER_DAY, side="right") - 1
+        return rates[np.clip(positions, 0, len(rates) - 1)]
+
+    def rate_on(self, currency: str, when: datetime) -> float:
+        return float(self.rates_for(currency, np.array([to_epoch_us(when)]))[0])
+
+    def convert(self, amounts: np.ndarray, dates_us: np.ndarray, currency: str,
+                currency_codes: Optional[np.ndarray] = None,
+                currencies: Sequence[str] = (BASE_CURRENCY,)) -> np.ndarray:
+        """Amounts in `currency`, each converted at the rates of its own transaction date
+
+        Source currencies come from currency_codes (indexes into `currencies`; all USD when
+        omitted). Rows are grouped by source currency so each group costs two searchsorted
+        lookups, however many rows it has.
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        dates_us = np.asarray(dates_us, dtype=np.int64)
+        if currency_codes is None:
+            currency_codes = np.zeros(len(amounts), dtype=np.int8)
+        converted = np.empty(len(amounts))
+        target_rates = self.rates_for(currency, dates_us)
+        for code in np.unique(currency_codes).tolist():
+            source = currencies[code]
+            rows = currency_codes == code
+            if source == currency:
+                converted[rows] = amounts[rows]
+            else:
+                converted[rows] = amounts[rows] * target_rates[rows] / self.rates_for(source, dates_us[rows])
+        return converted
+
+    def today_equivalent(self, amounts: np.ndarray, dates_us: np.ndarray, currency: str,
+                         currency_codes: Optional[np.ndarray] = None,
+                         currencies: Sequence[str] = (BASE_CURRENCY,)) -> np.ndarray:
+        """Amounts re-expressed as 'USD at today's rate'
+
+        format_currency() multiplies by latest_rate(), so formatting these values shows each
+        amount converted at the rate of its own transaction date.
+        """
+        return self.convert(amounts, dates_us, currency, currency_codes, currencies) / self.latest_rate(currency)
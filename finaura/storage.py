@@ -0,0 +1,769 @@
+# 💸 FinAura persistent ledger – SQLite storage on top of the finsphere.db schema
+
+import os
+import sqlite3
+import threading
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from finaura.ledger import CATEGORY_CODES, ColumnarLedger
+from finaura.models import SpendingCategory, Transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.environ.get(
+    "FINAURA_DB_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "finsphere.db")
+)
+
+# Rows written per executemany() call / SQLite transaction (and store lock hold) during bulk loads
+DEFAULT_BATCH_SIZE = 5000
+
+# bulk_load() drops and rebuilds the secondary indexes once a load adds at least this
+# share of the rows already in the table: one sorted rebuild beats that many random inserts
+BULK_REINDEX_SHARE = 0.25
+
+# Legacy category labels already present in finsphere.db, mapped onto the app's vibes
+LEGACY_CATEGORY_MAP = {
+    "food": SpendingCategory.ESSENTIAL,
+    "transport": SpendingCategory.ESSENTIAL,
+    "major_expense": SpendingCategory.ESSENTIAL,
+    "entertainment": SpendingCategory.JOY,
+    "miscellaneous": SpendingCategory.OOPS,
+    "investment": SpendingCategory.INVESTMENT,
+}
+
+# =============================================================================
+# SQL STATEMENTS (constant strings so sqlite3 reuses its prepared statements)
+# =============================================================================
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT PRIMARY KEY,
+    date TEXT,
+    amount REAL,
+    description TEXT,
+    category TEXT,
+    account TEXT,
+    type TEXT,
+    merchant TEXT
+)
+"""
+
+# Secondary indexes for the date-range / category / merchant queries in finaura.queries
+INDEX_SQL = [
+    "CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (date)",
+    "CREATE INDEX IF NOT EXISTS idx_transactions_category_date ON transactions (category, date)",
+    "CREATE INDEX IF NOT EXISTS idx_transactions_merchant ON transactions (merchant)",
+    # Trailing columns make this index covering for the per-account, per-currency spend sums
+    "DROP INDEX IF EXISTS idx_transactions_account_date",
+    "CREATE INDEX IF NOT EXISTS idx_transactions_account_spend"
+    " ON transactions (account, date, type, category, currency, amount)",
+    "CREATE INDEX IF NOT EXISTS idx_transactions_account_amount ON transactions (account, amount)",
+]
+
+# Names of the INDEX_SQL indexes, which bulk_load() may drop for the length of a load
+SECONDARY_INDEXES = [statement.split()[5] for statement in INDEX_SQL if statement.startswith("CREATE")]
+
+INSERT_SQL = """
+INSERT OR REPLACE INTO transactions
+    (id, date, amount, description, category, account, type, merchant, vibe_impact, currency, category_inferred)
+VALUES (?, ?, ?, ?, ?, ?, 'expense', ?, ?, ?, ?)
+"""
+
+# write_rows() path for ids not in the table yet: no delete/replace bookkeeping
+INSERT_FRESH_SQL = """
+INSERT INTO transactions
+    (id, date, amount, description, category, account, type, merchant, vibe_impact, currency, category_inferred)
+VALUES (?, ?, ?, ?, ?, ?, 'expense', ?, ?, ?, ?)
+"""
+
+# Rows a write_rows() batch is about to replace; chunked to stay under SQLite's variable limit
+EXISTING_CHUNK = 500
+EXISTING_SQL = (
+    "SELECT id, date, amount, category, account, currency, type FROM transactions WHERE id IN ({})"
+)
+
+# Same lookup for a batch whose ids ascend (statement imports): one primary-key range scan
+EXISTING_RANGE_SQL = (
+    "SELECT id, date, amount, category, account, currency, type FROM transactions WHERE id BETWEEN ? AND ?"
+)
+
+SELECT_ACCOUNT_SQL = """
+SELECT id, date, amount, description, category, merchant, vibe_impact, currency
+FROM transactions
+WHERE account = ? AND type = 'expense'
+ORDER BY date
+"""
+
+# =============================================================================
+# HOT-WINDOW LOADS – resident rows from a cutoff date on, older rows as GROUP BY sums
+# =============================================================================
+
+# Date of the account's n-th newest row (OFFSET n - 1), a walk down the account_spend index
+HOT_CUTOFF_SQL = """
+SELECT date FROM transactions WHERE account = ? AND type = 'expense' ORDER BY date DESC LIMIT 1 OFFSET ?
+"""
+
+# Row scopes: a whole account, or one imported statement as a primary-key range over its
+# id prefix (+account keeps the planner off the account indexes, which would scan the account)
+SCOPE_FILTERS = {
+    "account": "account = ? AND type = 'expense'",
+    "statement": "id >= ? AND id < ? AND +account = ? AND type = 'expense'",
+}
+
+# Resident rows: everything dated from the cutoff on ('' keeps every row)
+SELECT_HOT_SQL = {
+    "account": f"""
+SELECT id, date, amount, description, category, merchant, vibe_impact, currency
+FROM transactions WHERE {SCOPE_FILTERS['account']} AND date >= ?
+ORDER BY date
+""",
+    "statement": f"""
+SELECT id, date, amount, description, category, merchant, vibe_impact, currency
+FROM transactions WHERE {SCOPE_FILTERS['statement']} AND date >= ?
+""",
+}
+
+# Rows before the cutoff, summed per (category, currency) for LedgerAggregates
+CATEGORY_HISTORY_SQL = {
+    scope: f"""
+SELECT category, COALESCE(currency, 'USD'), COUNT(*), SUM(COALESCE(amount, 0)), SUM(COALESCE(vibe_impact, 0)),
+       SUM(COALESCE(vibe_impact, 0) > 0), MIN(COALESCE(amount, 0)), MAX(COALESCE(amount, 0))
+FROM transactions WHERE {where} AND date < ?
+GROUP BY 1, 2
+"""
+    for scope, where in SCOPE_FILTERS.items()
+}
+
+# ... and per (epoch day, currency, category) for the SpendTimeline day buckets
+DAY_HISTORY_SQL = {
+    scope: f"""
+SELECT CAST(julianday(substr(date, 1, 10)) - 2440587.5 AS INTEGER), COALESCE(currency, 'USD'), category,
+       COUNT(*), SUM(COALESCE(amount, 0))
+FROM transactions WHERE {where} AND date < ?
+GROUP BY 1, 2, 3
+"""
+    for scope, where in SCOPE_FILTERS.items()
+}
+
+# ... and per (month, currency, emotion) for EmotionHistory; the label is a Python function
+EMOTION_HISTORY_SQL = {
+    scope: f"""
+SELECT substr(date, 1, 7), COALESCE(currency, 'USD'), finaura_emotion(vibe_impact, description),
+       COUNT(*), SUM(COALESCE(amount, 0))
+FROM transactions WHERE {where} AND date < ?
+GROUP BY 1, 2, 3
+"""
+    for scope, where in SCOPE_FILTERS.items()
+}
+
+# Merchant priors for MerchantIndex, over every row whether it is resident or not. Rows
+# whose category the importer guessed (merchant prior or default) don't count: learning
+# from them would only echo the guess back as a more confident prior.
+MERCHANT_COUNTS_SQL = {
+    scope: f"""
+SELECT merchant, category, COUNT(*), SUM(COALESCE(vibe_impact, 0))
+FROM transactions WHERE {where} AND NOT COALESCE(category_inferred, 0)
+GROUP BY 1, 2
+"""
+    for scope, where in SCOPE_FILTERS.items()
+}
+
+DELETE_SQL = "DELETE FROM transactions WHERE id = ? AND account = ?"
+
+DELETE_ID_SQL = "DELETE FROM transactions WHERE id = ?"
+
+# Whether any row's id falls in [low, high], i.e. whether a range holds only what a batch inserted
+ANY_IN_RANGE_SQL = "SELECT 1 FROM transactions WHERE id BETWEEN ? AND ? LIMIT 1"
+
+TABLE_ROWS_SQL = "SELECT COUNT(*) FROM transactions"
+
+COUNT_SQL = "SELECT COUNT(*) FROM transactions WHERE account = ? AND type = 'expense'"
+
+# "Why did you buy this?" answers; not in the budget triggers' UPDATE OF list, so saving one is cheap
+SAVE_REFLECTION_SQL = "UPDATE transactions SET emotional_reason = ?, emotional_rating = ? WHERE id = ? AND account = ?"
+
+SELECT_REFLECTION_SQL = "SELECT emotional_reason, emotional_rating FROM transactions WHERE id = ? AND account = ?"
+
+# =============================================================================
+# BUDGETS – per (account, month, category, currency) spend, maintained by triggers
+# =============================================================================
+
+# Allocations are kept in USD on the currency = 'USD' row; spend stays in its own currency
+BUDGETS_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS budgets (
+    account TEXT NOT NULL,
+    period TEXT NOT NULL,
+    category TEXT NOT NULL,
+    currency TEXT NOT NULL DEFAULT 'USD',
+    allocated REAL NOT NULL DEFAULT 0,
+    spent REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (account, period, category, currency)
+)
+"""
+
+# The original finsphere.db table had one row per category and no account/period key
+BUDGETS_MIGRATE_SQL = [
+    "ALTER TABLE budgets RENAME TO budgets_legacy",
+    BUDGETS_SCHEMA_SQL,
+    "INSERT INTO budgets (account, period, category, allocated, spent)"
+    " SELECT '', COALESCE(period, ''), category, COALESCE(allocated, 0), COALESCE(spent, 0) FROM budgets_legacy",
+    "DROP TABLE budgets_legacy",
+]
+
+# Period = 'YYYY-MM' prefix of the ISO date. A category's first row in a new period
+# rolls its allocation over from the latest earlier period.
+_BUDGET_ADD = """
+    INSERT INTO budgets (account, period, category, currency, allocated, spent)
+    VALUES (
+        NEW.account, substr(NEW.date, 1, 7), NEW.category, COALESCE(NEW.currency, 'USD'),
+        COALESCE((SELECT allocated FROM budgets
+                  WHERE account = NEW.account AND category = NEW.category
+                    AND currency = COALESCE(NEW.currency, 'USD') AND period < substr(NEW.date, 1, 7)
+                  ORDER BY period DESC LIMIT 1), 0),
+        NEW.amount
+    )
+    ON CONFLICT (account, period, category, currency) DO UPDATE SET spent = spent + excluded.spent;
+"""
+
+_BUDGET_SUBTRACT = """
+    UPDATE budgets SET spent = spent - OLD.amount
+    WHERE account = OLD.account AND period = substr(OLD.date, 1, 7)
+      AND category = OLD.category AND currency = COALESCE(OLD.currency, 'USD');
+"""
+
+# write_rows() (and any write during a bulk load) holds a row here for the length of its
+# transaction; the triggers stand down and the batch applies one summed upsert per budget
+# row instead of one per row. Other connections never see the row, so their single-row
+# writes keep the triggers.
+BUDGETS_DEFERRED_SCHEMA_SQL = "CREATE TABLE IF NOT EXISTS budgets_deferred (deferred INTEGER)"
+
+_NOT_DEFERRED = "NOT EXISTS (SELECT 1 FROM budgets_deferred)"
+
+# INSERT OR REPLACE only fires the delete trigger with PRAGMA recursive_triggers on
+BUDGET_TRIGGERS_SQL = {
+    "budgets_after_insert":
+        "CREATE TRIGGER budgets_after_insert AFTER INSERT ON transactions"
+        f" WHEN NEW.type = 'expense' AND {_NOT_DEFERRED}"
+        f" BEGIN {_BUDGET_ADD} END",
+    "budgets_after_delete":
+        "CREATE TRIGGER budgets_after_delete AFTER DELETE ON transactions"
+        f" WHEN OLD.type = 'expense' AND {_NOT_DEFERRED}"
+        f" BEGIN {_BUDGET_SUBTRACT} END",
+    "budgets_after_update_old":
+        "CREATE TRIGGER budgets_after_update_old"
+        " AFTER UPDATE OF date, amount, category, account, currency, type ON transactions"
+        f" WHEN OLD.type = 'expense' AND {_NOT_DEFERRED}"
+        f" BEGIN {_BUDGET_SUBTRACT} END",
+    "budgets_after_update_new":
+        "CREATE TRIGGER budgets_after_update_new"
+        " AFTER UPDATE OF date, amount, category, account, currency, type ON transactions"
+        f" WHEN NEW.type = 'expense' AND {_NOT_DEFERRED}"
+        f" BEGIN {_BUDGET_ADD} END",
+}
+
+# _BUDGET_ADD for one summed (account, period, category, currency) delta of a write_rows() batch
+BUDGET_DELTA_SQL = """
+INSERT INTO budgets (account, period, category, currency, allocated, spent)
+VALUES (
+    :account, :period, :category, :currency,
+    COALESCE((SELECT allocated FROM budgets
+              WHERE account = :account AND category = :category
+                AND currency = :currency AND period < :period
+              ORDER BY period DESC LIMIT 1), 0),
+    :spent
+)
+ON CONFLICT (account, period, category, currency) DO UPDATE SET spent = spent + excluded.spent
+"""
+
+# One-off backfill of spend that was written before the triggers existed
+BUDGETS_BACKFILL_SQL = """
+INSERT INTO budgets (account, period, category, currency, spent)
+SELECT account, substr(date, 1, 7), category, COALESCE(currency, 'USD'), SUM(amount)
+FROM transactions
+WHERE type = 'expense' AND account IS NOT NULL AND date IS NOT NULL AND category IS NOT NULL
+GROUP BY 1, 2, 3, 4
+ON CONFLICT (account, period, category, currency) DO UPDATE SET spent = excluded.spent
+"""
+
+# Primary-key range scan: every category/currency row for one account and month
+BUDGET_PERIOD_SQL = "SELECT category, currency, allocated, spent FROM budgets WHERE account = ? AND period = ?"
+
+# Carry each category's latest allocation into a period it has no row for yet
+BUDGET_ROLLOVER_SQL = """
+INSERT OR IGNORE INTO budgets (account, period, category, currency, allocated, spent)
+SELECT account, ?, category, currency, allocated, 0
+FROM budgets AS latest
+WHERE account = ? AND currency = 'USD' AND allocated > 0 AND period = (
+    SELECT MAX(period) FROM budgets
+    WHERE account = latest.account AND category = latest.category AND currency = 'USD' AND period < ?
+)
+"""
+
+BUDGET_ALLOCATE_SQL = """
+INSERT INTO budgets (account, period, category, currency, allocated) VALUES (?, ?, ?, 'USD', ?)
+ON CONFLICT (account, period, category, currency) DO UPDATE SET allocated = excluded.allocated
+"""
+
+# Rows that already exist for later periods (future-dated spend) take the new allocation too
+BUDGET_ALLOCATE_LATER_SQL = """
+UPDATE budgets SET allocated = ? WHERE account = ? AND category = ? AND currency = 'USD' AND period > ?
+"""
+
+
+def category_to_db(category: SpendingCategory) -> str:
+    """Store categories by enum name so emoji label tweaks never break old rows"""
+    return category.name
+
+
+def category_from_db(value: Optional[str]) -> SpendingCategory:
+    """Parse a stored category, accepting enum names, enum values and legacy labels"""
+    if not value:
+        return SpendingCategory.ESSENTIAL
+    if value in SpendingCategory.__members__:
+        return SpendingCategory[value]
+    for category in SpendingCategory:
+        if category.value == value:
+            return category
+    return LEGACY_CATEGORY_MAP.get(value.lower(), SpendingCategory.OOPS)
+
+
+def budget_period(when: datetime) -> str:
+    """Budget period key ('YYYY-MM') for a date, matching substr(date, 1, 7) in the triggers"""
+    return when.strftime("%Y-%m")
+
+
+def transaction_to_row(transaction: Transaction, account: str) -> Tuple:
+    return (
+        transaction.id,
+        transaction.date.isoformat(),
+        float(transaction.amount),
+        transaction.description,
+        category_to_db(transaction.category),
+        account,
+        transaction.merchant or "",
+        float(transaction.vibe_impact),
+        (transaction.currency or "USD").upper(),
+        0,  # category_inferred: a Transaction's category was entered or confirmed by the user
+    )
+
+
+def row_to_transaction(row: Tuple) -> Transaction:
+    txn_id, date, amount, description, category, merchant, vibe_impact, currency = row
+    return Transaction(
+        date=datetime.fromisoformat(date),
+        amount=amount or 0.0,
+        description=description or "",
+        category=category_from_db(category),
+        merchant=merchant or "",
+        vibe_impact=vibe_impact or 0.0,
+        id=txn_id,
+        currency=currency or "USD",
+    )
+
+
+@dataclass
+class BulkLoad:
+    """What one bulk_load() has written so far, so a failed load can be undone"""
+    expected_rows: int = 0
+    replaced: int = 0
+    inserted_ranges: List[Tuple[str, str]] = field(default_factory=list)  # id ranges holding only new rows
+    inserted_ids: List[str] = field(default_factory=list)  # new rows outside those ranges
+
+
+class LedgerStore:
+    """Process-wide SQLite ledger: WAL mode, prepared statements and batched writes"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._lock = threading.RLock()
+        self._rolled_over = set()  # (account, period) pairs whose allocations were carried over
+        self._bulk_loads = 0  # bulk_load() calls in progress; the budget triggers are down while > 0
+        self._indexes_dropped = False
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+        self._configure()
+        self._ensure_schema()
+
+    def _configure(self):
+        # WAL lets readers (other sessions) keep going while a batch is being written
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-16000")  # ~16 MB page cache
+        self.conn.execute("PRAGMA recursive_triggers=ON")  # budgets see INSERT OR REPLACE edits
+
+    def _ensure_schema(self):
+        with self._lock, self.conn:
+            self.conn.execute(SCHEMA_SQL)
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(transactions)")}
+            if "vibe_impact" not in columns:
+                self.conn.execute("ALTER TABLE transactions ADD COLUMN vibe_impact REAL DEFAULT 0.0")
+            if "currency" not in columns:
+                self.conn.execute("ALTER TABLE transactions ADD COLUMN currency TEXT DEFAULT 'USD'")
+            if "category_inferred" not in columns:
+                # 1 when the importer guessed the category; rows stored before this count as explicit
+                self.conn.execute("ALTER TABLE transactions ADD COLUMN category_inferred INTEGER DEFAULT 0")
+            if "emotional_reason" not in columns:
+                self.conn.execute("ALTER TABLE transactions ADD COLUMN emotional_reason TEXT")
+                self.conn.execute("ALTER TABLE transactions ADD COLUMN emotional_rating INTEGER")
+            for statement in INDEX_SQL:
+                self.conn.execute(statement)
+            self._ensure_budgets()
+
+    def _ensure_budgets(self):
+        """Create/migrate the budgets table and its triggers, backfilling spend on first run"""
+        budget_columns = {row[1] for row in self.conn.execute("PRAGMA table_info(budgets)")}
+        if budget_columns and "account" not in budget_columns:
+            for statement in BUDGETS_MIGRATE_SQL:
+                self.conn.execute(statement)
+        self.conn.execute(BUDGETS_SCHEMA_SQL)
+        self.conn.execute(BUDGETS_DEFERRED_SCHEMA_SQL)
+        existing = dict(self.conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'"))
+        missing = [name for name in BUDGET_TRIGGERS_SQL if name not in existing]
+        for name, sql in BUDGET_TRIGGERS_SQL.items():
+            if name in existing and existing[name] != sql:
+                self.conn.execute(f"DROP TRIGGER {name}")  # older definition; same bookkeeping, no backfill
+            if existing.get(name) != sql:
+                self.conn.execute(sql)
+        if missing:
+            self.conn.execute(BUDGETS_BACKFILL_SQL)
+            logger.info(f"Backfilled budgets from transactions ({len(missing)} triggers created)")
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run several statements in one write transaction (commit once, fsync once)"""
+        with self._lock, self.conn:
+            yield self.conn
+
+    @contextmanager
+    def _explicit_budgets(self) -> Iterator[Tuple[sqlite3.Connection, Dict[Tuple[str, str, str, str], float]]]:
+        """One write transaction whose budget spend comes from summed deltas, not the triggers
+
+        Correct whether or not bulk_load() has the triggers dropped at the time.
+        """
+        with self.transaction() as conn:
+            deltas = {}
+            conn.execute("INSERT INTO budgets_deferred VALUES (1)")
+            yield conn, deltas
+            self._apply_budget_deltas(conn, deltas)
+            conn.execute("DELETE FROM budgets_deferred")
+
+    def add(self, transaction: Transaction, account: str):
+        """Persist a single transaction"""
+        with self._lock:
+            if self._bulk_loads:
+                self.write_rows([transaction_to_row(transaction, account)])
+                return
+            with self.transaction() as conn:
+                conn.execute(INSERT_SQL, transaction_to_row(transaction, account))
+
+    def add_many(self, transactions: Iterable[Transaction], account: str) -> int:
+        """Bulk insert in chunks of batch_size rows, one SQLite transaction per chunk"""
+        written = 0
+        batch = []
+        for transaction in transactions:
+            batch.append(transaction_to_row(transaction, account))
+            if len(batch) >= self.batch_size:
+                written += self.write_rows(batch)
+                batch = []
+        if batch:
+            written += self.write_rows(batch)
+        return written
+
+    @contextmanager
+    def bulk_load(self, expected_rows: int = 0) -> Iterator[BulkLoad]:
+        """Let a large load (write_rows(rows, bulk) calls) skip per-row trigger and index upkeep
+
+        The load's batches still commit one by one, each holding the store lock only while
+        it is written, so other sessions keep reading and writing in between. For the length
+        of the load the budget triggers are dropped (every write applies summed budget
+        deltas itself meanwhile), and when expected_rows is large next to the table the
+        secondary indexes are dropped too and rebuilt in one pass at the end. Each of those
+        schema changes is its own short transaction; overlapping loads share them and the
+        last one to finish restores them. If the load raises, the rows it inserted are
+        deleted again; rows it replaced keep their new values.
+        """
+        bulk = BulkLoad(expected_rows)
+        with self._lock, self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")  # DDL would otherwise run outside the transaction
+            if not self._bulk_loads:
+                for name in BUDGET_TRIGGERS_SQL:
+                    self.conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            if not self._indexes_dropped and \
+                    expected_rows >= self.conn.execute(TABLE_ROWS_SQL).fetchone()[0] * BULK_REINDEX_SHARE:
+                for name in SECONDARY_INDEXES:
+                    self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+                self._indexes_dropped = True
+            self._bulk_loads += 1
+        try:
+            yield bulk
+        except BaseException:
+            self._end_bulk_load()
+            self._undo_bulk_load(bulk)
+            raise
+        self._end_bulk_load()
+
+    def _end_bulk_load(self):
+        """Rebuild dropped indexes (one transaction each) and, after the last load, restore the triggers"""
+        with self._lock:
+            rebuild = self._bulk_loads == 1 and self._indexes_dropped
+            if rebuild:
+                self._indexes_dropped = False
+        if rebuild:
+            for statement in INDEX_SQL:
+                with self._lock, self.conn:
+                    self.conn.execute(statement)
+        with self._lock, self.conn:
+            self._bulk_loads -= 1
+            if not self._bulk_loads:
+                self.conn.execute("BEGIN IMMEDIATE")
+                for name, sql in BUDGET_TRIGGERS_SQL.items():
+                    self.conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+                    self.conn.execute(sql)
+
+    def _undo_bulk_load(self, bulk: BulkLoad):
+        """Delete the rows a failed bulk_load() inserted, one batch per transaction"""
+        for low, high in bulk.inserted_ranges:
+            with self._explicit_budgets() as (conn, deltas):
+                self._remove_rows(conn, {row[0]: row for row in conn.execute(EXISTING_RANGE_SQL, (low, high))}, deltas)
+        for start in range(0, len(bulk.inserted_ids), self.batch_size):
+            with self._explicit_budgets() as (conn, deltas):
+                self._remove_rows(conn, self._existing_rows(conn, bulk.inserted_ids[start:start + self.batch_size]),
+                                  deltas)
+        if bulk.inserted_ranges or bulk.inserted_ids:
+            logger.info(f"Undid a failed bulk load ({len(bulk.inserted_ranges)} batches, "
+                        f"{len(bulk.inserted_ids)} single rows)")
+
+    def write_rows(self, rows: List[Tuple], bulk: Optional[BulkLoad] = None) -> int:
+        """Insert pre-built rows (transaction_to_row order), batch_size rows per SQLite transaction
+
+        Ids already in the table are replaced; everything else is a plain INSERT. The
+        budget triggers stand down for the batch, which instead applies one summed upsert
+        per (account, period, category, currency) in the same transaction. Pass the
+        bulk_load() a batch belongs to so the load can count and undo what it wrote.
+        """
+        for start in range(0, len(rows), self.batch_size):
+            with self._explicit_budgets() as (conn, deltas):
+                replaced = self._write_batch(conn, rows[start:start + self.batch_size], deltas, bulk)
+            if bulk is not None:
+                bulk.replaced += replaced
+        return len(rows)
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Tuple],
+                     deltas: Dict[Tuple[str, str, str, str], float], bulk: Optional[BulkLoad] = None) -> int:
+        """Write one batch, adding its budget spend to `deltas`; returns how many rows it replaced"""
+        if len({row[0] for row in batch}) < len(batch):
+            batch = list({row[0]: row for row in batch}.values())  # the last row per id wins, as with REPLACE
+        ids = [row[0] for row in batch]
+        existing = self._existing_rows(conn, ids)
+        if bulk is not None:
+            clean_range = not existing and ids == sorted(ids) and \
+                conn.execute(ANY_IN_RANGE_SQL, (ids[0], ids[-1])).fetchone() is None
+            if clean_range:
+                bulk.inserted_ranges.append((ids[0], ids[-1]))
+            else:
+                bulk.inserted_ids.extend(txn_id for txn_id in ids if txn_id not in existing)
+        self._subtract_rows(existing.values(), deltas)
+        for row in batch:
+            key = (row[5], row[1][:7], row[4], row[8] or "USD")
+            deltas[key] = deltas.get(key, 0.0) + row[2]
+        if existing:
+            conn.executemany(INSERT_SQL, [row for row in batch if row[0] in existing])
+            conn.executemany(INSERT_FRESH_SQL, [row for row in batch if row[0] not in existing])
+        else:
+            conn.executemany(INSERT_FRESH_SQL, batch)
+        return len(existing)
+
+    @staticmethod
+    def _subtract_rows(rows: Iterable[Tuple], deltas: Dict[Tuple[str, str, str, str], float]):
+        """Take stored rows (EXISTING_SQL columns) out of the budget spend in `deltas`"""
+        for _, date, amount, category, account, currency, txn_type in rows:
+            if txn_type == "expense" and date and category and account is not None:
+                key = (account, date[:7], category, currency or "USD")
+                deltas[key] = deltas.get(key, 0.0) - (amount or 0.0)
+
+    def _remove_rows(self, conn: sqlite3.Connection, existing: Dict[str, Tuple],
+                     deltas: Dict[Tuple[str, str, str, str], float]):
+        """Delete stored rows (EXISTING_SQL columns, keyed by id), taking them out of `deltas`"""
+        self._subtract_rows(existing.values(), deltas)
+        conn.executemany(DELETE_ID_SQL, [(txn_id,) for txn_id in existing])
+
+    @staticmethod
+    def _apply_budget_deltas(conn: sqlite3.Connection, deltas: Dict[Tuple[str, str, str, str], float]):
+        # Oldest period first, so a later period rolls over an allocation created earlier in the batch
+        conn.executemany(BUDGET_DELTA_SQL, [
+            {"account": account, "period": period, "category": category, "currency": currency, "spent": spent}
+            for (account, period, category, currency), spent in sorted(deltas.items(), key=lambda item: item[0][1])
+        ])
+
+    @staticmethod
+    def _existing_rows(conn: sqlite3.Connection, ids: List[str]) -> Dict[str, Tuple]:
+        """Rows already stored under any of `ids`, keyed by id"""
+        if ids == sorted(ids):
+            wanted = set(ids)
+            return {row[0]: row for row in conn.execute(EXISTING_RANGE_SQL, (ids[0], ids[-1])) if row[0] in wanted}
+        existing = {}
+        for start in range(0, len(ids), EXISTING_CHUNK):
+            chunk = ids[start:start + EXISTING_CHUNK]
+            sql = EXISTING_SQL.format(", ".join("?" * len(chunk)))
+            existing.update((row[0], row) for row in conn.execute(sql, chunk))
+        return existing
+
+    def delete(self, transaction_id: str, account: str) -> bool:
+        with self._lock:
+            if self._bulk_loads:
+                with self._explicit_budgets() as (conn, deltas):
+                    existing = {txn_id: row for txn_id, row in self._existing_rows(conn, [transaction_id]).items()
+                                if row[4] == account}
+                    self._remove_rows(conn, existing, deltas)
+                return bool(existing)
+            with self.transaction() as conn:
+                cursor = conn.execute(DELETE_SQL, (transaction_id, account))
+            return cursor.rowcount > 0
+
+    def load(self, account: str) -> List[Transaction]:
+        """Load an account's full history, oldest first"""
+        with self._lock:
+            rows = self.conn.execute(SELECT_ACCOUNT_SQL, (account,)).fetchall()
+        return [row_to_transaction(row) for row in rows]
+
+    def hot_cutoff(self, account: str, since: datetime, min_rows: int = 0) -> str:
+        """First ISO date a hot-window load keeps resident ('' keeps every row)
+
+        Rows dated on or after `since` stay resident, and so do the newest min_rows rows
+        however old they are.
+        """
+        cutoff = since.isoformat()
+        if min_rows <= 0:
+            return cutoff
+        row = self.fetchone(HOT_CUTOFF_SQL, (account, min_rows - 1))
+        return min(cutoff, row[0]) if row else ""
+
+    def load_ledger(self, account: str, cutoff: str = "") -> ColumnarLedger:
+        """Load an account's rows dated from `cutoff` on (see hot_cutoff) into a ColumnarLedger, oldest first
+
+        Older rows stay on disk: two GROUP BY queries fold them into the ledger's
+        aggregates and day buckets as spilled rows, so whole-history stats still add up.
+        """
+        return self._load("account", (account,), cutoff)
+
+    def load_statement(self, account: str, id_prefix: str, cutoff: str = "") -> ColumnarLedger:
+        """The rows of one imported statement (ids starting with id_prefix), like load_ledger, in file order"""
+        return self._load("statement", self._statement_params(account, id_prefix), cutoff)
+
+    def emotion_history(self, account: str, cutoff: str, label: Callable[[Optional[float], Optional[str]], int],
+                        id_prefix: Optional[str] = None) -> List[Tuple[str, str, int, int, float]]:
+        """(month 'YYYY-MM', currency, emotion, rows, amount) for rows dated before `cutoff`
+
+        `label(vibe_impact, description)` gives each row's emotion inside SQLite, so the
+        rows never leave the database. With id_prefix, only that statement's rows count.
+        """
+        scope, params = self._scope(account, id_prefix)
+        with self._lock:
+            self.conn.create_function("finaura_emotion", 2, label, deterministic=True)
+            return self.conn.execute(EMOTION_HISTORY_SQL[scope], params + (cutoff,)).fetchall()
+
+    def merchant_counts(self, account: str, id_prefix: Optional[str] = None) -> List[Tuple[str, int, int, float]]:
+        """(merchant, category code, rows, vibe sum) over the account's or statement's explicitly categorized rows"""
+        scope, params = self._scope(account, id_prefix)
+        rows = self.fetchall(MERCHANT_COUNTS_SQL[scope], params)
+        return [(merchant or "", CATEGORY_CODES[category_from_db(raw)], count, vibe_sum)
+                for merchant, raw, count, vibe_sum in rows]
+
+    def _scope(self, account: str, id_prefix: Optional[str]) -> Tuple[str, Tuple]:
+        if id_prefix is None:
+            return "account", (account,)
+        return "statement", self._statement_params(account, id_prefix)
+
+    @staticmethod
+    def _statement_params(account: str, id_prefix: str) -> Tuple[str, str, str]:
+        return id_prefix, id_prefix[:-1] + chr(ord(id_prefix[-1]) + 1), account
+
+    def _load(self, scope: str, params: Tuple, cutoff: str) -> ColumnarLedger:
+        with self._lock:
+            rows = self.conn.execute(SELECT_HOT_SQL[scope], params + (cutoff,)).fetchall()
+            if cutoff:
+                category_groups = self.conn.execute(CATEGORY_HISTORY_SQL[scope], params + (cutoff,)).fetchall()
+                day_groups = self.conn.execute(DAY_HISTORY_SQL[scope], params + (cutoff,)).fetchall()
+        ledger = self._ledger_from_rows(rows)
+        if cutoff and category_groups:
+            ledger.add_history(
+                [(CATEGORY_CODES[category_from_db(raw)], currency, *sums) for raw, currency, *sums in category_groups],
+                [(day, currency, CATEGORY_CODES[category_from_db(raw)], count, total)
+                 for day, currency, raw, count, total in day_groups],
+            )
+        return ledger
+
+    @staticmethod
+    def _ledger_from_rows(rows: List[Tuple]) -> ColumnarLedger:
+        if not rows:
+            return ColumnarLedger()
+        ids, dates, amounts, descriptions, categories, merchants, vibes, currencies = zip(*rows)
+        category_lookup = {raw: CATEGORY_CODES[category_from_db(raw)] for raw in set(categories)}
+        return ColumnarLedger.from_columns(
+            ids=ids,
+            dates_us=np.array(dates, dtype="datetime64[us]").astype(np.int64),
+            amounts=np.array([amount or 0.0 for amount in amounts], dtype=np.float64),
+            descriptions=[description or "" for description in descriptions],
+            category_codes=np.array([category_lookup[raw] for raw in categories], dtype=np.int8),
+            merchants=merchants,
+            vibe_impacts=np.array([vibe or 0.0 for vibe in vibes], dtype=np.float32),
+            currencies=[currency or "USD" for currency in currencies],
+        )
+
+    def budget(self, account: str, when: datetime) -> List[Tuple[str, str, float, float]]:
+        """(category, currency, allocated, spent) rows for the period containing `when`
+
+        The first read of a new period rolls the previous allocations over, so a month
+        with no spend yet still reports its budget.
+        """
+        period = budget_period(when)
+        with self.transaction() as conn:
+            if (account, period) not in self._rolled_over:
+                conn.execute(BUDGET_ROLLOVER_SQL, (period, account, period))
+                self._rolled_over.add((account, period))
+            return conn.execute(BUDGET_PERIOD_SQL, (account, period)).fetchall()
+
+    def set_allocations(self, account: str, when: datetime, allocations: Dict[SpendingCategory, float]):
+        """Set the USD allocation per category from the period containing `when` onward"""
+        period = budget_period(when)
+        with self.transaction() as conn:
+            for category, amount in allocations.items():
+                conn.execute(BUDGET_ALLOCATE_SQL, (account, period, category_to_db(category), float(amount)))
+                conn.execute(BUDGET_ALLOCATE_LATER_SQL, (float(amount), account, category_to_db(category), period))
+            self._rolled_over = {key for key in self._rolled_over if key[0] != account}
+
+    def save_reflection(self, transaction_id: str, account: str, reason: str, rating: int) -> bool:
+        """Store why a purchase was made and how it feels now; False if the row isn't saved"""
+        with self.transaction() as conn:
+            cursor = conn.execute(SAVE_REFLECTION_SQL, (reason, int(rating), transaction_id, account))
+        return cursor.rowcount > 0
+
+    def reflection(self, transaction_id: str, account: str) -> Optional[Tuple[Optional[str], Optional[int]]]:
+        """(reason, rating) saved for a transaction, or None if it was never analyzed"""
+        row = self.fetchone(SELECT_REFLECTION_SQL, (transaction_id, account))
+        return row if row and row[0] is not None else None
+
+    def fetchall(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        """Run a read-only statement under the store lock"""
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def fetchone(self, sql: str, params: Tuple = ()) -> Optional[Tuple]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchone()
+
+    def count(self, account: str) -> int:
+        with self._lock:
+            return self.conn.execute(COUNT_SQL, (account,)).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
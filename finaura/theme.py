@@ -0,0 +1,464 @@
+# 💸 FinAura theme – one static stylesheet plus a small CSS variable block per vibe
+
+import json
+from typing import Dict
+
+from finaura.models import VibeType
+
+# Mood-based color schemes; every rule in STYLESHEET reads them through var(--aura-...)
+VIBE_AURAS = {
+    VibeType.STRESSED: {
+        "primary": "#FF6B6B",
+        "secondary": "#FF8E8E",
+        "accent": "#FFB3B3",
+        "bg_start": "#FF4757",
+        "bg_end": "#FF6B6B",
+        "card_bg": "linear-gradient(135deg, #FF6B6B 0%, #FF4757 100%)",
+        "text_glow": "#FF6B6B",
+        "particle_color": "#FF8E8E",
+        "aura_name": "Stress Relief Aura",
+        "description": "Calming reds to acknowledge stress while promoting healing"
+    },
+    VibeType.CONFIDENT: {
+        "primary": "#4ECDC4",
+        "secondary": "#45B7D1",
+        "accent": "#96CEB4",
+        "bg_start": "#667eea",
+        "bg_end": "#764ba2",
+        "card_bg": "linear-gradient(135deg, #4ECDC4 0%, #45B7D1 100%)",
+        "text_glow": "#4ECDC4",
+        "particle_color": "#45B7D1",
+        "aura_name": "Confidence Power Aura",
+        "description": "Bold blues and teals radiating success energy"
+    },
+    VibeType.CONFUSED: {
+        "primary": "#A8A8A8",
+        "secondary": "#B8B8B8",
+        "accent": "#D3D3D3",
+        "bg_start": "#74b9ff",
+        "bg_end": "#0984e3",
+        "card_bg": "linear-gradient(135deg, #A8A8A8 0%, #74b9ff 100%)",
+        "text_glow": "#74b9ff",
+        "particle_color": "#B8B8B8",
+        "aura_name": "Clarity Seeking Aura",
+        "description": "Cool grays and blues to promote mental clarity"
+    },
+    VibeType.EXCITED: {
+        "primary": "#FFD93D",
+        "secondary": "#FF6B35",
+        "accent": "#FF8B94",
+        "bg_start": "#FFD93D",
+        "bg_end": "#FF6B35",
+        "card_bg": "linear-gradient(135deg, #FFD93D 0%, #FF6B35 100%)",
+        "text_glow": "#FFD93D",
+        "particle_color": "#FF8B94",
+        "aura_name": "High Energy Excitement Aura",
+        "description": "Vibrant yellows and oranges bursting with excitement"
+    },
+    VibeType.CHILL: {
+        "primary": "#96CEB4",
+        "secondary": "#FFEAA7",
+        "accent": "#DDA0DD",
+        "bg_start": "#96CEB4",
+        "bg_end": "#FFEAA7",
+        "card_bg": "linear-gradient(135deg, #96CEB4 0%, #FFEAA7 100%)",
+        "text_glow": "#96CEB4",
+        "particle_color": "#DDA0DD",
+        "aura_name": "Zen Chill Aura",
+        "description": "Peaceful greens and soft yellows for ultimate relaxation"
+    },
+    VibeType.GUILTY: {
+        "primary": "#E17055",
+        "secondary": "#FDCB6E",
+        "accent": "#FD79A8",
+        "bg_start": "#E17055",
+        "bg_end": "#FDCB6E",
+        "card_bg": "linear-gradient(135deg, #E17055 0%, #FDCB6E 100%)",
+        "text_glow": "#E17055",
+        "particle_color": "#FD79A8",
+        "aura_name": "Self-Compassion Aura",
+        "description": "Warm oranges and peaches promoting self-forgiveness"
+    }
+}
+
+# Hex alpha suffixes the stylesheet uses per color, e.g. --aura-primary-40 is primary + '40'
+AURA_ALPHAS = {
+    "primary": ("", "30", "35", "40", "50", "60"),
+    "secondary": ("", "60", "70"),
+    "accent": ("", "50", "60", "80"),
+    "text_glow": ("", "20", "30", "40", "50", "70"),
+    "bg_start": ("15", "22"),
+    "bg_end": ("15", "22"),
+    "particle_color": ("",),
+}
+
+STYLESHEET_ID = "finaura-aura-stylesheet"
+PARTICLES_ID = "finaura-aura-particles"
+
+STYLESHEET = """
+/* Gen Z base components */
+.main-header {
+    padding: 2rem;
+    border-radius: 15px;
+    margin-bottom: 2rem;
+    text-align: center;
+    color: white;
+}
+
+.vibe-card {
+    padding: 1.5rem;
+    border-radius: 15px;
+    margin: 1rem 0;
+    color: white;
+}
+
+.money-card {
+    padding: 1.5rem;
+    border-radius: 15px;
+    text-align: center;
+    color: white;
+    margin: 0.5rem;
+}
+
+.budget-card {
+    padding: 1.5rem;
+    border-radius: 15px;
+    margin: 0.5rem;
+    color: #2d3748;
+    text-align: center;
+}
+
+.investment-card {
+    padding: 1.5rem;
+    border-radius: 15px;
+    margin: 0.5rem;
+    color: #2d3748;
+}
+
+.warning-card {
+    background: linear-gradient(135deg, #fa709a 0%, #fee140 100%);
+    padding: 1rem;
+    border-radius: 10px;
+    margin: 1rem 0;
+    color: white;
+}
+
+.success-card {
+    background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
+    padding: 1rem;
+    border-radius: 10px;
+    margin: 1rem 0;
+    color: #2d3748;
+}
+
+.financial-goal-card {
+    padding: 1.5rem;
+    border-radius: 15px;
+    margin: 1rem 0;
+    color: white;
+}
+
+.stButton > button {
+    color: white;
+    border-radius: 25px;
+    padding: 0.75rem 2rem;
+    font-weight: bold;
+}
+
+.metric-container {
+    display: flex;
+    justify-content: space-around;
+    margin: 2rem 0;
+}
+
+.chat-bubble {
+    background: #f7fafc;
+    border-left: 4px solid #667eea;
+    padding: 1rem;
+    margin: 1rem 0;
+    border-radius: 0 15px 15px 0;
+    font-style: italic;
+}
+
+.progress-bar {
+    background: #e2e8f0;
+    border-radius: 10px;
+    height: 20px;
+    margin: 10px 0;
+    overflow: hidden;
+}
+
+.progress-fill {
+    height: 100%;
+    border-radius: 10px;
+    transition: width 0.5s ease;
+}
+
+/* DYNAMIC AURA SYSTEM - MOOD-RESPONSIVE DESIGN */
+
+/* Animated background aura effect */
+.stApp {
+    background: linear-gradient(45deg, var(--aura-bg-start-22), var(--aura-bg-end-22));
+    animation: auraShift 8s ease-in-out infinite alternate;
+}
+
+@keyframes auraShift {
+    0% { background: linear-gradient(45deg, var(--aura-bg-start-15), var(--aura-bg-end-15)); }
+    100% { background: linear-gradient(135deg, var(--aura-bg-end-15), var(--aura-bg-start-15)); }
+}
+
+/* Dynamic card styling based on mood */
+.main-header {
+    background: var(--aura-card-bg) !important;
+    box-shadow: 0 10px 30px var(--aura-primary-40) !important;
+    animation: cardGlow 3s ease-in-out infinite alternate;
+}
+
+@keyframes cardGlow {
+    0% { box-shadow: 0 10px 30px var(--aura-primary-40); }
+    100% { box-shadow: 0 15px 40px var(--aura-primary-60), 0 0 20px var(--aura-text-glow-30); }
+}
+
+.vibe-card {
+    background: var(--aura-card-bg) !important;
+    box-shadow: 0 8px 25px var(--aura-primary-35) !important;
+}
+
+.money-card {
+    background: var(--aura-card-bg) !important;
+    border: 2px solid var(--aura-accent-60);
+    box-shadow: 0 5px 20px var(--aura-primary-30);
+}
+
+.budget-card {
+    background: linear-gradient(135deg, var(--aura-accent-80), var(--aura-secondary-60)) !important;
+    border: 1px solid var(--aura-primary-40);
+}
+
+.investment-card {
+    background: linear-gradient(135deg, var(--aura-secondary-70), var(--aura-accent-50)) !important;
+    border-left: 4px solid var(--aura-primary);
+}
+
+.financial-goal-card {
+    background: var(--aura-card-bg) !important;
+    box-shadow: 0 6px 20px var(--aura-primary-35);
+}
+
+/* Mood-responsive text effects */
+h1, h2, h3 {
+    text-shadow: 0 0 10px var(--aura-text-glow-50) !important;
+    animation: textGlow 2s ease-in-out infinite alternate;
+}
+
+@keyframes textGlow {
+    0% { text-shadow: 0 0 10px var(--aura-text-glow-50); }
+    100% { text-shadow: 0 0 15px var(--aura-text-glow-70), 0 0 25px var(--aura-text-glow-30); }
+}
+
+/* Button styling matches mood */
+.stButton > button {
+    background: var(--aura-card-bg) !important;
+    border: 2px solid var(--aura-primary) !important;
+    box-shadow: 0 4px 15px var(--aura-primary-40) !important;
+    transition: all 0.3s ease !important;
+}
+
+.stButton > button:hover {
+    box-shadow: 0 8px 25px var(--aura-primary-60), 0 0 20px var(--aura-text-glow-50) !important;
+    transform: translateY(-3px) !important;
+}
+
+/* Progress bars match the aura */
+.progress-fill {
+    background: var(--aura-card-bg) !important;
+    box-shadow: inset 0 0 10px var(--aura-text-glow-30);
+}
+
+/* Sidebar matches mood */
+.sidebar .sidebar-content {
+    background: linear-gradient(180deg, var(--aura-primary), var(--aura-secondary)) !important;
+}
+
+/* Floating particles for extra aura effect */
+.aura-particles {
+    position: fixed;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    pointer-events: none;
+    z-index: 1;
+}
+
+.particle {
+    position: absolute;
+    width: 4px;
+    height: 4px;
+    background: var(--aura-particle-color);
+    border-radius: 50%;
+    animation: float 15s infinite linear;
+    opacity: 0.6;
+}
+
+@keyframes float {
+    0% { transform: translateY(100vh) rotate(0deg); }
+    100% { transform: translateY(-100px) rotate(360deg); }
+}
+
+/* Create multiple particles with different delays */
+.particle:nth-child(1) { left: 10%; animation-delay: 0s; }
+.particle:nth-child(2) { left: 20%; animation-delay: 2s; }
+.particle:nth-child(3) { left: 30%; animation-delay: 4s; }
+.particle:nth-child(4) { left: 40%; animation-delay: 6s; }
+.particle:nth-child(5) { left: 50%; animation-delay: 8s; }
+.particle:nth-child(6) { left: 60%; animation-delay: 10s; }
+.particle:nth-child(7) { left: 70%; animation-delay: 12s; }
+.particle:nth-child(8) { left: 80%; animation-delay: 14s; }
+.particle:nth-child(9) { left: 90%; animation-delay: 16s; }
+
+/* Aura notification */
+.aura-notification {
+    position: fixed;
+    top: 20px;
+    right: 20px;
+    background: var(--aura-card-bg);
+    color: white;
+    padding: 12px 20px;
+    border-radius: 25px;
+    font-size: 0.9em;
+    font-weight: 600;
+    box-shadow: 0 8px 25px var(--aura-primary-50);
+    z-index: 1000;
+    animation: auraNotification 4s ease-out;
+}
+
+/* Daily vibe check hero and the AI response card under it */
+.vibe-hero {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 2.5rem 1rem 2rem 1rem;
+    border-radius: 25px;
+    margin-bottom: 2.5rem;
+    text-align: center;
+    color: white;
+    box-shadow: 0 8px 32px rgba(102,126,234,0.15);
+}
+
+.vibe-hero h1 {
+    font-size: 2.8rem;
+    margin-bottom: 0.5rem;
+}
+
+.vibe-hero p {
+    font-size: 1.3rem;
+    margin-bottom: 1.5rem;
+    font-style: italic;
+}
+
+.vibe-response-card {
+    background: var(--aura-card-bg);
+    padding: 2rem;
+    border-radius: 20px;
+    margin: 1.5rem 0 2.5rem 0;
+    color: white;
+    font-size: 1.5rem;
+    font-weight: bold;
+    box-shadow: 0 10px 30px var(--aura-primary-40), 0 0 40px var(--aura-text-glow-20);
+    transition: all 0.3s;
+    animation: heroFadeIn 1s, auraGlow 3s ease-in-out infinite alternate;
+    border: 2px solid var(--aura-accent-60);
+}
+
+@keyframes heroFadeIn {
+    from { opacity: 0; transform: translateY(0); }
+    to { opacity: 1; transform: translateY(0); }
+}
+
+@keyframes auraGlow {
+    0% {
+        box-shadow: 0 10px 30px var(--aura-primary-40), 0 0 40px var(--aura-text-glow-20);
+        transform: scale(1);
+    }
+    100% {
+        box-shadow: 0 15px 40px var(--aura-primary-60), 0 0 60px var(--aura-text-glow-40);
+        transform: scale(1.02);
+    }
+}
+
+/* Emoji pop-out shown when the vibe changes */
+.emoji-popup {
+    position: fixed;
+    top: 50%;
+    left: 50%;
+    transform: translate(-50%, -50%);
+    font-size: 8rem;
+    z-index: 9999;
+    animation: emojiPop 2s ease-out forwards;
+    pointer-events: none;
+}
+
+@keyframes emojiPop {
+    0% {
+        opacity: 0;
+        transform: translate(-50%, -50%) scale(0.1);
+    }
+    50% {
+        opacity: 1;
+        transform: translate(-50%, -50%) scale(1.2);
+    }
+    100% {
+        opacity: 0;
+        transform: translate(-50%, -50%) scale(0.8) translateY(-100px);
+    }
+}
+"""
+
+PARTICLES_HTML = '<div class="particle"></div>' * 9
+
+
+def aura_variables(aura: Dict[str, str]) -> str:
+    """:root block with one --aura-<color>[-<alpha>] custom property per color the stylesheet uses"""
+    declarations = [f"--aura-card-bg:{aura['card_bg']};"]
+    for key, alphas in AURA_ALPHAS.items():
+        for alpha in alphas:
+            name = f"--aura-{key.replace('_', '-')}" + (f"-{alpha}" if alpha else "")
+            declarations.append(f"{name}:{aura[key]}{alpha};")
+    return ":root{" + "".join(declarations) + "}"
+
+
+def stylesheet_injector(stylesheet: str = STYLESHEET) -> str:
+    """Script that installs (or replaces) the stylesheet and particles in the parent page
+
+    Both are appended to the end of <body>, outside the elements Streamlit re-renders, so
+    they survive every later rerun without being sent again and still come after
+    Streamlit's own <head> styles in the cascade.
+    """
+    return f"""<script>
+const doc = window.parent.document;
+let style = doc.getElementById({json.dumps(STYLESHEET_ID)});
+if (!style) {{
+    style = doc.createElement("style");
+    style.id = {json.dumps(STYLESHEET_ID)};
+    doc.body.appendChild(style);
+}}
+style.textContent = {json.dumps(stylesheet)};
+if (!doc.getElementById({json.dumps(PARTICLES_ID)})) {{
+    const particles = doc.createElement("div");
+    particles.id = {json.dumps(PARTICLES_ID)};
+    particles.className = "aura-particles";
+    particles.innerHTML = {json.dumps(PARTICLES_HTML)};
+    doc.body.appendChild(particles);
+}}
+</script>"""
+
+
+STYLESHEET_INJECTOR = stylesheet_injector()
+
+# Everything a vibe change has to send: its variables and the "aura activated" badge
+AURA_MARKUP = {
+    vibe: (
+        f"<style>{aura_variables(aura)}</style>"
+        f"<div class=\"aura-notification\">✨ {aura['aura_name']} Activated ✨</div>"
+    )
+    for vibe, aura in VIBE_AURAS.items()
+}
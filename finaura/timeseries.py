@@ -0,0 +1,150 @@
+# 💸 FinAura spend timeline – per-day spend buckets for windowed and resampled analytics
+
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+US_PER_DAY = 86_400_000_000
+
+# 1970-01-05, the first Monday after the epoch; weekly buckets start on Mondays
+FIRST_MONDAY = 4
+
+
+def to_day(value) -> int:
+    """Days since 1970-01-01 for a date/datetime"""
+    if isinstance(value, datetime):
+        value = value.date()
+    return (value - date(1970, 1, 1)).days
+
+
+def from_day(day: int) -> date:
+    return date.fromordinal(date(1970, 1, 1).toordinal() + int(day))
+
+
+class SpendTimeline:
+    """Spend per (day, currency, category) bucket, kept up to date on every ledger change
+
+    add/remove are O(1) dict updates. Reads go through columns(): the buckets as sorted
+    arrays, rebuilt (O(buckets)) only after a mutation. Window and resample queries then
+    cost O(log buckets + buckets in range), whatever the number of transactions. Amounts
+    stay in their own currency; `weights` (one multiplier per bucket row of columns())
+    converts them, so a day's rate applies to that day's bucket.
+    """
+
+    def __init__(self, n_categories: int):
+        self.n_categories = n_categories
+        self._totals: Dict[Tuple[int, int], List[float]] = {}
+        self._counts: Dict[Tuple[int, int], int] = {}
+        self._columns: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def from_columns(cls, n_categories: int, dates_us: np.ndarray, category_codes: np.ndarray,
+                     amounts: np.ndarray, currency_codes: np.ndarray) -> "SpendTimeline":
+        """Bucket full columns in one vectorized pass"""
+        timeline = cls(n_categories)
+        if not len(amounts):
+            return timeline
+        days = np.asarray(dates_us, dtype=np.int64) // US_PER_DAY
+        # One int64 key per (day, currency) row: a 1-D unique is far cheaper than unique(axis=1)
+        keys, bucket_index = np.unique(days * 256 + currency_codes.astype(np.int64), return_inverse=True)
+        bucket_index = bucket_index.reshape(-1)
+        cells = bucket_index * n_categories + category_codes.astype(np.intp)
+        size = len(keys) * n_categories
+        totals = np.bincount(cells, weights=amounts, minlength=size).reshape(-1, n_categories)
+        counts = np.bincount(bucket_index, minlength=len(keys))
+        for key, row, count in zip(keys.tolist(), totals.tolist(), counts.tolist()):
+            timeline._totals[(key >> 8, key & 255)] = row
+            timeline._counts[(key >> 8, key & 255)] = count
+        return timeline
+
+    def add(self, date_us: int, code: int, amount: float, currency: int = 0):
+        key = (date_us // US_PER_DAY, currency)
+        if key not in self._totals:
+            self._totals[key] = [0.0] * self.n_categories
+            self._counts[key] = 0
+        self._totals[key][code] += amount
+        self._counts[key] += 1
+        self._columns = None
+
+    def remove(self, date_us: int, code: int, amount: float, currency: int = 0):
+        key = (date_us // US_PER_DAY, currency)
+        self._counts[key] -= 1
+        if self._counts[key] == 0:
+            del self._totals[key]
+            del self._counts[key]
+        else:
+            self._totals[key][code] -= amount
+        self._columns = None
+
+    def add_group(self, day: int, code: int, count: int, total: float, currency: int = 0):
+        """Fold in `count` rows of one (day, currency, category) at once"""
+        key = (day, currency)
+        if key not in self._totals:
+            self._totals[key] = [0.0] * self.n_categories
+            self._counts[key] = 0
+        self._totals[key][code] += total
+        self._counts[key] += count
+        self._columns = None
+
+    def merge(self, other: "SpendTimeline", currency_map: Sequence[int]):
+        """Fold in another ledger's buckets; its currency code c is currency_map[c] here"""
+        for (day, currency), totals in other._totals.items():
+            key = (day, int(currency_map[currency]))
+            if key in self._totals:
+                self._totals[key] = [mine + theirs for mine, theirs in zip(self._totals[key], totals)]
+                self._counts[key] += other._counts[(day, currency)]
+            else:
+                self._totals[key] = list(totals)
+                self._counts[key] = other._counts[(day, currency)]
+        self._columns = None
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(days, currency codes, per-category totals) for every bucket, sorted by day"""
+        if self._columns is None:
+            keys = sorted(self._totals)
+            days = np.array([day for day, _ in keys], dtype=np.int64)
+            currencies = np.array([currency for _, currency in keys], dtype=np.int8)
+            totals = np.array([self._totals[key] for key in keys], dtype=np.float64).reshape(-1, self.n_categories)
+            self._columns = days, currencies, totals
+        return self._columns
+
+    def first_day(self) -> Optional[int]:
+        days = self.columns()[0]
+        return int(days[0]) if len(days) else None
+
+    def window(self, start_day: Optional[int] = None, end_day: Optional[int] = None,
+               weights: Optional[np.ndarray] = None) -> np.ndarray:
+        """Per-category spend from start_day to end_day inclusive (None = unbounded)"""
+        days, _, totals = self.columns()
+        lo = 0 if start_day is None else int(np.searchsorted(days, start_day, side="left"))
+        hi = len(days) if end_day is None else int(np.searchsorted(days, end_day, side="right"))
+        rows = totals[lo:hi]
+        if weights is not None:
+            rows = rows * weights[lo:hi, None]
+        return rows.sum(axis=0) if len(rows) else np.zeros(self.n_categories)
+
+    def resample(self, period: str = "D", weights: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(period start days, per-category totals) for 'D'ay, 'W'eek (Monday) or 'M'onth periods"""
+        days, _, totals = self.columns()
+        if weights is not None:
+            totals = totals * weights[:, None]
+        if period == "D":
+            starts = days
+        elif period == "W":
+            starts = (days - FIRST_MONDAY) // 7 * 7 + FIRST_MONDAY
+        elif period == "M":
+            starts = days.astype("datetime64[D]").astype("datetime64[M]").astype("datetime64[D]").astype(np.int64)
+        else:
+            raise ValueError(f"Unknown period: {period!r}")
+        periods, period_index = np.unique(starts, return_inverse=True)
+        summed = np.zeros((len(periods), self.n_categories))
+        np.add.at(summed, period_index.reshape(-1), totals)
+        return periods, summed
@@ -0,0 +1,116 @@
+# 💸 FinAura render timings – rolling per-section latency percentiles for the debug panel
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_WINDOW = 1000  # most recent samples kept per section
+DEFAULT_PERCENTILES = (50, 95, 99)
+DEFAULT_EXPORT_EVERY = 60.0  # seconds between JSON snapshots when exporting to a file
+
+
+class SectionTimings:
+    """Durations per named section, shared by every session in the process
+
+    Each section keeps its last `window` samples in a fixed numpy ring, so recording is
+    one perf_counter pair and an array store under a lock; percentiles are only computed
+    when summary() is asked for. Sections may nest (a helper inside a fragment), in which
+    case the outer section's time includes the inner one.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: Dict[str, np.ndarray] = {}
+        self._counts: Dict[str, int] = {}
+        self._last_export = 0.0
+
+    def record(self, section: str, seconds: float):
+        with self._lock:
+            samples = self._samples.get(section)
+            if samples is None:
+                samples = self._samples[section] = np.empty(self.window)
+            count = self._counts.get(section, 0)
+            samples[count % self.window] = seconds
+            self._counts[section] = count + 1
+
+    @contextmanager
+    def section(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def timed(self, name: Optional[str] = None):
+        """Decorator recording every call of a function under `name` (default: its name)"""
+        def decorator(func):
+            section = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(section, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def summary(self, percentiles=DEFAULT_PERCENTILES) -> List[Dict]:
+        """One row per section (milliseconds), slowest p95 first"""
+        with self._lock:
+            snapshot = {
+                section: (samples[:min(self._counts[section], self.window)].copy(), self._counts[section])
+                for section, samples in self._samples.items()
+            }
+        rows = []
+        for section, (samples, count) in snapshot.items():
+            values = np.percentile(samples, percentiles) * 1000
+            row = {'section': section, 'calls': count}
+            row.update({f"p{p}_ms": round(float(value), 2) for p, value in zip(percentiles, values)})
+            row['max_ms'] = round(float(samples.max()) * 1000, 2)
+            rows.append(row)
+        return sorted(rows, key=lambda row: row.get('p95_ms', 0), reverse=True)
+
+    def to_json(self) -> str:
+        return json.dumps({'window': self.window, 'generated': time.time(), 'sections': self.summary()}, indent=2)
+
+    def maybe_export(self, path: str, every: float = DEFAULT_EXPORT_EVERY) -> bool:
+        """Write a JSON snapshot to `path` at most once per `every` seconds"""
+        now = time.monotonic()
+        if now - self._last_export < every:
+            return False
+        self._last_export = now
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(self.to_json())
+        os.replace(tmp_path, path)
+        return True
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+
+class LapClock:
+    """Times consecutive inline script sections: lap(name) records the time since the last lap"""
+
+    def __init__(self, timings: SectionTimings):
+        self.timings = timings
+        self._last = time.perf_counter()
+
+    def restart(self):
+        self._last = time.perf_counter()
+
+    def lap(self, name: str):
+        now = time.perf_counter()
+        self.timings.record(name, now - self._last)
+        self._last = now
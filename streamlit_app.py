@@ -2,21 +2,43 @@
 # Enhanced Streamlit App with Financial Planning & Budget Structure
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+import streamlit.components.v1 as components
+import numpy as np
+from datetime import date, datetime, timedelta
 import random
-import json
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-import sqlite3
-import asyncio
-from enum import Enum
-import hashlib
+from typing import Dict, List, Optional
 import math  # Added for debt calculations
-import traceback
 import logging
+import uuid
+import json
+import os
+import time
+
+# pandas and plotly are imported inside the functions that build tables and charts,
+# so a cold start only pays for them once something is actually rendered
+
+from finaura.models import VibeType, SpendingCategory, FinancialGoal, Transaction, VibeData, BudgetPlan
+from finaura.formatting import CURRENCY_SYMBOLS, format_money
+from finaura.agent import EnhancedFinAuraAgent
+from finaura.audit import AuditWriter
+from finaura.dashboard import AVERAGE_DAYS, dashboard_metrics, spend_windows, transaction_table
+from finaura.debts import STRATEGY_LABELS, Debt, simulate_payoffs
+from finaura.emotions import (
+    EMOTION_WINDOWS, EMOTIONS, IMPULSE, JOY, REGRET, SURVIVAL, EmotionClassifier, emotion_summary,
+    merge_monthly_totals, monthly_emotion_totals
+)
+from finaura.goals import COMMON_GOALS, PRIORITIES, WEEKS_PER_MONTH, GoalPortfolio, SavingsGoal, deadline_in
+from finaura.importer import import_statement
+from finaura.ledger import CATEGORIES, ColumnarLedger, to_epoch_us
+from finaura.memo import ArtifactCache
+from finaura.memory import SessionMemoryBudget
+from finaura.merchants import MerchantIndex
+from finaura.projection import DEFAULT_PATHS, simulate_wealth
+from finaura.queries import count_transactions, transaction_page
+from finaura.rates import DEFAULT_RATES, RateProvider
+from finaura.storage import LedgerStore, category_from_db
+from finaura.theme import AURA_MARKUP, STYLESHEET_INJECTOR
+from finaura.timing import LapClock, SectionTimings
 
 # =============================================================================
 # ERROR HANDLING & DEBUGGING SYSTEM
@@ -55,317 +77,59 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS for Gen Z aesthetic
-st.markdown("""
-<style>
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        text-align: center;
-        color: white;
-    }
-    
-    .vibe-card {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        color: white;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    
-    .money-card {
-        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        text-align: center;
-        color: white;
-        margin: 0.5rem;
-    }
-    
-    .budget-card {
-        background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 0.5rem;
-        color: #2d3748;
-        text-align: center;
-    }
-    
-    .investment-card {
-        background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 0.5rem;
-        color: #2d3748;
-    }
-    
-    .warning-card {
-        background: linear-gradient(135deg, #fa709a 0%, #fee140 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        color: white;
-    }
-    
-    .success-card {
-        background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        color: #2d3748;
-    }
-    
-    .financial-goal-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        color: white;
-    }
-    
-    .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        border-radius: 25px;
-        padding: 0.75rem 2rem;
-        font-weight: bold;
-        transition: all 0.3s;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-    }
-    
-    .sidebar .sidebar-content {
-        background: linear-gradient(180deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    .metric-container {
-        display: flex;
-        justify-content: space-around;
-        margin: 2rem 0;
-    }
-    
-    .chat-bubble {
-        background: #f7fafc;
-        border-left: 4px solid #667eea;
-        padding: 1rem;
-        margin: 1rem 0;
-        border-radius: 0 15px 15px 0;
-        font-style: italic;
-    }
-    
-    .progress-bar {
-        background: #e2e8f0;
-        border-radius: 10px;
-        height: 20px;
-        margin: 10px 0;
-        overflow: hidden;
-    }
-    
-    .progress-fill {
-        height: 100%;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 10px;
-        transition: width 0.5s ease;
-    }
-</style>
-""", unsafe_allow_html=True)
+# =============================================================================
+# RENDER TIMINGS
+# =============================================================================
+
+# Rolling per-section latencies shared by every session (debug panel + optional JSON export)
+@st.cache_resource
+def get_section_timings():
+    return SectionTimings()
+
+# @timed() on helpers and fragments; script_clock.lap() for the inline top-level sections
+timed = get_section_timings().timed
+rerun_started = time.perf_counter()
+script_clock = LapClock(get_section_timings())
 
 # =============================================================================
-# ENHANCED DATA MODELS & CORE LOGIC
+# STYLESHEET & HTML OUTPUT
 # =============================================================================
 
-class VibeType(Enum):
-    STRESSED = "😩"
-    CONFIDENT = "😎"
-    CONFUSED = "🤔"
-    EXCITED = "🚀"
-    CHILL = "😌"
-    GUILTY = "😬"
-
-class SpendingCategory(Enum):
-    ESSENTIAL = "🏠 Essential"
-    JOY = "✨ Joy"
-    OOPS = "😅 Oops"
-    INVESTMENT = "📈 Investment"
-
-class FinancialGoal(Enum):
-    EMERGENCY_FUND = "🚨 Emergency Fund"
-    TRAVEL = "✈️ Travel Fund"
-    HOUSE_DEPOSIT = "🏡 House Deposit"
-    RETIREMENT = "👴 Future Me Fund"
-    SIDE_HUSTLE = "💼 Side Hustle Capital"
-    EDUCATION = "📚 Skill Up Fund"
-
-@dataclass
-class Transaction:
-    date: datetime
-    amount: float
-    description: str
-    category: SpendingCategory
-    merchant: str = ""
-    vibe_impact: float = 0.0
-
-@dataclass
-class VibeData:
-    current_vibe: VibeType
-    money_stress_level: int
-    spending_guilt: int
-    financial_confidence: int
-
-@dataclass
-class BudgetPlan:
-    monthly_income: float
-    needs_percentage: float = 50.0  # 50/30/20 rule adjusted for Gen Z
-    wants_percentage: float = 30.0
-    savings_percentage: float = 20.0
-    
-    @property
-    def needs_amount(self) -> float:
-        return self.monthly_income * (self.needs_percentage / 100)
-    
-    @property
-    def wants_amount(self) -> float:
-        return self.monthly_income * (self.wants_percentage / 100)
-    
-    @property
-    def savings_amount(self) -> float:
-        return self.monthly_income * (self.savings_percentage / 100)
+def render_html(markup):
+    """st.markdown for raw HTML/CSS that also counts the bytes this rerun sends"""
+    st.session_state.html_bytes_sent = st.session_state.get('html_bytes_sent', 0) + len(markup.encode('utf-8'))
+    st.markdown(markup, unsafe_allow_html=True)
 
-class EnhancedFinAuraAgent:
-    """The Gen Z AI Agent that gets your vibes AND your financial goals"""
-    
-    def __init__(self):
-        self.vibe_responses = {
-            VibeType.STRESSED: [
-                "Hey bestie, I see you're feeling the money stress 😔 Let's break this down together",
-                "Okay, deep breath! Your finances aren't as scary as they seem rn",
-                "You're doing better than you think! Let me show you the receipts 📊"
-            ],
-            VibeType.CONFIDENT: [
-                "YES QUEEN! 👑 Your money game is strong today",
-                "Love this energy! You're absolutely crushing your financial goals",
-                "Confidence looks good on you! Your budget is thriving ✨"
-            ],
-            VibeType.CONFUSED: [
-                "No judgment here! Money stuff is confusing AF sometimes 🤷‍♀️",
-                "Let's untangle this together! I'll make it make sense",
-                "Confusion is valid! Your finances don't have to be perfect"
-            ],
-            VibeType.GUILTY: [
-                "Stop! 🛑 Guilt spending happens to literally everyone",
-                "That purchase doesn't define you, babe. Let's just adjust and move on",
-                "Self-compassion > self-judgment. Your worth isn't your spending"
-            ]
-        }
-        
-        self.investment_suggestions = {
-            "low_risk": [
-                {"name": "High-Yield Savings", "desc": "Safe & steady growth 📈", "risk": "Low", "return": "2-4%"},
-                {"name": "Government Bonds", "desc": "Boring but reliable 🏛️", "risk": "Low", "return": "3-5%"},
-                {"name": "CDs (Certificates of Deposit)", "desc": "Lock it up, stack it up 🔒", "risk": "Low", "return": "3-5%"}
-            ],
-            "medium_risk": [
-                {"name": "Index Funds (S&P 500)", "desc": "Diversified market vibes 📊", "risk": "Medium", "return": "7-10%"},
-                {"name": "Target-Date Funds", "desc": "Set it and forget it ⏰", "risk": "Medium", "return": "6-9%"},
-                {"name": "REITs", "desc": "Real estate without the drama 🏠", "risk": "Medium", "return": "5-8%"}
-            ],
-            "high_risk": [
-                {"name": "Individual Stocks", "desc": "Pick your favorites 🎯", "risk": "High", "return": "Variable"},
-                {"name": "Cryptocurrency", "desc": "Digital gold or digital chaos? 🪙", "risk": "High", "return": "Highly Variable"},
-                {"name": "Growth Stocks", "desc": "Betting on the future 🚀", "risk": "High", "return": "Variable"}
-            ]
-        }
-        
-        self.gen_z_financial_tips = [
-            "💡 Automate your savings - treat it like a subscription you can't cancel",
-            "🎯 Use the 24-hour rule for purchases over $50",
-            "📱 Try investment apps like Robinhood, Acorns, or Stash for micro-investing",
-            "🏠 Aim for 6-month emergency fund (adulting is expensive!)",
-            "✨ Invest in yourself - courses, certifications, side hustles",
-            "🌱 Start investing early - compound interest is your bestie",
-            "💳 Build credit responsibly - your future self will thank you",
-            "🎉 Celebrate small wins - every dollar saved matters!"
-        ]
-    
-    def get_vibe_response(self, vibe: VibeType) -> str:
-        return random.choice(self.vibe_responses.get(vibe, ["You're doing great! 💜"]))
-    
-    def get_budget_suggestions(self, income: float, age: int = 25) -> Dict:
-        """Generate Gen Z-specific budget suggestions"""
-        if income < 2000:
-            return {
-                "needs": 60,  # Higher for survival mode
-                "wants": 25,
-                "savings": 15,
-                "advice": "Survival mode activated! Focus on essentials and small savings wins 💪"
-            }
-        elif income < 4000:
-            return {
-                "needs": 55,
-                "wants": 30,
-                "savings": 15,
-                "advice": "Building phase! You're doing great - balance is key 🌟"
-            }
-        elif income < 6000:
-            return {
-                "needs": 50,
-                "wants": 30,
-                "savings": 20,
-                "advice": "Thriving mode! Classic 50/30/20 rule works perfectly 🔥"
-            }
-        else:
-            return {
-                "needs": 45,
-                "wants": 35,
-                "savings": 20,
-                "advice": "High earner energy! More room for joy spending AND aggressive saving ✨"
-            }
-    
-    def get_investment_roadmap(self, age: int, income: float, risk_tolerance: str) -> List[Dict]:
-        """Create age-appropriate investment suggestions"""
-        roadmap = []
-        
-        # Emergency fund first (always!)
-        roadmap.append({
-            "priority": 1,
-            "goal": "Emergency Fund",
-            "target": min(income * 6, 10000),  # 6 months expenses
-            "description": "Your financial safety net - aim for 3-6 months expenses 🚨"
-        })
-        
-        # Age-based suggestions
-        if age < 30:
-            roadmap.extend([
-                {
-                    "priority": 2,
-                    "goal": "Retirement Start",
-                    "target": income * 0.15,  # 15% of income
-                    "description": "Start early = retire like royalty 👑"
-                },
-                {
-                    "priority": 3,
-                    "goal": "Skill Investment",
-                    "target": income * 0.05,  # 5% for education
-                    "description": "Invest in yourself - best ROI ever 📚"
-                }
-            ])
-        
-        return roadmap
+@timed()
+def inject_stylesheet():
+    """Install the static Gen Z + aura stylesheet in the page once per session"""
+    if st.session_state.get('stylesheet_injected'):
+        return
+    st.session_state.html_bytes_sent = st.session_state.get('html_bytes_sent', 0) + len(STYLESHEET_INJECTOR.encode('utf-8'))
+    components.html(STYLESHEET_INJECTOR, height=0)
+    st.session_state.stylesheet_injected = True
+
+# Every full rerun starts counting from zero; fragment reruns add to the last full count
+st.session_state.html_bytes_sent = 0
+inject_stylesheet()
+
+# =============================================================================
+# ENHANCED DATA MODELS & CORE LOGIC
+# =============================================================================
+
+# The agent holds no per-user state (its reference tables are frozen in finaura.agent),
+# so one instance serves every session; per-user state stays in st.session_state
+@st.cache_resource
+def get_agent():
+    return EnhancedFinAuraAgent()
 
 # =============================================================================
 # SESSION STATE INITIALIZATION WITH ERROR HANDLING
 # =============================================================================
 
-# Initialize debug mode and error tracking
+# Initialize debug mode and error tracking (?debug=1 starts a session with it on)
 if 'debug_mode' not in st.session_state:
-    st.session_state.debug_mode = False
+    st.session_state.debug_mode = st.query_params.get('debug') == '1'
 
 if 'error_count' not in st.session_state:
     st.session_state.error_count = 0
@@ -373,8 +137,28 @@ if 'error_count' not in st.session_state:
 if 'last_error' not in st.session_state:
     st.session_state.last_error = None
 
-if 'transactions' not in st.session_state:
-    sample_data = [
+# Persistent ledger shared by every session in this process (one WAL-mode connection)
+@st.cache_resource
+def get_ledger_store():
+    return LedgerStore()
+
+# Agent interventions are queued here and written to agent_actions off the script thread
+@st.cache_resource
+def get_audit_writer():
+    return AuditWriter(get_ledger_store())
+
+def audit_agent_action(agent_name, action_type, data, confidence=1.0):
+    """Record an intervention once per session (reruns re-show the same message)"""
+    key = (agent_name, action_type, json.dumps(data, sort_keys=True, default=str))
+    if key in st.session_state.audited_actions:
+        return
+    st.session_state.audited_actions.add(key)
+    safe_execute(lambda: get_audit_writer().record(
+        agent_name, action_type, dict(data, account=st.session_state.ledger_account), confidence=confidence
+    ), error_message="Could not queue agent action")
+
+def build_sample_transactions():
+    return [
         Transaction(datetime.now() - timedelta(days=1), 4.50, "iced coffee emergency", SpendingCategory.JOY, "starbucks", 0.3),
         Transaction(datetime.now() - timedelta(days=2), 89.99, "skincare haul (self care!!)", SpendingCategory.JOY, "sephora", 0.2),
         Transaction(datetime.now() - timedelta(days=3), 1200.00, "rent (ugh)", SpendingCategory.ESSENTIAL, "landlord", -0.2),
@@ -384,20 +168,69 @@ if 'transactions' not in st.session_state:
         Transaction(datetime.now() - timedelta(days=7), 150.00, "therapy session", SpendingCategory.ESSENTIAL, "therapist", 0.5),
         Transaction(datetime.now() - timedelta(days=8), 39.99, "late night uber eats", SpendingCategory.OOPS, "uber eats", -0.2),
     ]
-    st.session_state.transactions = sample_data
+
+# Each browser gets its own ledger account, kept in the URL so a reload finds it again
+if 'ledger_account' not in st.session_state:
+    st.session_state.ledger_account = st.query_params.get('ledger') or uuid.uuid4().hex
+    st.query_params['ledger'] = st.session_state.ledger_account
+
+# Per-row emotion labels, re-derived only for rows added since the last classification
+if 'emotion_classifier' not in st.session_state:
+    st.session_state.emotion_classifier = EmotionClassifier()
+
+# Only the hot window is loaded into memory; older rows are summed by SQLite and, like rows
+# spilled over budget later, live on in the aggregates, day buckets and emotion history
+memory_budget = SessionMemoryBudget()
+
+@timed()
+def load_ledger():
+    store = get_ledger_store()
+    account = st.session_state.ledger_account
+    if store.count(account) == 0:
+        store.add_many(build_sample_transactions(), account)
+    return memory_budget.load(store, account, st.session_state.emotion_classifier)
+
+# st.session_state.transactions is a ColumnarLedger: indexing gives Transaction views,
+# aggregates run as NumPy reductions over its columns
+if 'transactions' not in st.session_state:
+    st.session_state.transactions = safe_execute(
+        load_ledger,
+        fallback=ColumnarLedger.from_transactions(build_sample_transactions()),
+        error_message="Could not load your saved transactions, showing sample data instead"
+    )
 
 if 'current_vibe' not in st.session_state:
     st.session_state.current_vibe = VibeType.CHILL
 
-if 'agent' not in st.session_state:
-    st.session_state.agent = EnhancedFinAuraAgent()
-
 if 'budget_plan' not in st.session_state:
     st.session_state.budget_plan = None
 
 if 'financial_profile' not in st.session_state:
     st.session_state.financial_profile = {}
 
+# Derived tables, figures and markup, keyed on ledger/profile versions plus their inputs
+if 'artifact_cache' not in st.session_state:
+    st.session_state.artifact_cache = ArtifactCache()
+
+if 'profile_version' not in st.session_state:
+    st.session_state.profile_version = 0
+
+# Merchant -> category/vibe priors learned from rows whose category was given, not guessed
+# (prefills forms, categorizes imports)
+if 'merchant_index' not in st.session_state:
+    st.session_state.merchant_index = safe_execute(
+        lambda: MerchantIndex.from_counts(get_ledger_store().merchant_counts(st.session_state.ledger_account)),
+        fallback=MerchantIndex()
+    )
+
+# Agent actions already sent to the audit trail this session
+if 'audited_actions' not in st.session_state:
+    st.session_state.audited_actions = set()
+
+# Savings goals sharing the monthly savings budget (slay planner + goal planner)
+if 'goal_portfolio' not in st.session_state:
+    st.session_state.goal_portfolio = GoalPortfolio()
+
 # =============================================================================
 # GLOBAL CURRENCY SELECTION
 # =============================================================================
@@ -406,8 +239,16 @@ if 'financial_profile' not in st.session_state:
 if 'currency' not in st.session_state:
     st.session_state.currency = 'USD'
 
-currency_symbols = {'USD': '$', 'PKR': 'Rs', 'EUR': '€'}
-currency_rates = {'USD': 1.0, 'PKR': 280.0, 'EUR': 0.92}  # Example rates, update as needed
+# Daily rates live in the exchange_rates table (seeded from data/exchange_rates.csv)
+@st.cache_resource
+def get_rate_provider():
+    return RateProvider(get_ledger_store())
+
+currency_symbols = CURRENCY_SYMBOLS
+currency_rates = safe_execute(lambda: get_rate_provider().latest_rates(), fallback=DEFAULT_RATES)
+
+# Ledger stats (agent, coach, insights) are reported in USD at the latest rates
+st.session_state.transactions.usd_rates = currency_rates
 
 with st.sidebar:
     st.markdown('### 🌍 Select Currency')
@@ -415,7 +256,7 @@ with st.sidebar:
         'Currency',
         options=['USD', 'PKR', 'EUR'],
         format_func=lambda x: f"{currency_symbols[x]} {x}",
-        index=['USD', 'Rs', 'EUR'].index(st.session_state.currency)
+        index=['USD', 'PKR', 'EUR'].index(st.session_state.currency)
     )
     
     # Add this code in the sidebar section, after the currency selection and before the Agentic AI Toggle
@@ -443,6 +284,41 @@ with st.sidebar:
         agent_intensity = st.slider('🔥 Agent Intensity', 1, 5, 3, help='How often should the agent intervene?')
         st.session_state.agent_intensity = agent_intensity
 
+    # Debug captions, render timings and their export
+    st.session_state.debug_mode = st.checkbox(
+        '🐛 Debug Mode', value=st.session_state.debug_mode,
+        help='Show error details, cache/audit/memory stats and render timings'
+    )
+
+# Helper to convert and format currency with error handling
+
+def format_currency(amount, decimals=2):
+    """Safely format currency with error handling"""
+    try:
+        currency = st.session_state.currency
+        return format_money(amount, currency, currency_rates.get(currency, 1.0), decimals)
+    except (ValueError, TypeError, KeyError) as e:
+        logger.warning(f"Currency formatting error: {str(e)}")
+        return f"${float(amount or 0):,.{decimals}f}"
+
+def rates_version():
+    return safe_execute(lambda: get_rate_provider().version, fallback=0)
+
+def memoized(key, builder):
+    """Reuse a derived artifact until its key (versions + inputs) changes"""
+    return st.session_state.artifact_cache.get_or_build(key, builder)
+
+def display_key():
+    """Inputs every formatted amount depends on"""
+    return (st.session_state.currency, rates_version())
+
+# Helper to get currency label for headings
+
+def get_currency_label():
+    symbol = currency_symbols[st.session_state.currency]
+    code = st.session_state.currency
+    return f"{symbol} ({code})"
+
 # =============================================================================
 # AGENTIC AI CHATBOT INTEGRATION
 # =============================================================================
@@ -455,7 +331,7 @@ if st.session_state.get('agent_enabled', False):
     st.info(f"🧠 **Active Agent Mode:** {current_mode}")
     
     # Chatbot iframe integration
-    st.markdown("""
+    render_html("""
     <div style="
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         padding: 1rem;
@@ -475,259 +351,353 @@ if st.session_state.get('agent_enabled', False):
             </iframe>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """)
 
 # =============================================================================
-# AGENTIC AI FEATURES - AUTONOMOUS PLANNER & EMOTIONAL COACH
+# EMOTIONAL SPENDING ANALYTICS
 # =============================================================================
 
-if st.session_state.get('agent_enabled', False):
-    agent_mode = st.session_state.get('agent_mode', '💰 Autonomous Slay Planner')
-    
-    if agent_mode == '💰 Autonomous Slay Planner':
-        st.markdown("### 🎯 Autonomous Slay Planner")
-        
-        # Goal Setting Interface
-        with st.expander("🚀 Set Your Slay Goal", expanded=True):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                goal_item = st.text_input("🎯 What do you want to buy?", placeholder="e.g., iPad, vacation, car")
-                goal_amount = st.number_input("💰 How much does it cost?", min_value=1.0, value=500.0, step=50.0)
-            
-            with col2:
-                goal_months = st.slider("📅 In how many months?", 1, 24, 3)
-                current_saved = st.number_input("💳 Already saved?", min_value=0.0, value=0.0, step=10.0)
-            
-            if st.button("🚀 Activate Slay Planner", type="primary"):
-                # Calculate weekly savings needed
-                remaining_amount = goal_amount - current_saved
-                weeks_available = goal_months * 4.33  # Average weeks per month
-                weekly_savings_needed = remaining_amount / weeks_available
-                
-                # Store goal in session state
-                st.session_state.slay_goal = {
-                    'item': goal_item,
-                    'total_amount': goal_amount,
-                    'months': goal_months,
-                    'current_saved': current_saved,
-                    'weekly_needed': weekly_savings_needed,
-                    'created_date': datetime.now()
-                }
-                
-                st.success(f"🎯 Goal Set! Save {format_currency(weekly_savings_needed)} per week to get your {goal_item}!")
-        
-        # Active Goal Tracking
-        if 'slay_goal' in st.session_state:
-            goal = st.session_state.slay_goal
-            progress = (goal['current_saved'] / goal['total_amount']) * 100
-            
-            st.markdown("#### 🔥 Your Active Slay Goal")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("🎯 Goal", goal['item'])
-                st.metric("💰 Total Cost", format_currency(goal['total_amount']))
-            
-            with col2:
-                st.metric("💳 Saved So Far", format_currency(goal['current_saved']))
-                st.metric("📅 Time Left", f"{goal['months']} months")
-            
-            with col3:
-                st.metric("💪 Weekly Target", format_currency(goal['weekly_needed']))
-                st.metric("📈 Progress", f"{progress:.1f}%")
-            
-            # Progress bar
-            st.progress(progress / 100)
-            
-            # AI Agent Intervention
-            if goal['weekly_needed'] > 0:
-                st.markdown("#### 🤖 AI Agent Recommendations")
-                
-                # Calculate spending adjustments
-                monthly_income = st.session_state.financial_profile.get('monthly_income', 0) if st.session_state.financial_profile else 3000
-                weekly_income = monthly_income / 4.33
-                savings_rate = (goal['weekly_needed'] / weekly_income) * 100
-                
-                if savings_rate > 30:
-                    st.warning(f"🚨 **Agent Alert:** This goal requires {savings_rate:.1f}% of your weekly income. Consider extending the timeline or finding additional income sources.")
-                elif savings_rate > 15:
-                    st.info(f"💪 **Agent Suggestion:** This goal requires {savings_rate:.1f}% of weekly income. I'll help you optimize your 'wants' spending!")
-                else:
-                    st.success(f"✅ **Agent Approved:** This goal is achievable with {savings_rate:.1f}% of your income!")
-                
-                # Spending category recommendations
-                st.markdown("**🎯 AI Spending Adjustments:**")
-                st.markdown(f"• Reduce 'Joy' spending by {format_currency(goal['weekly_needed'] * 0.6)} per week")
-                st.markdown(f"• Find {format_currency(goal['weekly_needed'] * 0.4)} in optimized 'Essential' spending")
-                st.markdown("• I'll remind you when you're about to overspend! 🤖")
-    
-    elif agent_mode == '🧾 Emotional Spending Coach':
-        st.markdown("### 🧾 Emotional Spending Tracker + Agentic Coaching")
-        
-        # Emotional spending analysis
-        if st.session_state.transactions:
-            st.markdown("#### 🔍 Recent Emotional Spending Analysis")
-            
-            # Classify transactions by emotional state
-            emotional_categories = {
-                'Joy': [],
-                'Regret': [],
-                'Impulse': [],
-                'Survival': []
-            }
-            
-            for transaction in st.session_state.transactions[-10:]:  # Last 10 transactions
-                vibe_impact = getattr(transaction, 'vibe_impact', 0)
-                amount = getattr(transaction, 'amount', 0)
-                description = getattr(transaction, 'description', '')
-                
-                # Simple emotional classification based on vibe impact and keywords
-                if vibe_impact > 0.3:
-                    emotional_categories['Joy'].append((description, amount))
-                elif vibe_impact < -0.3:
-                    emotional_categories['Regret'].append((description, amount))
-                elif any(word in description.lower() for word in ['impulse', 'quick', 'saw', 'wanted']):
-                    emotional_categories['Impulse'].append((description, amount))
-                else:
-                    emotional_categories['Survival'].append((description, amount))
-            
-            # Display emotional spending breakdown
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                joy_total = sum(amount for _, amount in emotional_categories['Joy'])
-                st.metric("😊 Joy Purchases", f"{len(emotional_categories['Joy'])}")
-                st.caption(f"Total: {format_currency(joy_total)}")
-            
-            with col2:
-                regret_total = sum(amount for _, amount in emotional_categories['Regret'])
-                st.metric("😔 Regret Purchases", f"{len(emotional_categories['Regret'])}")
-                st.caption(f"Total: {format_currency(regret_total)}")
-            
-            with col3:
-                impulse_total = sum(amount for _, amount in emotional_categories['Impulse'])
-                st.metric("⚡ Impulse Buys", f"{len(emotional_categories['Impulse'])}")
-                st.caption(f"Total: {format_currency(impulse_total)}")
-            
-            with col4:
-                survival_total = sum(amount for _, amount in emotional_categories['Survival'])
-                st.metric("🛡️ Survival Needs", f"{len(emotional_categories['Survival'])}")
-                st.caption(f"Total: {format_currency(survival_total)}")
-            
-            # AI Coach Recommendations
-            st.markdown("#### 🤖 AI Emotional Coach Insights")
-            
-            total_emotional = regret_total + impulse_total
-            if total_emotional > joy_total:
-                st.warning("🚨 **Coach Alert:** You're spending more on regret/impulse than joy! Let's fix this.")
-                
-                st.markdown("**🧸 Custom Action Plan:**")
-                st.markdown("• **Pause Rule:** Wait 24 hours before any purchase over $25")
-                st.markdown("• **Emotion Check:** Ask yourself 'Am I buying this because I'm sad/stressed?'")
-                st.markdown("• **Joy Alternative:** Next time you're sad, save $10 instead of shopping")
-                st.markdown("• **Celebration Savings:** Reward yourself with good vibes when you resist impulse buys!")
-                
-            elif joy_total > 0:
-                st.success("✨ **Coach Celebration:** You're spending mindfully and choosing joy! Keep it up!")
-                st.markdown("🎉 **Milestone Rewards:** You've made more joy purchases than regret purchases this week!")
-            
-            # Emotional spending tracker for new purchases
-            st.markdown("#### 💭 Why Did You Buy This?")
-            
-            with st.expander("🔍 Analyze Your Last Purchase", expanded=False):
-                if st.session_state.transactions:
-                    last_transaction = st.session_state.transactions[-1]
-                    st.write(f"**Last Purchase:** {last_transaction.description} - {format_currency(last_transaction.amount)}")
-                    
-                    emotional_reason = st.selectbox(
-                        "Why did you buy this?",
-                        ["I genuinely needed it", "It made me happy", "I was feeling sad/stressed", "It was on sale/impulse", "Social pressure", "Boredom"]
-                    )
-                    
-                    emotional_rating = st.slider("How do you feel about this purchase now?", 1, 10, 5)
-                    
-                    if st.button("💾 Save Emotional Analysis"):
-                        # Update transaction with emotional data
-                        last_transaction.emotional_reason = emotional_reason
-                        last_transaction.emotional_rating = emotional_rating
-                        st.success("🧠 Emotional data saved! I'll learn your patterns to help you better.")
-        
-        else:
-            st.info("💝 Start making some purchases to unlock emotional spending insights!")
-    
-    # Agent Notifications & Interventions
-    if st.session_state.get('agent_intensity', 3) >= 3:
-        st.markdown("### 🚨 Live Agent Interventions")
-        
-        # Check for spending deviations
-        if st.session_state.transactions:
-            recent_spending = sum(t.amount for t in st.session_state.transactions[-5:])  # Last 5 transactions
-            
-            if recent_spending > 200:  # Threshold for intervention
-                st.warning("🤖 **Agent Alert:** Heavy spending detected! Current session: " + format_currency(recent_spending))
-                st.markdown("**AI Suggestions:**")
-                st.markdown("• Take a 10-minute break before your next purchase")
-                st.markdown("• Consider if this aligns with your current goals")
-                st.markdown("• Remember: Every dollar saved is a step closer to your dreams! ✨")
-            
-            # Positive reinforcement
-            positive_transactions = [t for t in st.session_state.transactions[-10:] if getattr(t, 'vibe_impact', 0) > 0.2]
-            if len(positive_transactions) >= 3:
-                st.success("🎉 **Agent Celebration:** You're making smart, joy-filled purchases! Keep up the positive money vibes!")
-        
-        # Weekly check-ins (simulated)
-        if datetime.now().weekday() == 0:  # Monday
-            st.info("📅 **Weekly Agent Check-in:** How did your spending align with your goals last week?")
-            
-            weekly_reflection = st.selectbox(
-                "How do you feel about last week's spending?",
-                ["🔥 Crushed my goals!", "😌 Pretty good overall", "😅 Could've been better", "😔 Need to refocus"],
-                key="weekly_reflection"
-            )
-            
-            if weekly_reflection == "🔥 Crushed my goals!":
-                st.balloons()
-                st.success("🎉 Amazing work! Your AI agent is proud of you!")
-            elif weekly_reflection == "😔 Need to refocus":
-                st.markdown("💪 No worries! Let's adjust your plan and get back on track!")
+@timed()
+def emotion_window_summary(transactions, window):
+    """(count, USD total) per emotion for the rows inside one EMOTION_WINDOWS entry"""
+    labels = st.session_state.emotion_classifier.classify(transactions)
+    amounts = transactions.usd_amounts()
+    last, days = window
+    if last is not None:
+        return emotion_summary(labels[-last:], amounts[-last:])
+    if days is not None:
+        in_window = transactions.dates >= to_epoch_us(datetime.now() - timedelta(days=days))
+        return emotion_summary(labels[in_window], amounts[in_window])
+    counts, totals = emotion_summary(labels, amounts)
+    spilled_counts, spilled_totals = st.session_state.emotion_classifier.history.summary(transactions.usd_factors())
+    return counts + spilled_counts, totals + spilled_totals
+
+@timed()
+def build_emotion_trend_figure(transactions):
+    """Stacked monthly spend per emotion, amounts in the display currency"""
+    import plotly.graph_objects as go
+
+    classifier = st.session_state.emotion_classifier
+    labels = classifier.classify(transactions)
+    months, _, totals = merge_monthly_totals(
+        monthly_emotion_totals(labels, transactions.usd_amounts(), transactions.dates),
+        classifier.history.monthly(transactions.usd_factors())
+    )
+    if len(months) < 2:
+        return None
+    rate = currency_rates.get(st.session_state.currency, 1.0)
+    month_labels = [str(month) for month in months]
+    fig = go.Figure([
+        go.Bar(name=name, x=month_labels, y=(totals[:, code] * rate).tolist(), marker_color=color)
+        for code, (name, color) in enumerate(zip(EMOTIONS, ['#4ECDC4', '#FF6B6B', '#FFD93D', '#45B7D1']))
+    ])
+    fig.update_layout(
+        barmode='stack',
+        title=f"📅 Month-over-Month Emotional Spending ({get_currency_label()})",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+    return fig
 
 # =============================================================================
-# AGENT MILESTONE & REWARD SYSTEM
+# SESSION MEMORY BUDGET
 # =============================================================================
 
-if st.session_state.get('agent_enabled', False) and 'slay_goal' in st.session_state:
-    goal = st.session_state.slay_goal
-    progress = (goal['current_saved'] / goal['total_amount']) * 100
-    
-    # Milestone celebrations
-    milestones = [25, 50, 75, 90, 100]
-    
-    if 'celebrated_milestones' not in st.session_state:
-        st.session_state.celebrated_milestones = []
-    
-    for milestone in milestones:
-        if progress >= milestone and milestone not in st.session_state.celebrated_milestones:
-            st.session_state.celebrated_milestones.append(milestone)
-            
-            # Celebration based on milestone
-            if milestone == 25:
-                st.success("🎉 **25% Milestone!** You're officially on your way! Your AI agent believes in you!")
-            elif milestone == 50:
-                st.success("🚀 **Halfway There!** You're absolutely crushing this goal! Keep the momentum!")
-                st.balloons()
-            elif milestone == 75:
-                st.success("💎 **75% Complete!** You're in the final stretch! Your dream is so close!")
-            elif milestone == 90:
-                st.success("🔥 **90% Almost There!** Just a little more and you'll have your " + goal['item'] + "!")
-            elif milestone == 100:
-                st.success("🏆 **GOAL ACHIEVED!** You did it! Time to enjoy your " + goal['item'] + "! 🎊")
-                st.balloons()
-                # Reset goal after achievement
-                if st.button("🎯 Set New Goal"):
-                    del st.session_state.slay_goal
-                    st.rerun()
-            # Add this code in the sidebar section
+# Checked once per ledger version: over budget, the oldest rows are dropped from memory
+# (they stay in the LedgerStore) and only their aggregates and emotion history are kept
+if st.session_state.get('memory_checked_version') != st.session_state.transactions.version:
+    st.session_state.memory_usage = safe_execute(
+        lambda: memory_budget.enforce(st.session_state.transactions, st.session_state.emotion_classifier),
+        fallback=None,
+        error_message="Could not apply the session memory budget"
+    )
+    st.session_state.memory_checked_version = st.session_state.transactions.version
+    usage = st.session_state.memory_usage
+    if usage is not None and usage.spilled_rows:
+        logger.info(f"Session ledger at {usage.total_bytes / 1e6:.1f} MB with {usage.resident_rows:,} rows "
+                    f"resident and {usage.spilled_rows:,} spilled")
+
+# =============================================================================
+# AGENTIC AI FEATURES - AUTONOMOUS PLANNER & EMOTIONAL COACH
+# =============================================================================
+
+@st.fragment
+@timed()
+def render_agent_features():
+    """Slay planner, spending coach, interventions and milestones (reruns on its own)"""
+    if st.session_state.get('agent_enabled', False):
+        agent_mode = st.session_state.get('agent_mode', '💰 Autonomous Slay Planner')
+
+        if agent_mode == '💰 Autonomous Slay Planner':
+            st.markdown("### 🎯 Autonomous Slay Planner")
+
+            # Goal Setting Interface
+            with st.expander("🚀 Set Your Slay Goal", expanded=True):
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    goal_item = st.text_input("🎯 What do you want to buy?", placeholder="e.g., iPad, vacation, car")
+                    goal_amount = st.number_input("💰 How much does it cost?", min_value=1.0, value=500.0, step=50.0)
+
+                with col2:
+                    goal_months = st.slider("📅 In how many months?", 1, 24, 3)
+                    current_saved = st.number_input("💳 Already saved?", min_value=0.0, value=0.0, step=10.0)
+
+                if st.button("🚀 Activate Slay Planner", type="primary"):
+                    goal = st.session_state.goal_portfolio.add(SavingsGoal(
+                        name=goal_item or "Slay goal",
+                        target=goal_amount,
+                        deadline=deadline_in(goal_months),
+                        priority=PRIORITIES["🔥 High Priority"],
+                        saved=current_saved,
+                    ))
+                    weekly_savings_needed = goal.required_monthly(date.today()) / WEEKS_PER_MONTH
+
+                    st.success(f"🎯 Goal Set! Save {format_currency(weekly_savings_needed)} per week to get your {goal.name}!")
+
+            # Active Goal Tracking
+            portfolio = st.session_state.goal_portfolio
+            if portfolio.goals:
+                today = date.today()
+                st.markdown("#### 🔥 Your Active Slay Goals")
+
+                total_weekly = 0.0
+                for goal in sorted(portfolio.goals.values(), key=lambda goal: goal.deadline):
+                    weekly_needed = goal.required_monthly(today) / WEEKS_PER_MONTH
+                    total_weekly += weekly_needed
+
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("🎯 Goal", goal.name)
+                        st.metric("💰 Total Cost", format_currency(goal.target))
+
+                    with col2:
+                        st.number_input(
+                            "💳 Saved So Far", min_value=0.0, value=float(goal.saved), step=10.0,
+                            key=f"goal_saved_{goal.id}",
+                            on_change=lambda goal_id=goal.id: portfolio.update(
+                                goal_id, saved=st.session_state[f"goal_saved_{goal_id}"]
+                            ),
+                        )
+                        st.metric("📅 Time Left", f"{goal.months_left(today):.0f} months")
+
+                    with col3:
+                        st.metric("💪 Weekly Target", format_currency(weekly_needed))
+                        st.metric("📈 Progress", f"{goal.progress * 100:.1f}%")
+
+                    # Progress bar
+                    st.progress(goal.progress)
+
+                # AI Agent Intervention
+                if total_weekly > 0:
+                    st.markdown("#### 🤖 AI Agent Recommendations")
+
+                    # Calculate spending adjustments
+                    monthly_income = st.session_state.financial_profile.get('monthly_income', 0) if st.session_state.financial_profile else 3000
+                    weekly_income = monthly_income / WEEKS_PER_MONTH
+                    savings_rate = (total_weekly / weekly_income) * 100 if weekly_income > 0 else float('inf')
+
+                    slay_action = 'alert' if savings_rate > 30 else 'suggestion' if savings_rate > 15 else 'approved'
+                    audit_agent_action('slay_planner', slay_action, {
+                        'savings_rate': round(savings_rate, 1), 'weekly_target': round(total_weekly, 2),
+                        'goals': len(portfolio.goals),
+                    })
+                    if savings_rate > 30:
+                        st.warning(f"🚨 **Agent Alert:** Your goals require {savings_rate:.1f}% of your weekly income. Consider extending the timeline or finding additional income sources.")
+                    elif savings_rate > 15:
+                        st.info(f"💪 **Agent Suggestion:** Your goals require {savings_rate:.1f}% of weekly income. I'll help you optimize your 'wants' spending!")
+                    else:
+                        st.success(f"✅ **Agent Approved:** Your goals are achievable with {savings_rate:.1f}% of your income!")
+
+                    # Spending category recommendations
+                    st.markdown("**🎯 AI Spending Adjustments:**")
+                    st.markdown(f"• Reduce 'Joy' spending by {format_currency(total_weekly * 0.6)} per week")
+                    st.markdown(f"• Find {format_currency(total_weekly * 0.4)} in optimized 'Essential' spending")
+                    st.markdown("• I'll remind you when you're about to overspend! 🤖")
+
+        elif agent_mode == '🧾 Emotional Spending Coach':
+            st.markdown("### 🧾 Emotional Spending Tracker + Agentic Coaching")
+
+            # Emotional spending analysis
+            if st.session_state.transactions:
+                st.markdown("#### 🔍 Emotional Spending Analysis")
+
+                emotion_window = st.radio(
+                    "Window", list(EMOTION_WINDOWS.keys()), horizontal=True, key="emotion_window"
+                )
+                window_key = (st.session_state.transactions.version, emotion_window, datetime.now().date())
+                counts, totals = memoized(
+                    ('emotion_summary',) + window_key,
+                    lambda: emotion_window_summary(st.session_state.transactions, EMOTION_WINDOWS[emotion_window])
+                )
+                joy_total, regret_total, impulse_total, survival_total = totals.tolist()
+
+                # Display emotional spending breakdown
+                col1, col2, col3, col4 = st.columns(4)
+
+                with col1:
+                    st.metric("😊 Joy Purchases", f"{counts[JOY]}")
+                    st.caption(f"Total: {format_currency(joy_total)}")
+
+                with col2:
+                    st.metric("😔 Regret Purchases", f"{counts[REGRET]}")
+                    st.caption(f"Total: {format_currency(regret_total)}")
+
+                with col3:
+                    st.metric("⚡ Impulse Buys", f"{counts[IMPULSE]}")
+                    st.caption(f"Total: {format_currency(impulse_total)}")
+
+                with col4:
+                    st.metric("🛡️ Survival Needs", f"{counts[SURVIVAL]}")
+                    st.caption(f"Total: {format_currency(survival_total)}")
+
+                # Month-over-month emotional trend over the whole history
+                fig_emotions = memoized(
+                    ('fig_emotions', st.session_state.transactions.version) + display_key(),
+                    lambda: build_emotion_trend_figure(st.session_state.transactions)
+                )
+                if fig_emotions is not None:
+                    st.plotly_chart(fig_emotions, use_container_width=True)
+
+                # AI Coach Recommendations
+                st.markdown("#### 🤖 AI Emotional Coach Insights")
+
+                total_emotional = regret_total + impulse_total
+                coach_data = {'window': emotion_window, 'regret_impulse': round(total_emotional, 2), 'joy': round(joy_total, 2)}
+                if total_emotional > joy_total:
+                    audit_agent_action('emotional_coach', 'alert', coach_data)
+                    st.warning("🚨 **Coach Alert:** You're spending more on regret/impulse than joy! Let's fix this.")
+
+                    st.markdown("**🧸 Custom Action Plan:**")
+                    st.markdown("• **Pause Rule:** Wait 24 hours before any purchase over $25")
+                    st.markdown("• **Emotion Check:** Ask yourself 'Am I buying this because I'm sad/stressed?'")
+                    st.markdown("• **Joy Alternative:** Next time you're sad, save $10 instead of shopping")
+                    st.markdown("• **Celebration Savings:** Reward yourself with good vibes when you resist impulse buys!")
+
+                elif joy_total > 0:
+                    audit_agent_action('emotional_coach', 'celebration', coach_data)
+                    st.success("✨ **Coach Celebration:** You're spending mindfully and choosing joy! Keep it up!")
+                    st.markdown("🎉 **Milestone Rewards:** You've made more joy purchases than regret purchases this week!")
+
+                # Emotional spending tracker for new purchases
+                st.markdown("#### 💭 Why Did You Buy This?")
+
+                with st.expander("🔍 Analyze Your Last Purchase", expanded=False):
+                    if st.session_state.transactions:
+                        last_transaction = st.session_state.transactions[-1]
+                        st.write(f"**Last Purchase:** {last_transaction.description} - {format_currency(last_transaction.amount)}")
+
+                        # Answers are stored on the transaction's row, so a saved analysis comes back prefilled
+                        account = st.session_state.ledger_account
+                        saved_reason, saved_rating = safe_execute(
+                            lambda: get_ledger_store().reflection(last_transaction.id, account), fallback=None
+                        ) or (None, None)
+                        reasons = ["I genuinely needed it", "It made me happy", "I was feeling sad/stressed", "It was on sale/impulse", "Social pressure", "Boredom"]
+
+                        emotional_reason = st.selectbox(
+                            "Why did you buy this?",
+                            reasons,
+                            index=reasons.index(saved_reason) if saved_reason in reasons else 0
+                        )
+
+                        emotional_rating = st.slider("How do you feel about this purchase now?", 1, 10, saved_rating or 5)
+
+                        if st.button("💾 Save Emotional Analysis"):
+                            saved = safe_execute(
+                                lambda: get_ledger_store().save_reflection(
+                                    last_transaction.id, account, emotional_reason, emotional_rating
+                                ),
+                                fallback=False,
+                                error_message="Could not save your emotional analysis"
+                            )
+                            if saved:
+                                st.success("🧠 Emotional data saved! I'll learn your patterns to help you better.")
+                            else:
+                                st.warning("Couldn't save this one – that purchase isn't in your saved ledger.")
+
+            else:
+                st.info("💝 Start making some purchases to unlock emotional spending insights!")
+
+        # Agent Notifications & Interventions
+        if st.session_state.get('agent_intensity', 3) >= 3:
+            st.markdown("### 🚨 Live Agent Interventions")
+
+            # Check for spending deviations
+            if st.session_state.transactions:
+                recent_spending = st.session_state.transactions.recent_total(5)  # Last 5 transactions
+
+                if recent_spending > 200:  # Threshold for intervention
+                    audit_agent_action('live_interventions', 'heavy_spending', {'recent_spending': round(recent_spending, 2)})
+                    st.warning("🤖 **Agent Alert:** Heavy spending detected! Current session: " + format_currency(recent_spending))
+                    st.markdown("**AI Suggestions:**")
+                    st.markdown("• Take a 10-minute break before your next purchase")
+                    st.markdown("• Consider if this aligns with your current goals")
+                    st.markdown("• Remember: Every dollar saved is a step closer to your dreams! ✨")
+
+                # Positive reinforcement
+                positive_transactions = st.session_state.transactions.count_vibe_above(0.2, last=10)
+                if positive_transactions >= 3:
+                    audit_agent_action('live_interventions', 'celebration', {'positive_transactions': positive_transactions})
+                    st.success("🎉 **Agent Celebration:** You're making smart, joy-filled purchases! Keep up the positive money vibes!")
+
+            # Weekly check-ins (simulated)
+            if datetime.now().weekday() == 0:  # Monday
+                st.info("📅 **Weekly Agent Check-in:** How did your spending align with your goals last week?")
+
+                weekly_reflection = st.selectbox(
+                    "How do you feel about last week's spending?",
+                    ["🔥 Crushed my goals!", "😌 Pretty good overall", "😅 Could've been better", "😔 Need to refocus"],
+                    key="weekly_reflection"
+                )
+
+                if weekly_reflection == "🔥 Crushed my goals!":
+                    st.balloons()
+                    st.success("🎉 Amazing work! Your AI agent is proud of you!")
+                elif weekly_reflection == "😔 Need to refocus":
+                    st.markdown("💪 No worries! Let's adjust your plan and get back on track!")
+
+    # =============================================================================
+    # AGENT MILESTONE & REWARD SYSTEM
+    # =============================================================================
+
+    if st.session_state.get('agent_enabled', False) and st.session_state.goal_portfolio.goals:
+        portfolio = st.session_state.goal_portfolio
+
+        # Milestone celebrations
+        milestones = [25, 50, 75, 90, 100]
+
+        if 'celebrated_milestones' not in st.session_state:
+            st.session_state.celebrated_milestones = set()
+
+        for goal in list(portfolio.goals.values()):
+            progress = goal.progress * 100
+            for milestone in milestones:
+                if progress >= milestone and (goal.id, milestone) not in st.session_state.celebrated_milestones:
+                    st.session_state.celebrated_milestones.add((goal.id, milestone))
+                    audit_agent_action('milestones', 'milestone', {'goal': goal.name, 'goal_id': goal.id, 'milestone': milestone})
+
+                    # Celebration based on milestone
+                    if milestone == 25:
+                        st.success(f"🎉 **25% Milestone!** You're officially on your way to your {goal.name}! Your AI agent believes in you!")
+                    elif milestone == 50:
+                        st.success(f"🚀 **Halfway There!** You're absolutely crushing your {goal.name} goal! Keep the momentum!")
+                        st.balloons()
+                    elif milestone == 75:
+                        st.success(f"💎 **75% Complete!** You're in the final stretch! Your {goal.name} is so close!")
+                    elif milestone == 90:
+                        st.success("🔥 **90% Almost There!** Just a little more and you'll have your " + goal.name + "!")
+                    elif milestone == 100:
+                        st.success("🏆 **GOAL ACHIEVED!** You did it! Time to enjoy your " + goal.name + "! 🎊")
+                        st.balloons()
+
+            # Reset goal after achievement
+            if goal.progress >= 1 and st.button(f"🎯 Close {goal.name} & Set New Goal", key=f"close_goal_{goal.id}"):
+                portfolio.remove(goal.id)
+                st.rerun()
+
+script_clock.lap("session setup & sidebar")
+render_agent_features()
+script_clock.restart()
 
 # Add this code in the sidebar section AFTER the Agentic AI Toggle
 
@@ -738,7 +708,7 @@ if st.session_state.get('agent_enabled', False):
         st.session_state.current_page = 'home'
 
     # Custom CSS for horizontal buttons with active states
-    st.markdown("""
+    render_html("""
     <style>
     .nav-button-row {
         display: flex;
@@ -777,7 +747,7 @@ if st.session_state.get('agent_enabled', False):
         background: linear-gradient(135deg, #4ECDC4 0%, #45B7D1 100%);
     }
     </style>
-    """, unsafe_allow_html=True)
+    """)
 
     # Create horizontal button row
     col1, col2, col3, col4 = st.columns(4)
@@ -790,62 +760,33 @@ if st.session_state.get('agent_enabled', False):
     with col2:
         if st.button('🌈 Vibe', key='vibe_btn', use_container_width=True):
             st.session_state.current_page = 'vibe'
-            st.markdown("""
+            render_html("""
             <script>
             document.querySelector('h1').scrollIntoView({behavior: 'smooth'});
             </script>
-            """, unsafe_allow_html=True)
+            """)
 
     with col3:
         if st.button('🔥 Planning', key='planning_btn', use_container_width=True):
             st.session_state.current_page = 'planning'
-            st.markdown("""
+            render_html("""
             <script>
             const element = document.querySelector('h2:nth-of-type(1)');
             if (element && element.textContent.includes('Financial Survival Guide')) {
                 element.scrollIntoView({behavior: 'smooth'});
             }
             </script>
-            """, unsafe_allow_html=True)
+            """)
 
     with col4:
         if st.button('💎 Survival Guide', key='survival_btn', use_container_width=True):
-            st.markdown("""
+            render_html("""
             <script>
             window.open('https://finaura.streamlit.app/#your-personalized-financial-blueprint', '_blank');
             </script>
-            """, unsafe_allow_html=True)
+            """)
 
     st.markdown('---')
-# Helper to convert and format currency with error handling
-
-def format_currency(amount, decimals=2):
-    """Safely format currency with error handling"""
-    try:
-        if amount is None or math.isnan(amount) or math.isinf(amount):
-            amount = 0
-        
-        symbol = currency_symbols.get(st.session_state.currency, '$')
-        rate = currency_rates.get(st.session_state.currency, 1.0)
-        value = float(amount) * rate
-        
-        if symbol == 'PKR':
-            return f"PKR {value:,.{decimals}f}"
-        elif symbol == '€':
-            return f"€{value:,.{decimals}f}"
-        else:
-            return f"${value:,.{decimals}f}"
-    except (ValueError, TypeError, KeyError) as e:
-        logger.warning(f"Currency formatting error: {str(e)}")
-        return f"${float(amount or 0):,.{decimals}f}"
-
-# Helper to get currency label for headings
-
-def get_currency_label():
-    symbol = currency_symbols[st.session_state.currency]
-    code = st.session_state.currency
-    return f"{symbol} ({code})"
-
 # =============================================================================
 # MAIN APP INTERFACE
 # =============================================================================
@@ -858,14 +799,14 @@ def get_currency_label():
 
 try:
     # Header with Gen Z energy
-    st.markdown("""
+    render_html("""
     <div class="main-header">
         <h1>💸 FinAura: Your Gen Z CFO</h1>
         <h5>Emotionally Smart. Financially Sharp.</h5>
         <p><em>"Forget spreadsheets. Feel your finances."</em></p>
         
     </div>
-    """, unsafe_allow_html=True)
+    """)
     
     # Error count display for admins
     if st.session_state.debug_mode and st.session_state.error_count > 0:
@@ -881,125 +822,127 @@ except Exception as e:
 # FINANCIAL PROFILE SETUP
 # =============================================================================
 
-st.markdown("## 💼 Financial Profile Setup")
+@st.fragment
+@timed()
+def render_profile_setup():
+    """Profile form; only saving it reruns the rest of the app"""
+    st.markdown("## 💼 Financial Profile Setup")
 
-with st.expander("🚀 Set Up Your Financial Profile (Click to expand)", expanded=not st.session_state.financial_profile):
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        monthly_income = st.number_input(
-            f"💰 Monthly Income/Allowance {get_currency_label()}",
-            min_value=0.0,
-            value=st.session_state.financial_profile.get('monthly_income', 50000.0),
-            step=1000.0,
-            help="Include salary, freelance, side hustles, everything!"
-        )
-        
-        age = st.slider(
-            "🎂 Age",
-            min_value=18,
-            max_value=35,
-            value=st.session_state.financial_profile.get('age', 25)
-        )
-    
-    with col2:
-        employment_status = st.selectbox(
-            "👔 Employment Status",
-            ["Student", "Full-time Job", "Freelancer", "Part-time", "Unemployed", "Side Hustle King/Queen"],
-            index=1
-        )
-        
-        living_situation = st.selectbox(
-            "🏠 Living Situation",
-            ["With Parents (blessed!)", "Shared Apartment", "Solo Living", "Dorm Life"],
-            index=0
-        )
-    
-    with col3:
-        risk_tolerance = st.selectbox(
-            "📊 Investment Risk Tolerance",
-            ["Conservative (play it safe)", "Moderate (balanced vibes)", "Aggressive (YOLO but smart)"],
-            index=1
-        )
-        
-        primary_goal = st.selectbox(
-            "🎯 Primary Financial Goal",
-            list(FinancialGoal),
-            format_func=lambda x: x.value
-        )
-    
-    if st.button("💾 Save My Financial Profile", type="primary"):
-        st.session_state.financial_profile = {
-            'monthly_income': monthly_income,
-            'age': age,
-            'employment_status': employment_status,
-            'living_situation': living_situation,
-            'risk_tolerance': risk_tolerance,
-            'primary_goal': primary_goal
-        }
-        
-        # Generate budget plan
-        budget_suggestions = st.session_state.agent.get_budget_suggestions(monthly_income, age)
-        st.session_state.budget_plan = BudgetPlan(
-            monthly_income=monthly_income,
-            needs_percentage=budget_suggestions['needs'],
-            wants_percentage=budget_suggestions['wants'],
-            savings_percentage=budget_suggestions['savings']
-        )
-        
-        st.success("🎉 Profile saved! Your personalized financial plan is ready!")
-        st.rerun()
+    with st.expander("🚀 Set Up Your Financial Profile (Click to expand)", expanded=not st.session_state.financial_profile):
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            monthly_income = st.number_input(
+                f"💰 Monthly Income/Allowance {get_currency_label()}",
+                min_value=0.0,
+                value=st.session_state.financial_profile.get('monthly_income', 50000.0),
+                step=1000.0,
+                help="Include salary, freelance, side hustles, everything!"
+            )
+
+            age = st.slider(
+                "🎂 Age",
+                min_value=18,
+                max_value=35,
+                value=st.session_state.financial_profile.get('age', 25)
+            )
+
+        with col2:
+            employment_status = st.selectbox(
+                "👔 Employment Status",
+                ["Student", "Full-time Job", "Freelancer", "Part-time", "Unemployed", "Side Hustle King/Queen"],
+                index=1
+            )
+
+            living_situation = st.selectbox(
+                "🏠 Living Situation",
+                ["With Parents (blessed!)", "Shared Apartment", "Solo Living", "Dorm Life"],
+                index=0
+            )
+
+        with col3:
+            risk_tolerance = st.selectbox(
+                "📊 Investment Risk Tolerance",
+                ["Conservative (play it safe)", "Moderate (balanced vibes)", "Aggressive (YOLO but smart)"],
+                index=1
+            )
+
+            primary_goal = st.selectbox(
+                "🎯 Primary Financial Goal",
+                list(FinancialGoal),
+                format_func=lambda x: x.value
+            )
+
+        if st.button("💾 Save My Financial Profile", type="primary"):
+            st.session_state.financial_profile = {
+                'monthly_income': monthly_income,
+                'age': age,
+                'employment_status': employment_status,
+                'living_situation': living_situation,
+                'risk_tolerance': risk_tolerance,
+                'primary_goal': primary_goal
+            }
+            st.session_state.profile_version += 1
+
+            # Generate budget plan
+            budget_suggestions = get_agent().get_budget_suggestions(monthly_income, age)
+            st.session_state.budget_plan = BudgetPlan(
+                monthly_income=monthly_income,
+                needs_percentage=budget_suggestions['needs'],
+                wants_percentage=budget_suggestions['wants'],
+                savings_percentage=budget_suggestions['savings']
+            )
+            # Needs/wants allocations for this month onward (Budget vs Reality reads them back)
+            safe_execute(lambda: get_ledger_store().set_allocations(
+                st.session_state.ledger_account, datetime.now(), {
+                    SpendingCategory.ESSENTIAL: st.session_state.budget_plan.needs_amount,
+                    SpendingCategory.JOY: st.session_state.budget_plan.wants_amount,
+                }
+            ), error_message="Could not save your budget")
+
+            st.success("🎉 Profile saved! Your personalized financial plan is ready!")
+            st.rerun()
+
+script_clock.lap("navigation & header")
+render_profile_setup()
+script_clock.restart()
 
 # =============================================================================
 # PERSONALIZED BUDGET BREAKDOWN
 # =============================================================================
 
-if st.session_state.budget_plan:
-    st.markdown("## 💎 Your Personalized Gen Z Budget Structure")
-    
-    budget = st.session_state.budget_plan
-    profile = st.session_state.financial_profile
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
+@timed()
+def build_budget_cards(budget):
+    """Markup for the four budget-structure cards"""
+    return [f"""
         <div class="budget-card">
             <h3>💰 Monthly Income</h3>
             <h2>{format_currency(budget.monthly_income, 0)}</h2>
             <p>Your total hustle</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
+        """, f"""
         <div class="budget-card">
             <h3>🏠 Needs ({budget.needs_percentage}%)</h3>
             <h2>{format_currency(budget.needs_amount, 0)}</h2>
             <p>Rent, food, transport</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
+        """, f"""
         <div class="budget-card">
             <h3>✨ Wants ({budget.wants_percentage}%)</h3>
             <h2>{format_currency(budget.wants_amount, 0)}</h2>
             <p>Fun, joy, self-care</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
+        """, f"""
         <div class="budget-card">
             <h3>📈 Savings ({budget.savings_percentage}%)</h3>
             <h2>{format_currency(budget.savings_amount, 0)}</h2>
             <p>Future you fund</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    # Budget visualization
-    st.markdown("### 📊 Your Budget Breakdown")
+        """]
+
+@timed()
+def build_budget_figure(budget):
+    import plotly.express as px
     
     budget_data = {
         'Category': ['🏠 Needs', '✨ Wants', '📈 Savings'],
@@ -1018,12 +961,55 @@ if st.session_state.budget_plan:
         paper_bgcolor='rgba(0,0,0,0)',
         font=dict(size=14)
     )
+    return fig_budget
+
+if st.session_state.budget_plan:
+    st.markdown("## 💎 Your Personalized Gen Z Budget Structure")
+    
+    budget = st.session_state.budget_plan
+    profile = st.session_state.financial_profile
+    profile_version = st.session_state.profile_version
+    
+    budget_cards = memoized(('budget_cards', profile_version) + display_key(), lambda: build_budget_cards(budget))
+    for column, card in zip(st.columns(4), budget_cards):
+        with column:
+            render_html(card)
+    
+    # Budget visualization
+    st.markdown("### 📊 Your Budget Breakdown")
+    
+    fig_budget = memoized(('fig_budget', profile_version), lambda: build_budget_figure(budget))
     st.plotly_chart(fig_budget, use_container_width=True)
 
+script_clock.lap("budget breakdown")
+
 # =============================================================================
 # INVESTMENT SUGGESTIONS
 # =============================================================================
 
+def build_roadmap(profile, risk_level):
+    """Roadmap items with their simulated progress, drawn once per profile instead of on every rerun"""
+    roadmap = get_agent().get_investment_roadmap(
+        profile['age'], 
+        profile['monthly_income'],
+        risk_level
+    )
+    return [(item, min(100, random.randint(10, 80))) for item in roadmap]  # Simulated progress
+
+@timed()
+def build_roadmap_cards(roadmap):
+    return [f"""
+            <div class="financial-goal-card">
+                <h4>Priority {item['priority']}: {item['goal']}</h4>
+                <p>{item['description']}</p>
+                <p><strong>Target:</strong> {format_currency(item['target'], 0)}</p>
+                <div class="progress-bar">
+                    <div class="progress-fill" style="width: {progress}%"></div>
+                </div>
+                <p><small>{progress}% Complete</small></p>
+            </div>
+            """ for item, progress in roadmap]
+
 if st.session_state.financial_profile:
     st.markdown("## 📈 Gen Z Investment Roadmap")
     
@@ -1036,43 +1022,30 @@ if st.session_state.financial_profile:
         st.markdown("### 🚀 Recommended Investments")
         
         if risk_level == "conservative":
-            investments = st.session_state.agent.investment_suggestions["low_risk"]
+            investments = get_agent().investment_suggestions["low_risk"]
         elif risk_level == "moderate":
-            investments = st.session_state.agent.investment_suggestions["medium_risk"]
+            investments = get_agent().investment_suggestions["medium_risk"]
         else:
-            investments = st.session_state.agent.investment_suggestions["high_risk"]
+            investments = get_agent().investment_suggestions["high_risk"]
         
         for inv in investments:
-            st.markdown(f"""
+            render_html(f"""
             <div class="investment-card">
                 <h4>{inv['name']}</h4>
                 <p>{inv['desc']}</p>
                 <p><strong>Risk:</strong> {inv['risk']} | <strong>Expected Return:</strong> {inv['return']}</p>
             </div>
-            """, unsafe_allow_html=True)
+            """)
     
     with col2:
         st.markdown("### 🎯 Your Financial Goals Roadmap")
         
-        roadmap = st.session_state.agent.get_investment_roadmap(
-            profile['age'], 
-            profile['monthly_income'],
-            risk_level
-        )
-        
-        for item in roadmap:
-            progress = min(100, random.randint(10, 80))  # Simulated progress
-            st.markdown(f"""
-            <div class="financial-goal-card">
-                <h4>Priority {item['priority']}: {item['goal']}</h4>
-                <p>{item['description']}</p>
-                <p><strong>Target:</strong> {format_currency(item['target'], 0)}</p>
-                <div class="progress-bar">
-                    <div class="progress-fill" style="width: {progress}%"></div>
-                </div>
-                <p><small>{progress}% Complete</small></p>
-            </div>
-            """, unsafe_allow_html=True)
+        roadmap_key = ('roadmap', st.session_state.profile_version, risk_level)
+        roadmap = memoized(roadmap_key, lambda: build_roadmap(profile, risk_level))
+        for card in memoized(roadmap_key + display_key(), lambda: build_roadmap_cards(roadmap)):
+            render_html(card)
+
+script_clock.lap("investment suggestions")
 
 # =============================================================================
 # GEN Z FINANCIAL SURVIVAL GUIDE
@@ -1205,740 +1178,586 @@ with tab4:
         - Network like crazy! 🤝
         """)
 
+script_clock.lap("survival guide")
+
 # =============================================================================
 # HERO VIBE CHECK SECTION (Gen Z Hero Feature)
 # =============================================================================
 
-st.markdown("""
-<div style='
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    padding: 2.5rem 1rem 2rem 1rem;
-    border-radius: 25px;
-    margin-bottom: 2.5rem;
-    text-align: center;
-    color: white;
-    box-shadow: 0 8px 32px rgba(102,126,234,0.15);
-'>
-    <h1 style='font-size: 2.8rem; margin-bottom: 0.5rem;'>🌈 Daily Vibe Check</h1>
-    <p style='font-size: 1.3rem; margin-bottom: 1.5rem; font-style: italic;'>How are you feeling about your money today?</p>
+@st.fragment
+@timed()
+def render_vibe_check():
+    """Vibe selector, stress/confidence sliders and the mood aura"""
+    render_html("""
+<div class="vibe-hero">
+    <h1>🌈 Daily Vibe Check</h1>
+    <p>How are you feeling about your money today?</p>
 </div>
-""", unsafe_allow_html=True)
+""")
 
-# Large, central vibe selector and sliders
-vibe_col, stress_col, conf_col = st.columns([2, 1, 1])
+    # Large, central vibe selector and sliders
+    vibe_col, stress_col, conf_col = st.columns([2, 1, 1])
 
-with vibe_col:
-    # Ensure current_vibe is always a valid VibeType
-    try:
-        vibe_index = list(VibeType).index(st.session_state.current_vibe)
-    except Exception:
-        st.session_state.current_vibe = VibeType.CHILL
-        vibe_index = list(VibeType).index(VibeType.CHILL)
-    current_vibe = st.selectbox(
-        "",
-        options=list(VibeType),
-        format_func=lambda x: f"{x.value} {x.name.title()}",
-        index=vibe_index,
-        key="hero_vibe_selectbox"
-    )
-    
-    # Check if vibe changed and trigger emoji pop-out effect
-    if 'previous_vibe' not in st.session_state:
-        st.session_state.previous_vibe = current_vibe
-    
-    if current_vibe != st.session_state.previous_vibe:
-        # Trigger emoji pop-out effect instead of balloons
-        st.markdown(f"""
-        <div id="emoji-popup" style="
-            position: fixed;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            font-size: 8rem;
-            z-index: 9999;
-            animation: emojiPop 2s ease-out forwards;
-            pointer-events: none;
-        ">
-            {current_vibe.value}
-        </div>
-        <style>
-        @keyframes emojiPop {{
-            0% {{ 
-                opacity: 0; 
-                transform: translate(-50%, -50%) scale(0.1); 
-            }}
-            50% {{ 
-                opacity: 1; 
-                transform: translate(-50%, -50%) scale(1.2); 
-            }}
-            100% {{ 
-                opacity: 0; 
-                transform: translate(-50%, -50%) scale(0.8) translateY(-100px); 
-            }}
-        }}
-        </style>
-        <script>
-        setTimeout(function() {{
-            var popup = document.getElementById('emoji-popup');
-            if (popup) {{
-                popup.remove();
-            }}
-        }}, 2000);
-        </script>
-        """, unsafe_allow_html=True)
-        st.session_state.previous_vibe = current_vibe
-    
-    # =============================================================================
-    # DYNAMIC AURA SYSTEM - CHANGES WEBSITE COLORS BASED ON MOOD
-    # =============================================================================
-    
-    # Define mood-based color schemes and auras
-    vibe_auras = {
-        VibeType.STRESSED: {
-            "primary": "#FF6B6B",
-            "secondary": "#FF8E8E", 
-            "accent": "#FFB3B3",
-            "bg_start": "#FF4757",
-            "bg_end": "#FF6B6B",
-            "card_bg": "linear-gradient(135deg, #FF6B6B 0%, #FF4757 100%)",
-            "text_glow": "#FF6B6B",
-            "particle_color": "#FF8E8E",
-            "aura_name": "Stress Relief Aura",
-            "description": "Calming reds to acknowledge stress while promoting healing"
-        },
-        VibeType.CONFIDENT: {
-            "primary": "#4ECDC4",
-            "secondary": "#45B7D1",
-            "accent": "#96CEB4",
-            "bg_start": "#667eea",
-            "bg_end": "#764ba2",
-            "card_bg": "linear-gradient(135deg, #4ECDC4 0%, #45B7D1 100%)",
-            "text_glow": "#4ECDC4",
-            "particle_color": "#45B7D1",
-            "aura_name": "Confidence Power Aura",
-            "description": "Bold blues and teals radiating success energy"
-        },
-        VibeType.CONFUSED: {
-            "primary": "#A8A8A8",
-            "secondary": "#B8B8B8",
-            "accent": "#D3D3D3",
-            "bg_start": "#74b9ff",
-            "bg_end": "#0984e3",
-            "card_bg": "linear-gradient(135deg, #A8A8A8 0%, #74b9ff 100%)",
-            "text_glow": "#74b9ff",
-            "particle_color": "#B8B8B8",
-            "aura_name": "Clarity Seeking Aura",
-            "description": "Cool grays and blues to promote mental clarity"
-        },
-        VibeType.EXCITED: {
-            "primary": "#FFD93D",
-            "secondary": "#FF6B35",
-            "accent": "#FF8B94",
-            "bg_start": "#FFD93D",
-            "bg_end": "#FF6B35",
-            "card_bg": "linear-gradient(135deg, #FFD93D 0%, #FF6B35 100%)",
-            "text_glow": "#FFD93D",
-            "particle_color": "#FF8B94",
-            "aura_name": "High Energy Excitement Aura",
-            "description": "Vibrant yellows and oranges bursting with excitement"
-        },
-        VibeType.CHILL: {
-            "primary": "#96CEB4",
-            "secondary": "#FFEAA7",
-            "accent": "#DDA0DD",
-            "bg_start": "#96CEB4",
-            "bg_end": "#FFEAA7",
-            "card_bg": "linear-gradient(135deg, #96CEB4 0%, #FFEAA7 100%)",
-            "text_glow": "#96CEB4",
-            "particle_color": "#DDA0DD",
-            "aura_name": "Zen Chill Aura",
-            "description": "Peaceful greens and soft yellows for ultimate relaxation"
-        },
-        VibeType.GUILTY: {
-            "primary": "#E17055",
-            "secondary": "#FDCB6E",
-            "accent": "#FD79A8",
-            "bg_start": "#E17055",
-            "bg_end": "#FDCB6E",
-            "card_bg": "linear-gradient(135deg, #E17055 0%, #FDCB6E 100%)",
-            "text_glow": "#E17055",
-            "particle_color": "#FD79A8",
-            "aura_name": "Self-Compassion Aura",
-            "description": "Warm oranges and peaches promoting self-forgiveness"
-        }
-    }
-    
-    current_aura = vibe_auras[current_vibe]
-    
-    # Apply dynamic aura styling
-    st.markdown(f"""
-    <style>
-    /* DYNAMIC AURA SYSTEM - MOOD-RESPONSIVE DESIGN */
-    
-    :root {{
-        --aura-primary: {current_aura['primary']};
-        --aura-secondary: {current_aura['secondary']};
-        --aura-accent: {current_aura['accent']};
-        --aura-glow: {current_aura['text_glow']};
-    }}
-    
-    /* Animated background aura effect */
-    .stApp {{
-        background: linear-gradient(45deg, {current_aura['bg_start']}22, {current_aura['bg_end']}22);
-        animation: auraShift 8s ease-in-out infinite alternate;
-    }}
-    
-    @keyframes auraShift {{
-        0% {{ background: linear-gradient(45deg, {current_aura['bg_start']}15, {current_aura['bg_end']}15); }}
-        100% {{ background: linear-gradient(135deg, {current_aura['bg_end']}15, {current_aura['bg_start']}15); }}
-    }}
-    
-    /* Dynamic card styling based on mood */
-    .main-header {{
-        background: {current_aura['card_bg']} !important;
-        box-shadow: 0 10px 30px {current_aura['primary']}40 !important;
-        animation: cardGlow 3s ease-in-out infinite alternate;
-    }}
-    
-    @keyframes cardGlow {{
-        0% {{ box-shadow: 0 10px 30px {current_aura['primary']}40; }}
-        100% {{ box-shadow: 0 15px 40px {current_aura['primary']}60, 0 0 20px {current_aura['text_glow']}30; }}
-    }}
-    
-    .vibe-card {{
-        background: {current_aura['card_bg']} !important;
-        box-shadow: 0 8px 25px {current_aura['primary']}35 !important;
-    }}
-    
-    .money-card {{
-        background: {current_aura['card_bg']} !important;
-        border: 2px solid {current_aura['accent']}60;
-        box-shadow: 0 5px 20px {current_aura['primary']}30;
-    }}
-    
-    .budget-card {{
-        background: linear-gradient(135deg, {current_aura['accent']}80, {current_aura['secondary']}60) !important;
-        border: 1px solid {current_aura['primary']}40;
-    }}
-    
-    .investment-card {{
-        background: linear-gradient(135deg, {current_aura['secondary']}70, {current_aura['accent']}50) !important;
-        border-left: 4px solid {current_aura['primary']};
-    }}
-    
-    .financial-goal-card {{
-        background: {current_aura['card_bg']} !important;
-        box-shadow: 0 6px 20px {current_aura['primary']}35;
-    }}
-    
-    /* Mood-responsive text effects */
-    h1, h2, h3 {{
-        text-shadow: 0 0 10px {current_aura['text_glow']}50 !important;
-        animation: textGlow 2s ease-in-out infinite alternate;
-    }}
-    
-    @keyframes textGlow {{
-        0% {{ text-shadow: 0 0 10px {current_aura['text_glow']}50; }}
-        100% {{ text-shadow: 0 0 15px {current_aura['text_glow']}70, 0 0 25px {current_aura['text_glow']}30; }}
-    }}
-    
-    /* Button styling matches mood */
-    .stButton > button {{
-        background: {current_aura['card_bg']} !important;
-        border: 2px solid {current_aura['primary']} !important;
-        box-shadow: 0 4px 15px {current_aura['primary']}40 !important;
-        transition: all 0.3s ease !important;
-    }}
-    
-    .stButton > button:hover {{
-        box-shadow: 0 8px 25px {current_aura['primary']}60, 0 0 20px {current_aura['text_glow']}50 !important;
-        transform: translateY(-3px) !important;
-    }}
-    
-    /* Progress bars match the aura */
-    .progress-fill {{
-        background: {current_aura['card_bg']} !important;
-        box-shadow: inset 0 0 10px {current_aura['text_glow']}30;
-    }}
-    
-    /* Sidebar matches mood */
-    .sidebar .sidebar-content {{
-        background: linear-gradient(180deg, {current_aura['primary']}, {current_aura['secondary']}) !important;
-    }}
-    
-    /* Floating particles for extra aura effect */
-    .aura-particles {{
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        pointer-events: none;
-        z-index: 1;
-    }}
-    
-    .particle {{
-        position: absolute;
-        width: 4px;
-        height: 4px;
-        background: {current_aura['particle_color']};
-        border-radius: 50%;
-        animation: float 15s infinite linear;
-        opacity: 0.6;
-    }}
-    
-    @keyframes float {{
-        0% {{ transform: translateY(100vh) rotate(0deg); }}
-        100% {{ transform: translateY(-100px) rotate(360deg); }}
-    }}
-    
-    /* Create multiple particles with different delays */
-    .particle:nth-child(1) {{ left: 10%; animation-delay: 0s; }}
-    .particle:nth-child(2) {{ left: 20%; animation-delay: 2s; }}
-    .particle:nth-child(3) {{ left: 30%; animation-delay: 4s; }}
-    .particle:nth-child(4) {{ left: 40%; animation-delay: 6s; }}
-    .particle:nth-child(5) {{ left: 50%; animation-delay: 8s; }}
-    .particle:nth-child(6) {{ left: 60%; animation-delay: 10s; }}
-    .particle:nth-child(7) {{ left: 70%; animation-delay: 12s; }}
-    .particle:nth-child(8) {{ left: 80%; animation-delay: 14s; }}
-    .particle:nth-child(9) {{ left: 90%; animation-delay: 16s; }}
-    
-    </style>
-    
-    <!-- Floating particles for aura effect -->
-    <div class="aura-particles">
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-        <div class="particle"></div>
-    </div>
-    
-    <!-- Aura notification -->
-    <div style="
-        position: fixed;
-        top: 20px;
-        right: 20px;
-        background: {current_aura['card_bg']};
-        color: white;
-        padding: 12px 20px;
-        border-radius: 25px;
-        font-size: 0.9em;
-        font-weight: 600;
-        box-shadow: 0 8px 25px {current_aura['primary']}50;
-        z-index: 1000;
-        animation: auraNotification 4s ease-out;
-    ">
-        ✨ {current_aura['aura_name']} Activated ✨
-    </div>
-    
-    
-    
-    """, unsafe_allow_html=True)
-    
-    st.session_state.current_vibe = current_vibe
-
-with stress_col:
-    stress_level = st.slider("Money stress level", 1, 10, 5, key="hero_stress_slider")
-
-with conf_col:
-    confidence_level = st.slider("Financial confidence", 1, 10, 6, key="hero_conf_slider")
-
-# AI Response based on vibe (big, animated card) with dynamic aura
-current_aura = vibe_auras[current_vibe]
-vibe_response = st.session_state.agent.get_vibe_response(current_vibe)
-
-# Enhanced response card with aura integration
-st.markdown(f"""
-<div style='
-    background: {current_aura['card_bg']};
-    padding: 2rem;
-    border-radius: 20px;
-    margin: 1.5rem 0 2.5rem 0;
-    color: white;
-    font-size: 1.5rem;
-    font-weight: bold;
-    box-shadow: 0 10px 30px {current_aura['primary']}40, 0 0 40px {current_aura['text_glow']}20;
-    transition: all 0.3s;
-    animation: heroFadeIn 1s, auraGlow 3s ease-in-out infinite alternate;
-    border: 2px solid {current_aura['accent']}60;
-'>
-   
-
-<style>
-@keyframes heroFadeIn {{
-    from {{ opacity: 0; transform: translateY(0); }}
-    to {{ opacity: 1; transform: translateY(0); }}
-}}
-
-@keyframes auraGlow {{
-    0% {{ 
-        box-shadow: 0 10px 30px {current_aura['primary']}40, 0 0 40px {current_aura['text_glow']}20;
-        transform: scale(1);
-    }}
-    100% {{ 
-        box-shadow: 0 15px 40px {current_aura['primary']}60, 0 0 60px {current_aura['text_glow']}40;
-        transform: scale(1.02);
-    }}
-}}
-</style>
-""", unsafe_allow_html=True)
+    with vibe_col:
+        # Ensure current_vibe is always a valid VibeType
+        try:
+            vibe_index = list(VibeType).index(st.session_state.current_vibe)
+        except Exception:
+            st.session_state.current_vibe = VibeType.CHILL
+            vibe_index = list(VibeType).index(VibeType.CHILL)
+        current_vibe = st.selectbox(
+            "",
+            options=list(VibeType),
+            format_func=lambda x: f"{x.value} {x.name.title()}",
+            index=vibe_index,
+            key="hero_vibe_selectbox"
+        )
+
+        # Check if vibe changed and trigger emoji pop-out effect
+        if 'previous_vibe' not in st.session_state:
+            st.session_state.previous_vibe = current_vibe
+
+        if current_vibe != st.session_state.previous_vibe:
+            # Trigger emoji pop-out effect instead of balloons
+            render_html(f'<div id="emoji-popup" class="emoji-popup">{current_vibe.value}</div>')
+            st.session_state.previous_vibe = current_vibe
+
+        # Dynamic aura: the stylesheet is already on the page, a vibe only swaps its variables
+        render_html(AURA_MARKUP[current_vibe])
+
+        st.session_state.current_vibe = current_vibe
+
+    with stress_col:
+        stress_level = st.slider("Money stress level", 1, 10, 5, key="hero_stress_slider")
+
+    with conf_col:
+        confidence_level = st.slider("Financial confidence", 1, 10, 6, key="hero_conf_slider")
+
+    # AI Response based on vibe (big, animated card) with dynamic aura
+    vibe_response = get_agent().get_vibe_response(current_vibe)
+    render_html("<div class='vibe-response-card'></div>")
+
+render_vibe_check()
+script_clock.restart()
 
 # =============================================================================
 # ENHANCED MONEY DASHBOARD
 # =============================================================================
 
-st.markdown("## 💰 Your Money Mood Board")
-
+# Days the "Daily Average" card averages over (fewer if the history is shorter)
 # Safe calculations with error handling
+@timed()
 def calculate_dashboard_metrics():
     try:
-        transactions = st.session_state.transactions or []
-        total_spent = sum(t.amount for t in transactions if hasattr(t, 'amount') and t.amount)
-        avg_daily = handle_calculation_error(lambda: total_spent / 7, 0)
-        joy_spending = sum(t.amount for t in transactions if hasattr(t, 'category') and t.category == SpendingCategory.JOY and t.amount)
-        essential_spending = sum(t.amount for t in transactions if hasattr(t, 'category') and t.category == SpendingCategory.ESSENTIAL and t.amount)
-        return total_spent, avg_daily, joy_spending, essential_spending
+        transactions = st.session_state.transactions
+        today = datetime.now().date()
+        windows = memoized(
+            ('dashboard', transactions.version, today) + display_key(),
+            lambda: spend_windows(transactions, today, get_rate_provider(), st.session_state.currency)
+        )
+        return dashboard_metrics(windows)
     except Exception as e:
         logger.error(f"Dashboard calculation error: {str(e)}")
         st.session_state.error_count += 1
         st.session_state.last_error = str(e)
-        return 0, 0, 0, 0
-
-total_spent, avg_daily, joy_spending, essential_spending = calculate_dashboard_metrics()
+        return dict.fromkeys(
+            ['total_spent', 'avg_daily', 'joy_spending', 'essential_spending', 'month_spent'], 0
+        )
 
-# Get monthly_income safely
-monthly_income = st.session_state.financial_profile.get('monthly_income', 0) if st.session_state.financial_profile else 0
-current_savings = st.session_state.financial_profile.get('current_savings', 0) if st.session_state.financial_profile else 0
+@timed()
+def budget_status(today):
+    """{category: (allocated, spent)} in USD for this month, one indexed read of the budgets table
+
+    Spend is stored in its own currency and converted at the rate in effect during the
+    budget period (not today's), as "USD at today's rate" like the dashboard cards.
+    """
+    rows = get_ledger_store().budget(st.session_state.ledger_account, today)
+    if not rows:
+        return {}
+    currencies = sorted({currency for _, currency, _, _ in rows})
+    spent_usd = get_rate_provider().today_equivalent(
+        np.array([spent for _, _, _, spent in rows], dtype=np.float64),
+        np.full(len(rows), to_epoch_us(today), dtype=np.int64),
+        st.session_state.currency,
+        np.array([currencies.index(currency) for _, currency, _, _ in rows], dtype=np.int8),
+        currencies,
+    )
+    status = {}
+    for (raw_category, _, allocated, _), spent in zip(rows, spent_usd.tolist()):
+        category = category_from_db(raw_category)
+        category_allocated, category_spent = status.get(category, (0.0, 0.0))
+        status[category] = (category_allocated + allocated, category_spent + spent)
+    return status
+
+@st.fragment
+@timed()
+def render_money_dashboard():
+    """Money cards and budget-vs-reality; no widgets, so it only reruns with the app"""
+    st.markdown("## 💰 Your Money Mood Board")
+
+    metrics = calculate_dashboard_metrics()
+    total_spent, avg_daily = metrics['total_spent'], metrics['avg_daily']
+    joy_spending, essential_spending = metrics['joy_spending'], metrics['essential_spending']
+
+    # Get monthly_income safely
+    monthly_income = st.session_state.financial_profile.get('monthly_income', 0) if st.session_state.financial_profile else 0
+    current_savings = st.session_state.financial_profile.get('current_savings', 0) if st.session_state.financial_profile else 0
 
-col1, col2, col3, col4 = st.columns(4)
+    col1, col2, col3, col4 = st.columns(4)
 
-with col1:
-    st.markdown(f"""
+    with col1:
+        render_html(f"""
     <div class="money-card">
         <h3>💸 Total Spent</h3>
         <h2>{format_currency(total_spent, 2)}</h2>
         <p>Last 7 days</p>
     </div>
-    """, unsafe_allow_html=True)
+    """)
 
-with col2:
-    st.markdown(f"""
+    with col2:
+        render_html(f"""
     <div class="money-card">
         <h3>📅 Daily Average</h3>
         <h2>{format_currency(avg_daily, 2)}</h2>
-        <p>Per day</p>
+        <p>Per day, last {AVERAGE_DAYS} days</p>
     </div>
-    """, unsafe_allow_html=True)
+    """)
 
-with col3:
-    joy_ratio = (joy_spending / total_spent * 100) if total_spent > 0 else 0
-    st.markdown(f"""
+    with col3:
+        joy_ratio = (joy_spending / total_spent * 100) if total_spent > 0 else 0
+        render_html(f"""
     <div class="money-card">
         <h3>😊 Joy Ratio</h3>
         <h2>{joy_ratio:.1f}%</h2>
         <p>Happiness spending</p>
     </div>
-    """, unsafe_allow_html=True)
+    """)
 
-with col4:
-    if monthly_income > 0:
-        monthly_projected = total_spent * 4.33
-        budget_remaining = monthly_income - monthly_projected
-        st.markdown(f"""
+    with col4:
+        if monthly_income > 0:
+            budget_remaining = monthly_income - metrics['month_spent']
+            render_html(f"""
         <div class="money-card">
             <h3>💰 Budget Left</h3>
             <h2>{format_currency(budget_remaining, 0)}</h2>
             <p>This month</p>
         </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown(f"""
+        """)
+        else:
+            render_html(f"""
         <div class="money-card">
             <h3>✨ Joy Spending</h3>
             <h2>{format_currency(joy_spending, 2)}</h2>
             <p>Self-care investments</p>
         </div>
-        """, unsafe_allow_html=True)
-
-# Add a fifth column for savings/essentials if needed
-col5 = None
-if current_savings > 0 or essential_spending > 0:
-    cols = st.columns(5)
-    col5 = cols[4]
-    with col5:
-        if current_savings > 0:
-            savings_growth = current_savings
-            st.markdown(f"""
+        """)
+
+    # Add a fifth column for savings/essentials if needed
+    col5 = None
+    if current_savings > 0 or essential_spending > 0:
+        cols = st.columns(5)
+        col5 = cols[4]
+        with col5:
+            if current_savings > 0:
+                savings_growth = current_savings
+                render_html(f"""
             <div class="money-card">
                 <h3>📈 Savings</h3>
                 <h2>{format_currency(savings_growth, 0)}</h2>
                 <p>Total saved</p>
             </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
+            """)
+            else:
+                render_html(f"""
             <div class="money-card">
                 <h3>🏠 Essentials</h3>
                 <h2>{format_currency(essential_spending, 2)}</h2>
                 <p>Responsible spending</p>
             </div>
-            """, unsafe_allow_html=True)
-
-# Budget vs Reality Check
-if monthly_income > 0:
-    st.markdown("### 📊 Budget vs Reality Check")
-    # Remove planner reference and use budget_plan if available
-    if st.session_state.budget_plan:
-        budget = {
-            'needs': st.session_state.budget_plan.needs_amount,
-            'wants': st.session_state.budget_plan.wants_amount
-        }
-    else:
-        budget = {'needs': 0, 'wants': 0}
+            """)
 
-    current_month_spending = total_spent * 4.33
-    needs_budget = budget['needs']
-    wants_budget = budget['wants']
+    # Budget vs Reality Check
+    if monthly_income > 0:
+        st.markdown("### 📊 Budget vs Reality Check")
+        # This month's allocation and spend, kept current by the budgets table triggers
+        status = safe_execute(lambda: budget_status(datetime.now()), fallback={},
+                              error_message="Could not load this month's budget")
+        needs_budget, current_needs = status.get(SpendingCategory.ESSENTIAL, (0.0, 0.0))
+        wants_budget, current_wants = status.get(SpendingCategory.JOY, (0.0, 0.0))
 
-    current_needs = essential_spending * 4.33
-    current_wants = joy_spending * 4.33
+        col1, col2, col3 = st.columns(3)
 
-    col1, col2, col3 = st.columns(3)
+        with col1:
+            needs_progress = (current_needs / needs_budget * 100) if needs_budget > 0 else 0
+            st.markdown(f"**🏠 Needs: {format_currency(current_needs, 0)} / {format_currency(needs_budget, 0)}**")
+            st.progress(min(needs_progress / 100, 1.0))
+            if needs_progress > 100:
+                render_html('<div class="warning-card">⚠️ Over budget on needs!</div>')
 
-    with col1:
-        needs_progress = (current_needs / needs_budget * 100) if needs_budget > 0 else 0
-        st.markdown(f"**🏠 Needs: {format_currency(current_needs, 0)} / {format_currency(needs_budget, 0)}**")
-        st.progress(min(needs_progress / 100, 1.0))
-        if needs_progress > 100:
-            st.markdown('<div class="warning-card">⚠️ Over budget on needs!</div>', unsafe_allow_html=True)
+        with col2:
+            wants_progress = (current_wants / wants_budget * 100) if wants_budget > 0 else 0
+            st.markdown(f"**✨ Wants: {format_currency(current_wants, 0)} / {format_currency(wants_budget, 0)}**")
+            st.progress(min(wants_progress / 100, 1.0))
+            if wants_progress > 100:
+                render_html('<div class="warning-card">⚠️ Over budget on wants!</div>')
 
-    with col2:
-        wants_progress = (current_wants / wants_budget * 100) if wants_budget > 0 else 0
-        st.markdown(f"**✨ Wants: {format_currency(current_wants, 0)} / {format_currency(wants_budget, 0)}**")
-        st.progress(min(wants_progress / 100, 1.0))
-        if wants_progress > 100:
-            st.markdown('<div class="warning-card">⚠️ Over budget on wants!</div>', unsafe_allow_html=True)
+        with col3:
+            total_budget = needs_budget + wants_budget
+            total_spent_month = current_needs + current_wants
+            overall_progress = (total_spent_month / total_budget * 100) if total_budget > 0 else 0
+            st.markdown(f"**💰 Overall: {format_currency(total_spent_month, 0)} / {format_currency(total_budget, 0)}**")
+            st.progress(min(overall_progress / 100, 1.0))
+            if overall_progress < 80:
+                render_html('<div class="success-card">🎉 Under budget! Great job!</div>')
 
-    with col3:
-        total_budget = needs_budget + wants_budget
-        total_spent_month = current_needs + current_wants
-        overall_progress = (total_spent_month / total_budget * 100) if total_budget > 0 else 0
-        st.markdown(f"**💰 Overall: {format_currency(total_spent_month, 0)} / {format_currency(total_budget, 0)}**")
-        st.progress(min(overall_progress / 100, 1.0))
-        if overall_progress < 80:
-            st.markdown('<div class="success-card">🎉 Under budget! Great job!</div>', unsafe_allow_html=True)
+render_money_dashboard()
+script_clock.restart()
 
 # =============================================================================
 # TRANSACTION INPUT & INTERACTIVE FEATURES
 # =============================================================================
 
-st.markdown("## 💳 Add New Transaction")
+@st.fragment
+@timed()
+def render_transaction_input():
+    """Add/import forms; a saved transaction reruns the whole app so totals refresh"""
+    st.markdown("## 💳 Add New Transaction")
+
+    # Transaction input form with error handling
+    with st.expander("➕ Add a New Transaction", expanded=False):
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            new_amount = st.number_input("💰 Amount", min_value=0.01, value=10.0, step=0.5)
+            new_currency = st.selectbox(
+                "💱 Paid in",
+                ['USD', 'PKR', 'EUR'],
+                index=['USD', 'PKR', 'EUR'].index(st.session_state.currency),
+                format_func=lambda x: f"{currency_symbols[x]} {x}"
+            )
+            new_description = st.text_input("📝 Description", placeholder="What did you spend on?")
+
+        with col2:
+            # Prefill the category from what this merchant usually is (the merchant box reruns the form)
+            merchant_prior = st.session_state.merchant_index.lookup(st.session_state.get('new_txn_merchant', ''))
+            new_category = st.selectbox(
+                "📂 Category",
+                list(SpendingCategory),
+                index=merchant_prior.category_code if merchant_prior else 0
+            )
+            new_merchant = st.text_input("🏪 Merchant", placeholder="Where did you spend?", key="new_txn_merchant")
+            if merchant_prior:
+                purchases = "purchase" if merchant_prior.total == 1 else "purchases"
+                st.caption(f"🤖 Usually {merchant_prior.category.value} here "
+                           f"({merchant_prior.confidence:.0%} of {merchant_prior.total} {purchases})")
+
+        with col3:
+            new_vibe_impact = st.slider("😊 Vibe Impact", -1.0, 1.0, 0.0, 0.1, 
+                                       help="How did this purchase make you feel?")
+
+            if st.button("✅ Add Transaction", type="primary", use_container_width=True):
+                try:
+                    if new_description.strip():
+                        new_transaction = Transaction(
+                            date=datetime.now(),
+                            amount=float(new_amount),
+                            description=new_description.strip(),
+                            category=new_category,
+                            merchant=new_merchant.strip(),
+                            vibe_impact=float(new_vibe_impact),
+                            currency=new_currency
+                        )
+                        get_ledger_store().add(new_transaction, st.session_state.ledger_account)
+                        st.session_state.transactions.append(new_transaction)
+                        st.session_state.merchant_index.learn(new_transaction.merchant, new_category, new_transaction.vibe_impact)
+                        st.success(f"✅ Added: {new_description} - {format_money(new_amount, new_currency, 1.0)}")
+                        st.rerun()
+                    else:
+                        st.warning("Please enter a description for your transaction!")
+                except Exception as e:
+                    st.error(f"Error adding transaction: {str(e)}")
+                    st.session_state.error_count += 1
+                    st.session_state.last_error = str(e)
+
+    # Bulk statement import (streamed in chunks, so file size doesn't matter)
+    with st.expander("📥 Import Bank Statement (CSV / OFX)", expanded=False):
+        if st.session_state.get('import_message'):
+            st.success(st.session_state.pop('import_message'))
+
+        statement_file = st.file_uploader("Drop your bank export here", type=["csv", "ofx", "qfx"])
+        credits_positive = st.checkbox(
+            "My bank shows spending as negative amounts",
+            value=True,
+            help="Most exports do! Positive rows (income) are skipped."
+        )
+        statement_currency = st.selectbox(
+            "Statement currency",
+            ['USD', 'PKR', 'EUR'],
+            format_func=lambda x: f"{currency_symbols[x]} {x}",
+            help="Used for rows without their own currency column"
+        )
+
+        if statement_file is not None and st.button("📥 Import Statement", use_container_width=True):
+            import_progress = st.progress(0.0, text="Importing...")
+            total_bytes = max(statement_file.size, 1)
+
+            def report_import_progress(rows_imported, bytes_read):
+                import_progress.progress(
+                    min(bytes_read / total_bytes, 1.0),
+                    text=f"Imported {rows_imported:,} transactions..."
+                )
 
-# Transaction input form with error handling
-with st.expander("➕ Add a New Transaction", expanded=False):
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        new_amount = st.number_input("💰 Amount", min_value=0.01, value=10.0, step=0.5)
-        new_description = st.text_input("📝 Description", placeholder="What did you spend on?")
-    
-    with col2:
-        new_category = st.selectbox("📂 Category", list(SpendingCategory))
-        new_merchant = st.text_input("🏪 Merchant", placeholder="Where did you spend?")
-    
-    with col3:
-        new_vibe_impact = st.slider("😊 Vibe Impact", -1.0, 1.0, 0.0, 0.1, 
-                                   help="How did this purchase make you feel?")
-        
-        if st.button("✅ Add Transaction", type="primary", use_container_width=True):
             try:
-                if new_description.strip():
-                    new_transaction = Transaction(
-                        date=datetime.now(),
-                        amount=float(new_amount),
-                        description=new_description.strip(),
-                        category=new_category,
-                        merchant=new_merchant.strip(),
-                        vibe_impact=float(new_vibe_impact)
+                result = import_statement(
+                    get_ledger_store(),
+                    st.session_state.ledger_account,
+                    statement_file,
+                    filename=statement_file.name,
+                    credits_positive=credits_positive,
+                    progress=report_import_progress,
+                    currency=statement_currency,
+                    merchant_index=st.session_state.merchant_index
+                )
+                if result.replaced:
+                    # A re-imported statement overwrote rows this session may hold; start over
+                    st.session_state.transactions = memory_budget.load(
+                        get_ledger_store(), st.session_state.ledger_account, st.session_state.emotion_classifier
+                    )
+                    st.session_state.transactions.usd_rates = currency_rates
+                    st.session_state.merchant_index = MerchantIndex.from_counts(
+                        get_ledger_store().merchant_counts(st.session_state.ledger_account)
                     )
-                    st.session_state.transactions.append(new_transaction)
-                    st.success(f"✅ Added: {new_description} - {format_currency(new_amount)}")
-                    st.rerun()
                 else:
-                    st.warning("Please enter a description for your transaction!")
+                    # New rows only: read back this statement's hot-window rows and merge them in
+                    memory_budget.merge_statement(
+                        get_ledger_store(), st.session_state.ledger_account, result.id_prefix,
+                        st.session_state.transactions, st.session_state.emotion_classifier
+                    )
+                    st.session_state.merchant_index.learn_counts(
+                        get_ledger_store().merchant_counts(st.session_state.ledger_account, result.id_prefix)
+                    )
+                st.session_state.import_message = (
+                    f"✅ Imported {result.imported:,} transactions in {result.seconds:.1f}s "
+                    f"({result.classified:,} auto-categorized, {result.skipped:,} income rows skipped, "
+                    f"{result.errors:,} unreadable)"
+                )
+                st.rerun()
             except Exception as e:
-                st.error(f"Error adding transaction: {str(e)}")
+                st.error(f"Error importing statement: {str(e)}")
                 st.session_state.error_count += 1
                 st.session_state.last_error = str(e)
 
+render_transaction_input()
+script_clock.restart()
+
 # =============================================================================
 # TRANSACTION LOG & DISPLAY
 # =============================================================================
 
-st.markdown("## 🧾 Recent Spending Tea ☕")
+LOG_ORDERINGS = {
+    "🕒 Newest first": "newest",
+    "📜 Oldest first": "oldest",
+    "💸 Biggest first": "biggest",
+    "🪙 Smallest first": "smallest",
+}
 
 # Safe transaction display with error handling
-def create_transaction_dataframe():
+@timed()
+def create_transaction_dataframe(transactions):
+    """Build the display table for one page of transactions, one column at a time"""
+    import pandas as pd
+    
     try:
-        transactions = st.session_state.transactions or []
         if not transactions:
             return pd.DataFrame({'Message': ['No transactions yet! Add your first transaction above. 💸']})
         
-        transaction_data = []
-        for t in sorted(transactions, key=lambda x: getattr(x, 'date', datetime.now()), reverse=True):
-            try:
-                transaction_data.append({
-                    'Date': getattr(t, 'date', datetime.now()).strftime('%m/%d'),
-                    'Vibe': getattr(t, 'category', SpendingCategory.ESSENTIAL).value,
-                    'Amount': format_currency(getattr(t, 'amount', 0)),
-                    'Description': getattr(t, 'description', 'Unknown'),
-                    'Merchant': getattr(t, 'merchant', 'Unknown'),
-                    'Mood Impact': '😊' if getattr(t, 'vibe_impact', 0) > 0 else '😐' if getattr(t, 'vibe_impact', 0) == 0 else '😔'
-                })
-            except Exception as e:
-                logger.warning(f"Error processing transaction: {str(e)}")
-                continue
-        
-        return pd.DataFrame(transaction_data)
+        return transaction_table(
+            ColumnarLedger.from_transactions(transactions), get_rate_provider(), st.session_state.currency
+        )
     except Exception as e:
         logger.error(f"Error creating transaction dataframe: {str(e)}")
         st.session_state.error_count += 1
         st.session_state.last_error = str(e)
         return pd.DataFrame({'Error': ['Unable to load transactions. Please try refreshing.']})
 
-df_transactions = create_transaction_dataframe()
-st.dataframe(df_transactions, use_container_width=True)
+@st.fragment
+@timed()
+def render_transaction_log():
+    """Sort/filter/page controls and the current page of the log"""
+    st.markdown("## 🧾 Recent Spending Tea ☕")
 
-# Transaction analytics
-if len(st.session_state.transactions) > 0:
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        try:
-            avg_transaction = handle_calculation_error(
-                lambda: sum(t.amount for t in st.session_state.transactions) / len(st.session_state.transactions),
-                0
-            )
-            st.metric("💰 Avg Transaction", format_currency(avg_transaction))
-        except:
-            st.metric("💰 Avg Transaction", "N/A")
-    
-    with col2:
-        try:
-            positive_vibes = len([t for t in st.session_state.transactions if getattr(t, 'vibe_impact', 0) > 0])
-            st.metric("😊 Positive Purchases", f"{positive_vibes}")
-        except:
-            st.metric("😊 Positive Purchases", "N/A")
-    
-    with col3:
-        try:
-            most_category = max(SpendingCategory, key=lambda cat: len([t for t in st.session_state.transactions if getattr(t, 'category', None) == cat]))
-            st.metric("🔥 Top Category", most_category.value)
-        except:
-            st.metric("🔥 Top Category", "N/A")
+    # Sorting, filtering and paging all happen in SQLite, so only one page ever reaches the browser
+    log_col1, log_col2, log_col3, log_col4 = st.columns([2, 2, 3, 1])
 
-# =============================================================================
-# ENHANCED SALARY INPUT & FINANCIAL PLANNING CALCULATOR
-# =============================================================================
+    with log_col1:
+        log_order = st.selectbox("Sort", list(LOG_ORDERINGS.keys()), key="log_order")
 
-st.markdown("## 💰 Complete Financial Planning Calculator")
+    with log_col2:
+        log_category = st.selectbox(
+            "Vibe filter",
+            [None] + list(SpendingCategory),
+            format_func=lambda x: "🌈 All vibes" if x is None else x.value,
+            key="log_category"
+        )
 
-st.markdown("""
-<div class="financial-setup-card">
-    <h3>💸 Enter Your Financial Details</h3>
-    <p>Let's create your personalized Gen Z survival & slay financial blueprint!</p>
-</div>
-""", unsafe_allow_html=True)
-
-# Main salary input section
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.markdown("### 💵 Income Details")
-    monthly_salary = st.number_input(
-        "Monthly Salary/Income (After Tax)",
-        min_value=0.0,
-        value=4500.0,
-        step=100.0,
-        help="Your take-home pay per month"
-    )
-    
-    additional_income = st.number_input(
-        "Side Hustle/Additional Income",
-        min_value=0.0,
-        value=0.0,
-        step=50.0,
-        help="Freelance, part-time, passive income"
-    )
-    
-    total_monthly_income = monthly_salary + additional_income
-    annual_income = total_monthly_income * 12
-
-with col2:
-    st.markdown("### 🎯 Current Financial Status")
-    current_debt = st.number_input(
-        "Total Debt Amount",
-        min_value=0.0,
-        value=0.0,
-        step=100.0,
-        help="Credit cards, student loans, personal loans"
-    )
-    
-    current_savings_amount = st.number_input(
-        "Current Savings Balance",
-        min_value=0.0,
-        value=1000.0,
-        step=100.0,
-        help="Emergency fund + other savings accounts"
-    )
-    
-    monthly_debt_payment = st.number_input(
-        "Current Monthly Debt Payments",
-        min_value=0.0,
-        value=0.0,
-        step=25.0,
-        help="Minimum payments on all debts"
-    )
+    with log_col3:
+        log_search = st.text_input("Search", placeholder="coffee, uber, rent...", key="log_search")
 
-with col3:
-    st.markdown("### 🚀 Your Financial Goals")
-    financial_priority = st.selectbox(
-        "Primary Financial Priority",
-        [
-            "🛡️ Build Emergency Fund",
-            "💳 Pay Off Debt",
-            "📈 Start Investing",
-            "🏠 Save for Big Purchase",
-            "👑 Maximize Wealth Building"
-        ]
-    )
-    
-    lifestyle_mode = st.selectbox(
-        "Current Lifestyle Mode",
-        [
-            "😩 Survival Mode (Minimize expenses)",
-            "😌 Comfort Mode (Balanced approach)", 
-            "👑 Slay Mode (Aggressive wealth building)"
-        ]
+    with log_col4:
+        log_page_size = st.selectbox("Rows", [10, 25, 50, 100], index=1, key="log_page_size")
+
+    # Counts and formatted pages are reused until the ledger, the filters or the currency change
+    log_filters = (st.session_state.transactions.version, log_order, log_category, log_search)
+
+    total_log_rows = safe_execute(
+        lambda: memoized(
+            ('count',) + log_filters,
+            lambda: count_transactions(get_ledger_store(), st.session_state.ledger_account, log_category, log_search)
+        ),
+        fallback=len(st.session_state.transactions),
+        error_message="Could not count saved transactions"
     )
-    
-    investment_risk = st.selectbox(
-        "Investment Risk Tolerance",
-        ["Conservative (Safety first)", "Moderate (Balanced)", "Aggressive (High growth)"]
+    log_page_count = max(1, math.ceil(total_log_rows / log_page_size))
+    log_page = st.number_input(f"Page (of {log_page_count})", min_value=1, max_value=log_page_count, value=1, step=1, key="log_page")
+
+    def fetch_transaction_page():
+        return transaction_page(
+            get_ledger_store(),
+            st.session_state.ledger_account,
+            page=min(log_page, log_page_count) - 1,
+            page_size=log_page_size,
+            order=LOG_ORDERINGS[log_order],
+            category=log_category,
+            search=log_search
+        )
+
+    def build_transaction_table():
+        page_transactions = safe_execute(
+            fetch_transaction_page,
+            fallback=st.session_state.transactions[-log_page_size:][::-1],
+            error_message="Could not page through saved transactions, showing the latest ones instead"
+        )
+        return create_transaction_dataframe(page_transactions)
+
+    df_transactions = memoized(
+        ('page',) + log_filters + display_key() + (log_page_size, log_page),
+        build_transaction_table
     )
+    st.caption(f"Showing page {min(log_page, log_page_count)} of {log_page_count} · {total_log_rows:,} transactions")
+    st.dataframe(df_transactions, use_container_width=True)
+
+    # Transaction analytics
+    if len(st.session_state.transactions) > 0:
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            try:
+                avg_transaction = handle_calculation_error(
+                    lambda: st.session_state.transactions.mean_amount(),
+                    0
+                )
+                st.metric("💰 Avg Transaction", format_currency(avg_transaction))
+            except:
+                st.metric("💰 Avg Transaction", "N/A")
+
+        with col2:
+            try:
+                positive_vibes = st.session_state.transactions.positive_vibe_count()
+                st.metric("😊 Positive Purchases", f"{positive_vibes}")
+            except:
+                st.metric("😊 Positive Purchases", "N/A")
+
+        with col3:
+            try:
+                most_category = st.session_state.transactions.top_category()
+                st.metric("🔥 Top Category", most_category.value)
+            except:
+                st.metric("🔥 Top Category", "N/A")
+
+render_transaction_log()
+script_clock.restart()
 
 # =============================================================================
-# ADVANCED FINANCIAL BREAKDOWN CALCULATOR
+# ENHANCED SALARY INPUT & FINANCIAL PLANNING CALCULATOR
 # =============================================================================
 
-if total_monthly_income > 0:
-    st.markdown("## 📊 Your Personalized Financial Blueprint")
-    
+def debts_from_rows(rows):
+    """Debt list from the debt editor's column dict, skipping blank or zero-balance rows"""
+    debts = []
+    for name, balance, apr, minimum in zip(rows['Debt'], rows['Balance'], rows['APR %'], rows['Minimum']):
+        if balance and balance > 0:
+            name = name or f"Debt {len(debts) + 1}"
+            if any(debt.name == name for debt in debts):
+                name = f"{name} ({len(debts) + 1})"
+            debts.append(Debt(name, float(balance), float(apr or 0), float(minimum or 0)))
+    return debts
+
+@timed()
+def build_debt_comparison(schedules):
+    """One row per payoff strategy: months, debt-free date, interest and total paid"""
+    rows = []
+    for strategy, schedule in schedules.items():
+        if schedule.paid_off:
+            freedom = (datetime.now() + timedelta(days=schedule.months * 30)).strftime('%b %Y')
+        else:
+            freedom = "Never 😬"
+        rows.append({
+            'Strategy': STRATEGY_LABELS[strategy],
+            'Months': schedule.months,
+            'Debt-Free': freedom,
+            'Total Interest': format_currency(schedule.total_interest, 0),
+            'Total Paid': format_currency(schedule.total_paid, 0),
+        })
+    return rows
+
+@timed()
+def build_debt_figure(schedules):
+    """Remaining total balance per month under each strategy, in the display currency"""
+    import plotly.graph_objects as go
+
+    rate = currency_rates.get(st.session_state.currency, 1.0)
+    fig = go.Figure([
+        go.Scatter(y=(schedule.balances.sum(axis=1) * rate).tolist(), name=STRATEGY_LABELS[strategy], mode='lines')
+        for strategy, schedule in schedules.items()
+    ])
+    fig.update_layout(
+        title=f"📉 Debt Left by Month ({get_currency_label()})",
+        xaxis_title="Months",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+    return fig
+
+@timed()
+def build_projection_figure(projection):
+    """Fan chart of the Monte Carlo percentile bands, in the display currency"""
+    import plotly.graph_objects as go
+
+    rate = currency_rates.get(st.session_state.currency, 1.0)
+    years = (projection.months / 12).tolist()
+    band = {p: (projection.bands[i] * rate).tolist() for i, p in enumerate(projection.percentiles)}
+    fig = go.Figure([
+        go.Scatter(x=years, y=band[90], line=dict(width=0), showlegend=False, hoverinfo='skip'),
+        go.Scatter(x=years, y=band[10], fill='tonexty', fillcolor='rgba(78,205,196,0.2)',
+                   line=dict(width=0), name='10th–90th percentile'),
+        go.Scatter(x=years, y=band[75], line=dict(width=0), showlegend=False, hoverinfo='skip'),
+        go.Scatter(x=years, y=band[25], fill='tonexty', fillcolor='rgba(78,205,196,0.45)',
+                   line=dict(width=0), name='25th–75th percentile'),
+        go.Scatter(x=years, y=band[50], line=dict(color='#45B7D1', width=3), name='Median'),
+        go.Scatter(x=years, y=(projection.contributions * rate).tolist(),
+                   line=dict(color='#FF6B6B', dash='dot'), name='Contributions'),
+    ])
+    fig.update_layout(
+        title=f"🎲 Where Your Investing Could Land ({get_currency_label()})",
+        xaxis_title="Years",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+    return fig
+
+@timed()
+def plan_blueprint(total_monthly_income, monthly_debt_payment, lifestyle_mode):
+    """Blueprint budget split; a pure function of the calculator inputs"""
     # Determine budget allocation based on lifestyle mode
     if "Survival" in lifestyle_mode:
         needs_percent = 70
@@ -1968,22 +1787,33 @@ if total_monthly_income > 0:
     adjusted_savings = max(0, savings_amount - monthly_debt_payment)
     debt_payoff_extra = savings_amount - adjusted_savings
     
-    # Display budget breakdown
-    st.markdown(f"""
+    return {
+        'needs_percent': needs_percent,
+        'wants_percent': wants_percent,
+        'savings_percent': savings_percent,
+        'mode_emoji': mode_emoji,
+        'mode_description': mode_description,
+        'needs_amount': needs_amount,
+        'wants_amount': wants_amount,
+        'savings_amount': savings_amount,
+        'adjusted_savings': adjusted_savings,
+        'debt_payoff_extra': debt_payoff_extra
+    }
+
+@timed()
+def build_blueprint_markup(blueprint, total_monthly_income, monthly_debt_payment, lifestyle_mode):
+    """Header and the four breakdown cards of the blueprint"""
+    header = f"""
     <div class="main-header">
-        <h2>{mode_emoji} {lifestyle_mode.split('(')[0]} Budget Breakdown</h2>
-        <p><em>{mode_description}</em></p>
+        <h2>{blueprint['mode_emoji']} {lifestyle_mode.split('(')[0]} Budget Breakdown</h2>
+        <p><em>{blueprint['mode_description']}</em></p>
         <h3>Total Monthly Income: {format_currency(total_monthly_income, 2)}</h3>
     </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
+    """
+    cards = [f"""
         <div class="survival-card">
-            <h3>🏠 NEEDS ({needs_percent}%)</h3>
-            <h2>{format_currency(needs_amount, 0)}</h2>
+            <h3>🏠 NEEDS ({blueprint['needs_percent']}%)</h3>
+            <h2>{format_currency(blueprint['needs_amount'], 0)}</h2>
             <div style="font-size: 0.9em; margin-top: 10px;">
                 <strong>Includes:</strong><br>
                 • Rent/Mortgage<br>
@@ -1993,13 +1823,10 @@ if total_monthly_income > 0:
                 • Minimum Debt Payments
             </div>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
+        """, f"""
         <div class="comfort-card">
-            <h3>✨ WANTS ({wants_percent}%)</h3>
-            <h2>{format_currency(wants_amount, 0)}</h2>
+            <h3>✨ WANTS ({blueprint['wants_percent']}%)</h3>
+            <h2>{format_currency(blueprint['wants_amount'], 0)}</h2>
             <div style="font-size: 0.9em; margin-top: 10px;">
                 <strong>Includes:</strong><br>
                 • Dining Out & Entertainment<br>
@@ -2009,13 +1836,10 @@ if total_monthly_income > 0:
                 • Personal Care
             </div>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
+        """, f"""
         <div class="slay-card">
-            <h3>💰 SAVINGS ({savings_percent}%)</h3>
-            <h2>{format_currency(adjusted_savings, 0)}</h2>
+            <h3>💰 SAVINGS ({blueprint['savings_percent']}%)</h3>
+            <h2>{format_currency(blueprint['adjusted_savings'], 0)}</h2>
             <div style="font-size: 0.9em; margin-top: 10px;">
                 <strong>Breakdown:</strong><br>
                 • Emergency Fund<br>
@@ -2025,29 +1849,28 @@ if total_monthly_income > 0:
                 • Future Planning
             </div>
         </div>
-        """, unsafe_allow_html=True)
+        """]
     
-    with col4:
-        if monthly_debt_payment > 0:
-            total_debt_focus = monthly_debt_payment + debt_payoff_extra
-            st.markdown(f"""
+    if monthly_debt_payment > 0:
+        total_debt_focus = monthly_debt_payment + blueprint['debt_payoff_extra']
+        cards.append(f"""
             <div class="investment-card">
                 <h3>💳 DEBT PAYOFF</h3>
                 <h2>{format_currency(total_debt_focus, 0)}</h2>
                 <div style="font-size: 0.9em; margin-top: 10px;">
                     <strong>Strategy:</strong><br>
                     • Minimum: {format_currency(monthly_debt_payment, 0)}<br>
-                    • Extra: {format_currency(debt_payoff_extra, 0)}<br>
+                    • Extra: {format_currency(blueprint['debt_payoff_extra'], 0)}<br>
                     • Total Focus<br>
                     • Avalanche Method
                 </div>
             </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
+            """)
+    else:
+        cards.append(f"""
             <div class="investment-card">
                 <h3>🚀 BONUS POWER</h3>
-                <h2>{format_currency(adjusted_savings, 0)}</h2>
+                <h2>{format_currency(blueprint['adjusted_savings'], 0)}</h2>
                 <div style="font-size: 0.9em; margin-top: 10px;">
                     <strong>Opportunity:</strong><br>
                     • Full Savings Potential<br>
@@ -2056,134 +1879,251 @@ if total_monthly_income > 0:
                     • Financial Freedom
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+    return header, cards
 
-    # =============================================================================
-    # EMERGENCY FUND CALCULATOR
-    # =============================================================================
-    
-    st.markdown("### 🛡️ Emergency Fund Strategy")
-    
-    emergency_months = st.slider("Target Emergency Fund (Months of Expenses)", 3, 12, 6)
-    emergency_target = needs_amount * emergency_months
-    emergency_progress = (current_savings_amount / emergency_target * 100) if emergency_target > 0 else 0
-    
+@st.fragment
+@timed()
+def render_financial_planner():
+    """Salary calculator and the full blueprint; its widgets rerun only this section"""
+    st.markdown("## 💰 Complete Financial Planning Calculator")
+
+    render_html("""
+<div class="financial-setup-card">
+    <h3>💸 Enter Your Financial Details</h3>
+    <p>Let's create your personalized Gen Z survival & slay financial blueprint!</p>
+</div>
+""")
+
+    # Main salary input section
     col1, col2, col3 = st.columns(3)
-    
+
     with col1:
-        st.markdown(f"""
+        st.markdown("### 💵 Income Details")
+        monthly_salary = st.number_input(
+            "Monthly Salary/Income (After Tax)",
+            min_value=0.0,
+            value=4500.0,
+            step=100.0,
+            help="Your take-home pay per month"
+        )
+
+        additional_income = st.number_input(
+            "Side Hustle/Additional Income",
+            min_value=0.0,
+            value=0.0,
+            step=50.0,
+            help="Freelance, part-time, passive income"
+        )
+
+        total_monthly_income = monthly_salary + additional_income
+        annual_income = total_monthly_income * 12
+
+    with col2:
+        st.markdown("### 🎯 Current Financial Status")
+        current_debt = st.number_input(
+            "Total Debt Amount",
+            min_value=0.0,
+            value=0.0,
+            step=100.0,
+            help="Credit cards, student loans, personal loans"
+        )
+
+        current_savings_amount = st.number_input(
+            "Current Savings Balance",
+            min_value=0.0,
+            value=1000.0,
+            step=100.0,
+            help="Emergency fund + other savings accounts"
+        )
+
+        monthly_debt_payment = st.number_input(
+            "Current Monthly Debt Payments",
+            min_value=0.0,
+            value=0.0,
+            step=25.0,
+            help="Minimum payments on all debts"
+        )
+
+    with col3:
+        st.markdown("### 🚀 Your Financial Goals")
+        financial_priority = st.selectbox(
+            "Primary Financial Priority",
+            [
+                "🛡️ Build Emergency Fund",
+                "💳 Pay Off Debt",
+                "📈 Start Investing",
+                "🏠 Save for Big Purchase",
+                "👑 Maximize Wealth Building"
+            ]
+        )
+
+        lifestyle_mode = st.selectbox(
+            "Current Lifestyle Mode",
+            [
+                "😩 Survival Mode (Minimize expenses)",
+                "😌 Comfort Mode (Balanced approach)", 
+                "👑 Slay Mode (Aggressive wealth building)"
+            ]
+        )
+
+        investment_risk = st.selectbox(
+            "Investment Risk Tolerance",
+            ["Conservative (Safety first)", "Moderate (Balanced)", "Aggressive (High growth)"]
+        )
+
+    # =============================================================================
+    # ADVANCED FINANCIAL BREAKDOWN CALCULATOR
+    # =============================================================================
+
+    if total_monthly_income > 0:
+        st.markdown("## 📊 Your Personalized Financial Blueprint")
+
+        blueprint_inputs = (total_monthly_income, monthly_debt_payment, lifestyle_mode)
+        blueprint = memoized(('blueprint',) + blueprint_inputs, lambda: plan_blueprint(*blueprint_inputs))
+        needs_amount = blueprint['needs_amount']
+        wants_amount = blueprint['wants_amount']
+        savings_amount = blueprint['savings_amount']
+        adjusted_savings = blueprint['adjusted_savings']
+        debt_payoff_extra = blueprint['debt_payoff_extra']
+
+        # Display budget breakdown
+        blueprint_header, blueprint_cards = memoized(
+            ('blueprint_markup',) + blueprint_inputs + display_key(),
+            lambda: build_blueprint_markup(blueprint, *blueprint_inputs)
+        )
+        render_html(blueprint_header)
+
+        for column, card in zip(st.columns(4), blueprint_cards):
+            with column:
+                render_html(card)
+
+        # =============================================================================
+        # EMERGENCY FUND CALCULATOR
+        # =============================================================================
+
+        st.markdown("### 🛡️ Emergency Fund Strategy")
+
+        emergency_months = st.slider("Target Emergency Fund (Months of Expenses)", 3, 12, 6)
+        emergency_target = needs_amount * emergency_months
+        emergency_progress = (current_savings_amount / emergency_target * 100) if emergency_target > 0 else 0
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            render_html(f"""
         <div class="goal-tracker">
             <h4>🎯 Emergency Fund Goal</h4>
             <h2>{format_currency(emergency_target, 0)}</h2>
             <p>{emergency_months} months of expenses</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
+        """)
+
+        with col2:
+            render_html(f"""
         <div class="goal-tracker">
             <h4>💰 Current Progress</h4>
             <h2>{format_currency(current_savings_amount, 0)}</h2>
             <p>{emergency_progress:.1f}% Complete</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        months_to_goal = max(0, (emergency_target - current_savings_amount) / (adjusted_savings * 0.5)) if adjusted_savings > 0 else 0
-        st.markdown(f"""
+        """)
+
+        with col3:
+            months_to_goal = max(0, (emergency_target - current_savings_amount) / (adjusted_savings * 0.5)) if adjusted_savings > 0 else 0
+            render_html(f"""
         <div class="goal-tracker">
             <h4>⏰ Time to Goal</h4>
             <h2>{months_to_goal:.1f} months</h2>
             <p>At 50% savings allocation</p>
         </div>
-        """, unsafe_allow_html=True)
-    
-    # Progress bar
-    st.markdown(f"""
+        """)
+
+        # Progress bar
+        render_html(f"""
     <div class="progress-container">
         <div class="progress-fill" style="width: {min(emergency_progress, 100)}%;">
             Emergency Fund: {emergency_progress:.1f}% Complete
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """)
 
-    # =============================================================================
-    # INVESTMENT ALLOCATION STRATEGY
-    # =============================================================================
-    
-    st.markdown("### 📈 Investment Allocation Strategy")
-    
-    # Calculate investment amount (portion of savings after emergency fund priority)
-    emergency_monthly_need = max(0, (emergency_target - current_savings_amount) / 12)
-    available_for_investment = max(0, adjusted_savings - emergency_monthly_need)
-    
-    if available_for_investment > 0:
-        # Age-based investment allocation
-        user_age = st.slider("Your Age", 18, 35, 25)
-        
-        # Determine allocation based on age and risk tolerance
-        if "Conservative" in investment_risk:
-            stock_percent = max(20, 60 - user_age)
-            bond_percent = min(50, 40 + (user_age - 20))
-        elif "Aggressive" in investment_risk:
-            stock_percent = min(95, 80 + (35 - user_age))
-            bond_percent = max(5, 20 - (35 - user_age))
-        else:  # Moderate
-            stock_percent = max(40, 70 - (user_age - 20))
-            bond_percent = min(40, 30 + (user_age - 20))
-        
-        cash_percent = 100 - stock_percent - bond_percent
-        
-        # Calculate dollar amounts
-        stock_amount = available_for_investment * (stock_percent / 100)
-        bond_amount = available_for_investment * (bond_percent / 100)
-        cash_amount = available_for_investment * (cash_percent / 100)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
+        # =============================================================================
+        # INVESTMENT ALLOCATION STRATEGY
+        # =============================================================================
+
+        st.markdown("### 📈 Investment Allocation Strategy")
+
+        # Calculate investment amount (portion of savings after emergency fund priority)
+        emergency_monthly_need = max(0, (emergency_target - current_savings_amount) / 12)
+        available_for_investment = max(0, adjusted_savings - emergency_monthly_need)
+
+        if available_for_investment > 0:
+            # Age-based investment allocation
+            user_age = st.slider("Your Age", 18, 35, 25)
+
+            # Determine allocation based on age and risk tolerance
+            if "Conservative" in investment_risk:
+                stock_percent = max(20, 60 - user_age)
+                bond_percent = min(50, 40 + (user_age - 20))
+            elif "Aggressive" in investment_risk:
+                stock_percent = min(95, 80 + (35 - user_age))
+                bond_percent = max(5, 20 - (35 - user_age))
+            else:  # Moderate
+                stock_percent = max(40, 70 - (user_age - 20))
+                bond_percent = min(40, 30 + (user_age - 20))
+
+            cash_percent = 100 - stock_percent - bond_percent
+
+            # Calculate dollar amounts
+            stock_amount = available_for_investment * (stock_percent / 100)
+            bond_amount = available_for_investment * (bond_percent / 100)
+            cash_amount = available_for_investment * (cash_percent / 100)
+
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                render_html(f"""
             <div class="investment-card">
                 <h4>📊 Total Monthly Investment</h4>
                 <h2>{format_currency(available_for_investment, 0)}</h2>
                 <p>Available after emergency fund</p>
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
+            """)
+
+            with col2:
+                render_html(f"""
             <div class="investment-card">
                 <h4>📈 Stocks/ETFs ({stock_percent}%)</h4>
                 <h2>{format_currency(stock_amount, 0)}</h2>
                 <p>VTI, VXUS, Growth funds</p>
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
+            """)
+
+            with col3:
+                render_html(f"""
             <div class="investment-card">
                 <h4>🏛️ Bonds ({bond_percent}%)</h4>
                 <h2>{format_currency(bond_amount, 0)}</h2>
                 <p>BND, Treasury bonds</p>
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
+            """)
+
+            with col4:
+                render_html(f"""
             <div class="investment-card">
                 <h4>💵 Cash/HYSA ({cash_percent}%)</h4>
                 <h2>{format_currency(cash_amount, 0)}</h2>
                 <p>High-yield savings, CDs</p>
             </div>
-            """, unsafe_allow_html=True)
-        
-        # Specific investment recommendations
-        st.markdown("#### 🎯 Specific Investment Recommendations")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
+            """)
+
+            # Specific investment recommendations
+            st.markdown("#### 🎯 Specific Investment Recommendations")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                render_html("""
             <div class="financial-tip">
                 <h4>🚀 Gen Z Investment Essentials</h4>
                 <strong>Core Holdings:</strong><br>
@@ -2197,10 +2137,10 @@ if total_monthly_income > 0:
                 • REITs (Real Estate)<br>
                 • Small allocation to crypto (5% max)
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
+            """)
+
+            with col2:
+                render_html(f"""
             <div class="financial-tip">
                 <h4>💡 Investment Platform Suggestions</h4>
                 <strong>Best for Beginners:</strong><br>
@@ -2213,317 +2153,401 @@ if total_monthly_income > 0:
                 • M1 Finance (Pie investing)<br><br>
                 <strong>Monthly Investment:</strong> {format_currency(available_for_investment, 0)}
             </div>
-            """, unsafe_allow_html=True)
-    
-    else:
-        st.markdown("""
+            """)
+
+        else:
+            render_html("""
         <div class="warning-card">
             <h4>⚠️ Focus on Emergency Fund First</h4>
             <p>Prioritize building your emergency fund before investing. Once you have 3-6 months of expenses saved, redirect funds to investments!</p>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
-    # =============================================================================
-    # DEBT PAYOFF STRATEGY
-    # =============================================================================
-    
-    if current_debt > 0:
-        st.markdown("### 💳 Debt Elimination Strategy")
-        
-        # Debt payoff calculators
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### 🔥 Avalanche Method (Recommended)")
-            # Assuming average 18% APR for credit cards
-            avg_apr = st.slider("Average Debt Interest Rate (%)", 3.0, 29.9, 18.0)
-            
+        # =============================================================================
+        # DEBT PAYOFF STRATEGY
+        # =============================================================================
+
+        if current_debt > 0:
+            st.markdown("### 💳 Debt Elimination Strategy")
+
+            # One row per debt; starts as the single total from the status inputs above
+            st.markdown("Break your debt down (add a row per card/loan) to compare payoff strategies:")
+            debt_rows = st.data_editor(
+                {
+                    'Debt': ['All debt'],
+                    'Balance': [current_debt],
+                    'APR %': [18.0],  # typical credit card APR
+                    'Minimum': [monthly_debt_payment],
+                },
+                num_rows="dynamic",
+                use_container_width=True,
+                key=f"debt_editor_{current_debt}_{monthly_debt_payment}"
+            )
+            debts = debts_from_rows(debt_rows) or [Debt('All debt', current_debt, 18.0, monthly_debt_payment)]
             total_debt_payment = monthly_debt_payment + debt_payoff_extra
-            
-            # Calculate payoff time
-            if total_debt_payment > 0 and avg_apr > 0:
-                monthly_rate = (avg_apr / 100) / 12
-                if monthly_rate * current_debt < total_debt_payment:
-                    months_to_payoff = -(1/12) * (math.log(1 - (monthly_rate * current_debt / total_debt_payment)) / math.log(1 + monthly_rate))
-                    total_interest = (total_debt_payment * months_to_payoff) - current_debt
-                else:
-                    months_to_payoff = float('inf')
-                    total_interest = float('inf')
-            else:
-                months_to_payoff = current_debt / total_debt_payment if total_debt_payment > 0 else float('inf')
-                total_interest = 0
-            
-            if months_to_payoff != float('inf'):
-                st.markdown(f"""
+
+            debt_names = [debt.name for debt in debts]
+            custom_names = st.multiselect(
+                "🎯 Your payoff order (first = gets extra money first)",
+                debt_names,
+                default=debt_names,
+                key=f"debt_order_{len(debts)}"
+            )
+            custom_order = tuple(debt_names.index(name) for name in custom_names)
+
+            debt_key = (tuple((d.name, d.balance, d.apr, d.minimum_payment) for d in debts),
+                        total_debt_payment, custom_order)
+            schedules = memoized(
+                ('debt_payoffs',) + debt_key,
+                lambda: simulate_payoffs(debts, total_debt_payment, custom_order=custom_order)
+            )
+
+            st.markdown("#### ⚖️ Strategy Showdown")
+            st.dataframe(
+                memoized(('debt_comparison',) + debt_key + display_key(), lambda: build_debt_comparison(schedules)),
+                use_container_width=True,
+                hide_index=True
+            )
+            fig_debt = memoized(('fig_debt',) + debt_key + display_key(), lambda: build_debt_figure(schedules))
+            st.plotly_chart(fig_debt, use_container_width=True)
+
+            # Debt payoff calculators
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown("#### 🔥 Avalanche Method (Recommended)")
+                avalanche, minimums_only = schedules['avalanche'], schedules['minimums']
+                months_to_payoff = avalanche.months if avalanche.paid_off else float('inf')
+
+                if months_to_payoff != float('inf'):
+                    render_html(f"""
                 <div class="goal-tracker">
                     <h4>⏰ Payoff Timeline</h4>
-                    <h2>{months_to_payoff:.1f} months</h2>
+                    <h2>{months_to_payoff} months</h2>
                     <p>Total Payment: {format_currency(total_debt_payment, 0)}/month</p>
                 </div>
-                """, unsafe_allow_html=True)
-                
-                st.markdown(f"""
+                """)
+
+                    if minimums_only.paid_off:
+                        interest_saved = f"Saves {format_currency(minimums_only.total_interest - avalanche.total_interest, 0)}"
+                    else:
+                        interest_saved = "Minimums alone never clear it!"
+                    render_html(f"""
                 <div class="survival-card">
                     <h4>💰 Total Interest Saved</h4>
                     <p>By paying {format_currency(total_debt_payment, 0)}/month instead of minimums:</p>
-                    <h3>Interest: {format_currency(total_interest, 0)}</h3>
-                    <p>vs paying minimums for years!</p>
+                    <h3>Interest: {format_currency(avalanche.total_interest, 0)}</h3>
+                    <p>{interest_saved} vs paying minimums ({minimums_only.months} months)</p>
                 </div>
-                """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("#### 🎯 Debt Freedom Goals")
-            
-            debt_free_date = datetime.now() + timedelta(days=months_to_payoff * 30) if months_to_payoff != float('inf') else None
-            
-            if debt_free_date:
-                st.markdown(f"""
+                """)
+                else:
+                    st.warning("⚠️ This payment doesn't outpace the interest. Add a bigger extra payment to get debt-free!")
+
+            with col2:
+                st.markdown("#### 🎯 Debt Freedom Goals")
+
+                debt_free_date = datetime.now() + timedelta(days=months_to_payoff * 30) if months_to_payoff != float('inf') else None
+
+                if debt_free_date:
+                    render_html(f"""
                 <div class="slay-card">
                     <h4>🎉 Debt Freedom Date</h4>
                     <h2>{debt_free_date.strftime('%B %Y')}</h2>
                     <p>Your financial independence day!</p>
                 </div>
-                """, unsafe_allow_html=True)
-            
-            # Monthly savings after debt payoff
-            future_monthly_boost = total_debt_payment
-            annual_boost = future_monthly_boost * 12
-            
-            st.markdown(f"""
+                """)
+
+                # Monthly savings after debt payoff
+                future_monthly_boost = total_debt_payment
+                annual_boost = future_monthly_boost * 12
+
+                render_html(f"""
             <div class="investment-card">
                 <h4>🚀 Post-Debt Monthly Boost</h4>
                 <h2>{format_currency(future_monthly_boost, 0)}</h2>
                 <p>Extra for investments/goals</p>
                 <small>Annual boost: {format_currency(annual_boost, 0)}</small>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+
+        # =============================================================================
+        # GOAL-BASED SAVINGS CALCULATOR
+        # =============================================================================
+
+        st.markdown("### 🎯 Goal-Based Savings Planner")
 
-    # =============================================================================
-    # GOAL-BASED SAVINGS CALCULATOR
-    # =============================================================================
-    
-    st.markdown("### 🎯 Goal-Based Savings Planner")
-    
-    # Pre-defined common goals
-    common_goals = {
-        "🏖️ Dream Vacation": 3000,
-        "🚗 Car Down Payment": 5000,  
-        "🏠 House Down Payment": 40000,
-        "💻 New Laptop/Setup": 2000,
-        "📚 Education/Certification": 5000,
-        "💍 Wedding Fund": 20000,
-        "🎂 Custom Goal": 0
-    }
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        selected_goal = st.selectbox("Choose Your Goal", list(common_goals.keys()))
-        if selected_goal == "🎂 Custom Goal":
-            goal_amount = st.number_input("Custom Goal Amount", min_value=100.0, value=5000.0, step=100.0)
-            goal_name = st.text_input("Goal Name", value="My Custom Goal")
-        else:
-            goal_amount = common_goals[selected_goal]
-            goal_name = selected_goal
-    
-    with col2:
-        goal_timeline = st.selectbox(
-            "Target Timeline",
-            ["3 months", "6 months", "1 year", "2 years", "3 years", "5 years"]
-        )
-        timeline_months = {"3 months": 3, "6 months": 6, "1 year": 12, "2 years": 24, "3 years": 36, "5 years": 60}
-        months = timeline_months[goal_timeline]
-    
-    with col3:
-        goal_priority = st.selectbox(
-            "Priority Level",
-            ["🔥 High Priority", "⚡ Medium Priority", "💫 Low Priority"]
-        )
-    
-    # Calculate required monthly savings
-    if goal_amount > 0 and months > 0:
-        required_monthly = goal_amount / months
-        available_for_goal = adjusted_savings * 0.3  # 30% of savings can go to goals
-        
         col1, col2, col3 = st.columns(3)
-        
+
         with col1:
-            st.markdown(f"""
+            selected_goal = st.selectbox("Choose Your Goal", list(COMMON_GOALS))
+            if selected_goal == "🎂 Custom Goal":
+                goal_amount = st.number_input("Custom Goal Amount", min_value=100.0, value=5000.0, step=100.0)
+                goal_name = st.text_input("Goal Name", value="My Custom Goal")
+            else:
+                goal_amount = COMMON_GOALS[selected_goal]
+                goal_name = selected_goal
+
+        with col2:
+            goal_timeline = st.selectbox(
+                "Target Timeline",
+                ["3 months", "6 months", "1 year", "2 years", "3 years", "5 years"]
+            )
+            timeline_months = {"3 months": 3, "6 months": 6, "1 year": 12, "2 years": 24, "3 years": 36, "5 years": 60}
+            months = timeline_months[goal_timeline]
+
+        with col3:
+            goal_priority = st.selectbox(
+                "Priority Level",
+                list(PRIORITIES.keys())
+            )
+
+        # Every saved goal shares this slice of the monthly savings budget
+        goal_share = st.slider("💰 Share of savings for goals", 0, 100, 30, 5, format="%d%%", key="goal_share")
+        portfolio = st.session_state.goal_portfolio
+        portfolio.set_budget(adjusted_savings * goal_share / 100)
+
+        # Calculate required monthly savings
+        if goal_amount > 0 and months > 0:
+            candidate = SavingsGoal(goal_name, goal_amount, deadline_in(months), PRIORITIES[goal_priority])
+            required_monthly = candidate.required_monthly(date.today())
+            # What this goal would get next to the goals already saved
+            preview = portfolio.preview(candidate)
+            available_for_goal = preview.allocated
+
+            col1, col2, col3 = st.columns(3)
+
+            with col1:
+                render_html(f"""
             <div class="goal-tracker">
                 <h4>🎯 {goal_name}</h4>
                 <h2>{format_currency(goal_amount, 0)}</h2>
                 <p>Target in {goal_timeline}</p>
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
+            """)
+
+            with col2:
+                render_html(f"""
             <div class="goal-tracker">
                 <h4>💰 Required Monthly</h4>
                 <h2>{format_currency(required_monthly, 0)}</h2>
                 <p>To reach your goal</p>
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            feasibility = "✅ Totally Doable!" if required_monthly <= available_for_goal else "⚠️ Needs Adjustment"
-            st.markdown(f"""
+            """)
+
+            with col3:
+                feasibility = "✅ Totally Doable!" if preview.feasible else "⚠️ Needs Adjustment"
+                render_html(f"""
             <div class="goal-tracker">
                 <h4>📊 Feasibility</h4>
                 <h2>{feasibility}</h2>
                 <p>Available: {format_currency(available_for_goal, 0)}</p>
             </div>
-            """, unsafe_allow_html=True)
-        
-        # Goal progress tracking
-        if required_monthly <= available_for_goal:
-            st.markdown(f"""
+            """)
+
+            # Goal progress tracking
+            if preview.feasible:
+                render_html(f"""
             <div class="success-card">
                 <h4>🎉 Goal Strategy Approved!</h4>
-                <p><strong>Monthly Allocation:</strong> {format_currency(required_monthly, 0)} from your {format_currency(adjusted_savings, 0)} savings budget</p>
-                <p><strong>Timeline:</strong> {goal_timeline} | <strong>Achievement Date:</strong> {(datetime.now() + timedelta(days=months*30)).strftime('%B %Y')}</p>
+                <p><strong>Monthly Allocation:</strong> {format_currency(required_monthly, 0)} from your {format_currency(portfolio.monthly_budget, 0)} goal budget</p>
+                <p><strong>Timeline:</strong> {goal_timeline} | <strong>Achievement Date:</strong> {candidate.deadline.strftime('%B %Y')}</p>
             </div>
-            """, unsafe_allow_html=True)
-        else:
-            # Alternative suggestions
-            realistic_timeline = goal_amount / available_for_goal
-            st.markdown(f"""
+            """)
+            else:
+                # Alternative suggestions
+                if available_for_goal > 0:
+                    extend_option = f"Extend timeline to {goal_amount / available_for_goal:.1f} months"
+                else:
+                    extend_option = "Free up budget first - higher-priority goals use all of it right now"
+                render_html(f"""
             <div class="warning-card">
                 <h4>💡 Alternative Suggestions</h4>
-                <p><strong>Option 1:</strong> Extend timeline to {realistic_timeline:.1f} months</p>
+                <p><strong>Option 1:</strong> {extend_option}</p>
                 <p><strong>Option 2:</strong> Reduce goal to {format_currency(available_for_goal * months, 0)}</p>
-                <p><strong>Option 3:</strong> Increase income or reduce other expenses</p>
+                <p><strong>Option 3:</strong> Increase income, reduce other expenses or lower another goal's priority</p>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+
+            if st.button("➕ Add to My Goals", key="add_goal"):
+                portfolio.add(candidate)
+                st.success(f"🎯 {goal_name} added to your goals!")
+
+        # All saved goals, funded by priority then deadline from the goal budget
+        if portfolio.goals:
+            st.markdown("#### 📋 My Goals")
+            allocations = portfolio.allocate()
+            priority_labels = {code: label for label, code in PRIORITIES.items()}
+            goal_rows = []
+            for goal in portfolio.funding_order():
+                allocation = allocations[goal.id]
+                finish_months = allocation.months_to_finish(goal.remaining)
+                goal_rows.append({
+                    "Goal": goal.name,
+                    "Priority": priority_labels.get(goal.priority, ""),
+                    "Deadline": goal.deadline.strftime('%b %Y'),
+                    "Remaining": format_currency(goal.remaining, 0),
+                    "Required / mo": format_currency(allocation.required, 0),
+                    "Allocated / mo": format_currency(allocation.allocated, 0),
+                    "Status": "✅ On track" if allocation.feasible else f"⚠️ Short {format_currency(allocation.shortfall, 0)}",
+                    "Done in": "—" if math.isinf(finish_months) else f"{finish_months:.1f} months",
+                })
+            st.dataframe(goal_rows, use_container_width=True, hide_index=True)
+            st.caption(f"Unallocated goal budget: {format_currency(portfolio.unallocated, 0)} / month")
+            if st.session_state.debug_mode:
+                st.caption(f"Goals recomputed by the last change: {portfolio.recomputed}")
+
+        # =============================================================================
+        # WEALTH BUILDING PROJECTIONS
+        # =============================================================================
+
+        st.markdown("### 🚀 Long-Term Wealth Building Projections")
+
+        # 10, 20, 30 year projections (the age milestones below read the same simulation)
+        years_projections = [10, 20, 30]
+        projection = None
+
+        if available_for_investment > 0:
+            allocation = (stock_percent, bond_percent, cash_percent)
+            projection = memoized(
+                ('wealth_projection', available_for_investment) + allocation,
+                lambda: simulate_wealth(available_for_investment, *allocation, years=max(years_projections))
+            )
+            st.markdown(
+                f"#### 📈 Investment Growth Projections "
+                f"({projection.annual_mean:.1%} expected return, {projection.annual_volatility:.1%} volatility)"
+            )
 
-    # =============================================================================
-    # WEALTH BUILDING PROJECTIONS
-    # =============================================================================
-    
-    st.markdown("### 🚀 Long-Term Wealth Building Projections")
-    
-    # 10, 20, 30 year projections
-    investment_return = 0.07  # 7% average annual return
-    years_projections = [10, 20, 30]
-    
-    if available_for_investment > 0:
-        st.markdown("#### 📈 Investment Growth Projections (7% Annual Return)")
-        
-        cols = st.columns(len(years_projections))
-        
-        for i, years in enumerate(years_projections):
-            # Future value calculation: FV = PMT * [((1+r)^n - 1) / r]
-            monthly_investment = available_for_investment
-            monthly_rate = investment_return / 12
-            months = years * 12
-            
-            future_value = monthly_investment * (((1 + monthly_rate) ** months - 1) / monthly_rate)
-            total_contributions = monthly_investment * months
-            investment_growth = future_value - total_contributions
-            
-            with cols[i]:
-                st.markdown(f"""
+            def build_projection_cards():
+                cards = []
+                for years in years_projections:
+                    months = years * 12
+                    median_value = projection.at(50, months)
+                    total_contributions = available_for_investment * months
+                    investment_growth = median_value - total_contributions
+
+                    cards.append(f"""
                 <div class="slay-card">
                     <h4>💰 {years} Year Projection</h4>
-                    <h2>{format_currency(future_value, 0)}</h2>
+                    <h2>{format_currency(median_value, 0)}</h2>
                     <div style="font-size: 0.8em; margin-top: 10px;">
+                        <p>Likely range: {format_currency(projection.at(10, months), 0)} – {format_currency(projection.at(90, months), 0)}</p>
                         <p>Contributions: {format_currency(total_contributions, 0)}</p>
                         <p>Growth: {format_currency(investment_growth, 0)}</p>
-                        <p>Monthly: {format_currency(monthly_investment, 0)}</p>
+                        <p>Monthly: {format_currency(available_for_investment, 0)}</p>
                     </div>
                 </div>
-                """, unsafe_allow_html=True)
-    
-    # Net worth milestones
-    st.markdown("#### 🎯 Net Worth Milestones by Age")
-    
-    user_age = 25  # Default, can be adjusted above
-    current_age = user_age
-    target_ages = [30, 35, 40]
-    
-    # Rule of thumb: net worth should be 1x annual income by 30, 3x by 40
-    milestone_multipliers = {30: 1, 35: 3, 40: 5}
-    
-    cols = st.columns(len(target_ages))
-    
-    for i, target_age in enumerate(target_ages):
-        years_to_age = target_age - current_age
-        target_multiplier = milestone_multipliers.get(target_age, target_age - 25)
-        target_net_worth = annual_income * target_multiplier
-        
-        # Calculate if current savings rate will achieve this
-        if years_to_age > 0 and adjusted_savings > 0:
-            projected_savings = current_savings_amount + (adjusted_savings * 12 * years_to_age)
-            # Assuming some investment growth
-            projected_investments = available_for_investment * 12 * years_to_age * (1 + investment_return) ** years_to_age if available_for_investment > 0 else 0
-            projected_net_worth = projected_savings + projected_investments
-            
-            achievement_status = "✅ On Track" if projected_net_worth >= target_net_worth else "⚠️ Need Boost"
-        else:
-            achievement_status = "🎯 Future Goal"
-            projected_net_worth = 0
-        
-        with cols[i]:
-            st.markdown(f"""
+                """)
+                return cards
+
+            projection_cards = memoized(
+                ('projections', available_for_investment) + allocation + display_key(),
+                build_projection_cards
+            )
+            for column, card in zip(st.columns(len(years_projections)), projection_cards):
+                with column:
+                    render_html(card)
+
+            fig_projection = memoized(
+                ('fig_projection', available_for_investment) + allocation + display_key(),
+                lambda: build_projection_figure(projection)
+            )
+            st.plotly_chart(fig_projection, use_container_width=True)
+            st.caption(
+                f"🎲 {DEFAULT_PATHS:,} simulated markets for your {stock_percent}/{bond_percent}/{cash_percent} split. "
+                "Cards show the median; the range is the 10th–90th percentile."
+            )
+
+        # Net worth milestones
+        st.markdown("#### 🎯 Net Worth Milestones by Age")
+
+        user_age = 25  # Default, can be adjusted above
+        current_age = user_age
+        target_ages = [30, 35, 40]
+
+        # Rule of thumb: net worth should be 1x annual income by 30, 3x by 40
+        milestone_multipliers = {30: 1, 35: 3, 40: 5}
+
+        cols = st.columns(len(target_ages))
+
+        for i, target_age in enumerate(target_ages):
+            years_to_age = target_age - current_age
+            target_multiplier = milestone_multipliers.get(target_age, target_age - 25)
+            target_net_worth = annual_income * target_multiplier
+
+            # Calculate if current savings rate will achieve this
+            if years_to_age > 0 and adjusted_savings > 0:
+                projected_savings = current_savings_amount + (adjusted_savings * 12 * years_to_age)
+                # Investments follow the median simulated market, like the projection cards above
+                projected_investments = projection.at(50, years_to_age * 12) if projection is not None else 0
+                projected_net_worth = projected_savings + projected_investments
+
+                achievement_status = "✅ On Track" if projected_net_worth >= target_net_worth else "⚠️ Need Boost"
+            else:
+                achievement_status = "🎯 Future Goal"
+                projected_net_worth = 0
+
+            with cols[i]:
+                render_html(f"""
             <div class="milestone-badge" style="display: block; margin: 10px 0; padding: 15px;">
                 <h4>Age {target_age} Goal</h4>
                 <h3>{format_currency(target_net_worth, 0)}</h3>
                 <p>{target_multiplier}x Annual Income</p>
+                <p>Projected: {format_currency(projected_net_worth, 0)}</p>
                 <small>{achievement_status}</small>
             </div>
-            """, unsafe_allow_html=True)
+            """)
 
-    # =============================================================================
-    # ACTIONABLE NEXT STEPS & RECOMMENDATIONS
-    # =============================================================================
-    
-    st.markdown("### ✅ Your Personalized Action Plan")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("#### 🚨 Immediate Actions (This Week)")
-        immediate_actions = []
-        
-        if current_savings_amount < 1000:
-            immediate_actions.append("🏦 Open high-yield savings account (Marcus, Ally, Capital One)")
-            immediate_actions.append("💰 Set up automatic transfer of $50-100/week to savings")
-        
-        if monthly_debt_payment > 0 and debt_payoff_extra > 0:
-            immediate_actions.append("📞 Call credit card companies to negotiate lower rates")
-            immediate_actions.append("💳 Set up automatic extra payments to highest interest debt")
-        
-        if available_for_investment > 100:
-            immediate_actions.append("📊 Open investment account (Fidelity, Vanguard, or Schwab)")
-            immediate_actions.append("🤖 Set up automatic investing in index funds")
-        
-        immediate_actions.append("📱 Download budgeting app (Mint, YNAB, or PocketGuard)")
-        immediate_actions.append("🔍 Review and cancel unused subscriptions")
-        
-        for action in immediate_actions[:5]:
-            st.markdown(f"• {action}")
-    
-    with col2:
-        st.markdown("#### 📅 30-Day Goals")
-        monthly_goals = []
-        
-        if emergency_progress < 100:
-            monthly_goals.append(f"🛡️ Save {format_currency(emergency_monthly_need, 0)} for emergency fund")
-        
-        monthly_goals.append(f"📊 Track all expenses and stay within {format_currency(wants_amount, 0)} fun budget")
-        monthly_goals.append(f"💰 Automate {format_currency(adjusted_savings, 0)} monthly savings")
-        
-        if current_debt > 0:
-            monthly_goals.append(f"💳 Pay {format_currency(total_debt_payment, 0)} toward debt elimination")
-        
-        monthly_goals.append("📚 Read one personal finance book or take online course")
-        monthly_goals.append("🎯 Set up goal tracking for your biggest financial priority")
-        
-        for goal in monthly_goals:
-            st.markdown(f"• {goal}")
+        # =============================================================================
+        # ACTIONABLE NEXT STEPS & RECOMMENDATIONS
+        # =============================================================================
+
+        st.markdown("### ✅ Your Personalized Action Plan")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("#### 🚨 Immediate Actions (This Week)")
+            immediate_actions = []
+
+            if current_savings_amount < 1000:
+                immediate_actions.append("🏦 Open high-yield savings account (Marcus, Ally, Capital One)")
+                immediate_actions.append("💰 Set up automatic transfer of $50-100/week to savings")
+
+            if monthly_debt_payment > 0 and debt_payoff_extra > 0:
+                immediate_actions.append("📞 Call credit card companies to negotiate lower rates")
+                immediate_actions.append("💳 Set up automatic extra payments to highest interest debt")
+
+            if available_for_investment > 100:
+                immediate_actions.append("📊 Open investment account (Fidelity, Vanguard, or Schwab)")
+                immediate_actions.append("🤖 Set up automatic investing in index funds")
+
+            immediate_actions.append("📱 Download budgeting app (Mint, YNAB, or PocketGuard)")
+            immediate_actions.append("🔍 Review and cancel unused subscriptions")
+
+            for action in immediate_actions[:5]:
+                st.markdown(f"• {action}")
+
+        with col2:
+            st.markdown("#### 📅 30-Day Goals")
+            monthly_goals = []
 
-# Quick Win Tips
-st.markdown("""
+            if emergency_progress < 100:
+                monthly_goals.append(f"🛡️ Save {format_currency(emergency_monthly_need, 0)} for emergency fund")
+
+            monthly_goals.append(f"📊 Track all expenses and stay within {format_currency(wants_amount, 0)} fun budget")
+            monthly_goals.append(f"💰 Automate {format_currency(adjusted_savings, 0)} monthly savings")
+
+            if current_debt > 0:
+                monthly_goals.append(f"💳 Pay {format_currency(total_debt_payment, 0)} toward debt elimination")
+
+            monthly_goals.append("📚 Read one personal finance book or take online course")
+            monthly_goals.append("🎯 Set up goal tracking for your biggest financial priority")
+
+            for goal in monthly_goals:
+                st.markdown(f"• {goal}")
+
+    # Quick Win Tips
+    render_html("""
 <div class="vibe-card">
     <h3>💡 Quick Wins for This Week</h3>
     <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin-top: 15px;">
@@ -2545,19 +2569,19 @@ st.markdown("""
         </div>
     </div>
 </div>
-""", unsafe_allow_html=True)
+""")
 
-# 🚨 MAIN ERROR: format_currency function is not defined
-# FIX: Replace format_currency with standard Python formatting
+    # 🚨 MAIN ERROR: format_currency function is not defined
+    # FIX: Replace format_currency with standard Python formatting
 
-# ❌ ORIGINAL (BROKEN):
-# Your {lifestyle_mode.split('(')[0]} approach with {format_currency(total_monthly_income, 0)} monthly income
+    # ❌ ORIGINAL (BROKEN):
+    # Your {lifestyle_mode.split('(')[0]} approach with {format_currency(total_monthly_income, 0)} monthly income
 
-# ✅ FIXED VERSION:
+    # ✅ FIXED VERSION:
 
 
-# Motivational closing - FIXED
-st.markdown(f"""
+    # Motivational closing - FIXED
+    render_html(f"""
 <div class="success-card">
     <h3>✨ You're Already Winning!</h3>
     <p>Just by using this calculator and thinking about your financial future, you're ahead of 70% of people your age. 
@@ -2565,13 +2589,16 @@ st.markdown(f"""
     serious wealth building. Remember: every dollar you save in your 20s becomes $10+ in your future. 
     You've got this! 🚀</p>
 </div>
-""", unsafe_allow_html=True)
+""")
+
+render_financial_planner()
+script_clock.restart()
 
 # =============================================================================
 # FOOTER SECTION
 # =============================================================================
 
-st.markdown("""
+render_html("""
 <div style="text-align:center; margin-top:60px; padding:40px 0; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 20px; color: white; box-shadow: 0 10px 30px rgba(0,0,0,0.2);">
   <h2 style="margin-bottom: 10px; background: linear-gradient(45deg, #FFD700, #FFA500); -webkit-background-clip: text; -webkit-text-fill-color: transparent; font-weight: 700;">💸 FinAura: Where Gen Z Vibes Meet Financial Freedom</h2>
   
@@ -2616,4 +2643,44 @@ st.markdown("""
     For DevPost Girlies Hackathon  - Innovation in FinTech
   </div>
 </div>
-""", unsafe_allow_html=True)
+""")
+
+script_clock.lap("footer")
+
+# =============================================================================
+# RERUN OUTPUT SIZE
+# =============================================================================
+
+# HTML/CSS bytes this full rerun pushed through st.markdown (the stylesheet only counts once per session)
+st.session_state.last_rerun_html_bytes = st.session_state.html_bytes_sent
+logger.info(f"Rerun sent {st.session_state.last_rerun_html_bytes:,} bytes of HTML/CSS")
+if st.session_state.debug_mode:
+    audit = get_audit_writer()
+    st.caption(f"🐛 Debug Mode: agent audit log – {audit.written:,} written, {audit.pending:,} queued, "
+               f"{audit.dropped:,} dropped, {audit.failed:,} failed")
+    st.caption(f"🐛 Debug Mode: this rerun sent {st.session_state.last_rerun_html_bytes:,} bytes of HTML/CSS")
+    usage = st.session_state.get('memory_usage')
+    if usage is not None:
+        st.caption(f"🐛 Debug Mode: session memory {usage.total_bytes / 2**20:,.1f} MB of "
+                   f"{usage.budget_bytes / 2**20:,.0f} MB budget (ledger {usage.ledger_bytes / 2**20:,.1f} MB, "
+                   f"emotion labels {usage.classifier_bytes / 2**20:,.1f} MB) – {usage.resident_rows:,} rows "
+                   f"in memory, {usage.spilled_rows:,} spilled to disk"
+                   + (" – hot window alone is over budget" if usage.over_budget else ""))
+
+# =============================================================================
+# RENDER TIMINGS PANEL
+# =============================================================================
+
+section_timings = get_section_timings()
+section_timings.record("full rerun", time.perf_counter() - rerun_started)
+
+# FINAURA_TIMINGS_PATH=/path/timings.json keeps a JSON snapshot (at most once a minute) for regression tracking
+if os.environ.get("FINAURA_TIMINGS_PATH"):
+    safe_execute(lambda: section_timings.maybe_export(os.environ["FINAURA_TIMINGS_PATH"]),
+                 error_message="Could not export render timings")
+
+if st.session_state.debug_mode:
+    with st.expander("⏱️ Debug Mode: render timings (this process, last 1,000 runs per section)"):
+        st.dataframe(section_timings.summary(), use_container_width=True, hide_index=True)
+        st.download_button("⬇️ Export timings (JSON)", section_timings.to_json(), "finaura_timings.json",
+                           mime="application/json")